@@ -0,0 +1,149 @@
+"""
+Categorias de base de todo o universo, semana a semana.
+
+Toda semana cada jogador da base cresce rumo ao potencial numa única
+passada sobre todas as bases (`develop`): o ganho esperado é uma fração
+da distância até o potencial, ajustada pela personalidade, pela moral e
+por estar emprestado (jogando), e os pontos vão primeiro para o foco de
+treino da base do clube naquele mês. Um único sorteio por jogador decide
+quantos pontos ele ganha.
+
+A cada `DECISION_WEEKS` semanas os clubes da IA decidem a base
+(`decide`): sobem quem já briga por vaga entre os titulares (ou quem cobre
+um elenco desfalcado) e emprestam quem está longe do time e ainda tem
+muito a crescer. A base do clube do treinador cresce do mesmo jeito, mas
+promoções e empréstimos ficam com ele (e com a virada de temporada).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List
+import random
+
+from .lineup import BENCH_SIZE, XI_SIZE, is_available, lineup_of
+
+if TYPE_CHECKING:
+    from .ids import Universe
+    from .models import Club, Player
+
+WEEKLY_RATE = 0.03     # fração da distância até o potencial por semana
+LOAN_BOOST = 1.5       # emprestado joga e cresce mais rápido
+DECISION_WEEKS = 4     # a IA revê a base uma vez por mês
+PROMOTE_AGE = 17       # idade mínima para subir durante a temporada
+MAX_SQUAD = 30         # elenco profissional máximo com promoções no meio da temporada
+LOAN_AGE = 17
+LOAN_GAP = 10          # só empresta quem ainda tem esse tanto a crescer
+LOAN_MARGIN = 8        # ... e está esse tanto abaixo do pior titular
+LOAN_WEEKS = 12
+MAX_LOANS = 3          # emprestados ao mesmo tempo por clube
+
+# ritmo de crescimento por personalidade (1 = normal)
+GROWTH = {"Treino exemplar": 1.4, "Promessa da base": 1.3, "Preguiçoso": 0.6,
+          "Indisciplinado": 0.8, "Some em jogo grande": 0.9}
+
+# foco do mês: posição de força, técnica e velocidade na fila dos pontos
+# da semana (o primeiro da fila recebe a sobra)
+ORDERS = ((0, 1, 2), (2, 0, 1), (1, 2, 0))
+
+@dataclass
+class AcademyReport:
+    grown: int = 0      # jogadores que ganharam algum ponto
+    promoted: int = 0
+    loaned: int = 0
+    returned: int = 0   # voltaram de empréstimo
+
+def focus_of(club: Club, week: int) -> tuple:
+    """Foco de treino da base no mês (gira entre os atributos, por clube)."""
+    return ORDERS[(club.id + week // DECISION_WEEKS) % len(ORDERS)]
+
+def develop(clubs: List[Club], week: int, rng, report: AcademyReport | None = None) -> AcademyReport:
+    """Uma semana de treino de todas as bases numa única passada."""
+    report = report or AcademyReport()
+    rand, growth = rng.random, GROWTH.get
+    home_rate = 3 * WEEKLY_RATE  # pontos de atributo = 3 * ganho de overall
+    loan_rate = home_rate * LOAN_BOOST
+    grown = returned = 0
+    for c in clubs:
+        rs, rt, rv = focus_of(c, week)
+        for p in c.youth:
+            if p.loan_weeks:
+                p.loan_weeks -= 1
+                if not p.loan_weeks:
+                    returned += 1
+                rate = loan_rate
+            elif p.injured:
+                continue
+            else:
+                rate = home_rate
+            s, t, v = p.strength, p.technique, p.speed
+            gap = p.potential - (s + t + v) / 3
+            if gap <= 0:
+                continue
+            points = int(gap * rate * growth(p.personality, 1.0) * (0.75 + p.morale / 200) + rand())
+            if not points:
+                continue
+            grown += 1
+            q, r = divmod(points, 3)  # a sobra vai para o foco do mês
+            s += q + (rs < r)
+            t += q + (rt < r)
+            v += q + (rv < r)
+            p.strength = s if s < 100 else 100
+            p.technique = t if t < 100 else 100
+            p.speed = v if v < 100 else 100
+    report.grown += grown
+    report.returned += returned
+    return report
+
+def _xi_floor(club: Club) -> int:
+    """Overall do pior titular (0 se nem há onze aptos)."""
+    xi = lineup_of(club).starters()
+    return min(p.overall() for p in xi) if len(xi) >= XI_SIZE else 0
+
+def promote(club: Club, p: Player):
+    """Sobe um jogador da base para o elenco profissional."""
+    club.youth = [q for q in club.youth if q is not p]
+    club.squad.append(p)
+    p.loan_weeks = 0
+    lineup_of(club).invalidate()
+
+def decide(club: Club, report: AcademyReport):
+    """Promoções e empréstimos da base de um clube da IA."""
+    floor = _xi_floor(club)
+    if len(club.squad) < MAX_SQUAD:
+        # elenco desfalcado: completa titulares e banco com os melhores da base
+        short = XI_SIZE + BENCH_SIZE - sum(1 for p in club.squad if is_available(p))
+        home = [p for p in club.youth if not p.loan_weeks
+                and (short > 0 or p.age >= PROMOTE_AGE and p.overall() >= floor > 0)]
+        home.sort(key=lambda p: p.overall(), reverse=True)
+        for p in home:
+            if len(club.squad) >= MAX_SQUAD:
+                break
+            if short > 0 or (p.age >= PROMOTE_AGE and p.overall() >= floor > 0):
+                promote(club, p)
+                report.promoted += 1
+                short -= 1
+    loans = sum(1 for p in club.youth if p.loan_weeks)
+    for p in club.youth:
+        if loans >= MAX_LOANS:
+            break
+        if (not p.loan_weeks and p.age >= LOAN_AGE and p.potential - p.overall() >= LOAN_GAP
+                and p.overall() < floor - LOAN_MARGIN):
+            p.loan_weeks = LOAN_WEEKS
+            loans += 1
+            report.loaned += 1
+
+def run_week(clubs: Universe, rng=None, user: int | None = None) -> AcademyReport:
+    """Semana das bases: treino de todas e, no fim do mês, as decisões da
+    IA (o clube `user`, do treinador, decide por conta própria)."""
+    rng = rng or random
+    week = clubs.calendar.week
+    report = develop(clubs, week, rng)
+    if week % DECISION_WEEKS == 0:
+        changed = []
+        for c in clubs:
+            if c.id != user:
+                before = report.promoted
+                decide(c, report)
+                if report.promoted != before:
+                    changed.append(c)
+        clubs.ledger.refresh(changed)  # folha dos promovidos
+    return report
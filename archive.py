@@ -0,0 +1,193 @@
+"""
+Arquivo binário de resultados (append-only, registros de tamanho fixo).
+
+Cada partida ocupa RECORD_SIZE bytes: temporada, semana, ids dos clubes,
+placar e até MAX_EVENTS lances codificados (minuto + lado/tipo). O
+arquivo é lido com `mmap` e as consultas percorrem visões (memoryview)
+sobre os campos, sem montar objetos para cada partida.
+
+Os ids de clube são `Club.id` (a posição do clube no `ids.Universe`).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+import mmap, os, struct
+
+from .sim import EVENTS, MatchResult
+
+MAGIC = b"FWAR"
+VERSION = 1
+HEADER = struct.Struct("<4sHH8x")          # 16 bytes
+MAX_EVENTS = 16
+RECORD = struct.Struct(f"<HHIIBBBx{MAX_EVENTS * 2}s")
+RECORD_SIZE = RECORD.size                  # 48 bytes = 12 uint32
+WORDS = RECORD_SIZE // 4
+AWAY_BIT = 0x80
+
+KIND_CODE = {k: i for i, k in enumerate(EVENTS)}
+
+@dataclass
+class ArchivedMatch:
+    season: int
+    week: int
+    home: int
+    away: int
+    goals_home: int
+    goals_away: int
+    events: List[Tuple[int, int, str]]  # (minuto, 0=casa/1=fora, tipo)
+
+def encode_events(result: MatchResult) -> bytes:
+    out = bytearray()
+    for ev in result.timeline[:MAX_EVENTS]:
+        side = AWAY_BIT if ev.club == result.away and ev.club != result.home else 0
+        out += bytes((ev.minute, side | KIND_CODE[ev.kind]))
+    return bytes(out)
+
+def _decode(rec: Tuple) -> ArchivedMatch:
+    season, week, home, away, gh, ga, n, raw = rec
+    events = [(raw[2 * i], raw[2 * i + 1] >> 7, EVENTS[raw[2 * i + 1] & 0x7F]) for i in range(n)]
+    return ArchivedMatch(season, week, home, away, gh, ga, events)
+
+def check_header(head: bytes, path: str):
+    """Levanta ValueError se o cabeçalho não é de um arquivo desta versão."""
+    if len(head) < HEADER.size:
+        raise ValueError(f"arquivo de resultados sem cabeçalho: {path}")
+    magic, version, rsize = HEADER.unpack_from(head, 0)
+    if magic != MAGIC:
+        raise ValueError(f"arquivo de resultados inválido: {path}")
+    if version != VERSION or rsize != RECORD_SIZE:
+        raise ValueError(f"arquivo de resultados de outra versão ({version}, registros de {rsize} bytes): {path}")
+
+class ArchiveWriter:
+    """Acrescenta partidas ao fim do arquivo (cria o cabeçalho se novo).
+
+    Um registro final incompleto (queda no meio da escrita) é cortado ao
+    abrir; sem isso, tudo o que viesse depois ficaria desalinhado."""
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.f = open(path, "r+b" if os.path.exists(path) else "w+b")
+        size = os.fstat(self.f.fileno()).st_size
+        head = self.f.read(HEADER.size)
+        fresh = HEADER.pack(MAGIC, VERSION, RECORD_SIZE)
+        if size < HEADER.size and fresh.startswith(head):
+            # vazio, ou a queda foi no próprio cabeçalho: recomeça
+            self.f.seek(0)
+            self.f.truncate()
+            self.f.write(fresh)
+        else:
+            try:
+                check_header(head, path)
+            except ValueError:
+                self.f.close()
+                raise
+            self.f.truncate(HEADER.size + (size - HEADER.size) // RECORD_SIZE * RECORD_SIZE)
+        self.f.seek(0, os.SEEK_END)
+
+    def append(self, season: int, week: int, home_id: int, away_id: int, result: MatchResult):
+        codes = encode_events(result)
+        self.f.write(RECORD.pack(season, week, home_id, away_id,
+                                 min(result.goals_home, 255), min(result.goals_away, 255),
+                                 len(codes) // 2, codes))
+
+    def flush(self):
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ArchiveReader:
+    """Consultas sobre o arquivo mapeado em memória (somente leitura)."""
+    def __init__(self, path: str):
+        self.f = open(path, "rb")
+        size = os.fstat(self.f.fileno()).st_size
+        self.mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        if self.mm is not None:
+            try:
+                check_header(self.mm[:HEADER.size], path)
+            except ValueError:
+                self.mm.close()
+                self.f.close()
+                raise
+        # registros completos (ignora um final truncado por queda no meio da escrita)
+        self.count = max(0, (size - HEADER.size) // RECORD_SIZE) if size else 0
+        body = memoryview(self.mm)[HEADER.size:HEADER.size + self.count * RECORD_SIZE] if self.mm else memoryview(b"")
+        self.body = body
+        self._words = words = body.cast("I")
+        # visões estriadas sobre cada campo (sem cópia)
+        self._when = words[0::WORDS]      # temporada | semana << 16
+        self._home = words[1::WORDS]
+        self._away = words[2::WORDS]
+        self._score = words[3::WORDS]     # gols casa | gols fora << 8 | n << 16
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self):
+        for view in (self._when, self._home, self._away, self._score, self._words, self.body):
+            view.release()
+        if self.mm is not None:
+            self.mm.close()
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(self, i: int) -> ArchivedMatch:
+        return _decode(RECORD.unpack_from(self.body, i * RECORD_SIZE))
+
+    def __iter__(self) -> Iterator[ArchivedMatch]:
+        for rec in RECORD.iter_unpack(self.body):
+            yield _decode(rec)
+
+    def club_history(self, club_id: int, season: int | None = None) -> List[ArchivedMatch]:
+        hits = [i for i, (h, a) in enumerate(zip(self._home, self._away)) if h == club_id or a == club_id]
+        if season is not None:
+            hits = [i for i in hits if self._when[i] & 0xFFFF == season]
+        return [self.record(i) for i in hits]
+
+    def head_to_head(self, a: int, b: int) -> Dict[str, int]:
+        """Retrospecto de `a` contra `b` (em qualquer mando)."""
+        out = {"played": 0, "wins": 0, "draws": 0, "losses": 0, "goals_for": 0, "goals_against": 0}
+        for h, w, sc in zip(self._home, self._away, self._score):
+            if (h, w) == (a, b):
+                gf, ga = sc & 0xFF, (sc >> 8) & 0xFF
+            elif (h, w) == (b, a):
+                ga, gf = sc & 0xFF, (sc >> 8) & 0xFF
+            else:
+                continue
+            out["played"] += 1
+            out["goals_for"] += gf
+            out["goals_against"] += ga
+            out["wins" if gf > ga else "draws" if gf == ga else "losses"] += 1
+        return out
+
+    def season_summary(self, season: int) -> Dict[str, float]:
+        """Agregados de uma temporada: jogos, gols, mandante/empate/visitante."""
+        games = goals = home_wins = draws = away_wins = 0
+        for when, sc in zip(self._when, self._score):
+            if when & 0xFFFF != season:
+                continue
+            gh, ga = sc & 0xFF, (sc >> 8) & 0xFF
+            games += 1
+            goals += gh + ga
+            if gh > ga:
+                home_wins += 1
+            elif gh == ga:
+                draws += 1
+            else:
+                away_wins += 1
+        return {"games": games, "goals": goals, "goals_per_game": goals / games if games else 0.0,
+                "home_wins": home_wins, "draws": draws, "away_wins": away_wins}
+
+    def seasons(self) -> List[int]:
+        return sorted({when & 0xFFFF for when in self._when})
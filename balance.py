@@ -0,0 +1,236 @@
+"""
+Varredura de parâmetros para balancear o motor de jogo.
+
+Cada ponto da grade (produto dos valores de `--set`) joga `--seeds`
+universos, cada um por `--seasons` temporadas completas (estaduais, fases
+finais e copa nacional), em processos separados. Cada processo ajusta as
+constantes do motor (`apply`) só para si e devolve um `Tally`: contagens
+fixas por lote, sem guardar partidas, então a memória não cresce com o
+número de jogos. O relatório mostra, por métrica, a média, a faixa
+p10–p90 entre os lotes e se ela cai na faixa-alvo (`BANDS`).
+
+    python -m football_world.balance --set home_advantage=30,60,90 --seeds 16 --seasons 4
+    python -m football_world.balance --live --set min_goal_mean=0.3,0.4,0.5
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Dict, List, Tuple
+import argparse, os, random, time
+
+from . import ratings, sim, status
+from .ratings import ELO
+from .sampling import AliasTable
+from .status import StatusCalendar
+
+# parâmetros ajustáveis e o valor atual de cada um
+DEFAULTS: Dict[str, float] = {
+    "home_advantage": ELO.home_advantage,     # pontos de rating do mando (ratings)
+    "k": ELO.k,                               # fator K do Elo
+    "base_goals": ratings.BASE_GOALS,         # média de gols de cada lado no confronto equilibrado
+    "goals_per_400": ratings.GOALS_PER_400,   # quanto a diferença de rating mexe nos gols
+    "min_goal_mean": sim.MIN_GOAL_MEAN,       # piso da média de gols no jogo ao vivo sem rating
+    "events_per_match": sim.OTHER_EVENTS_PER_MATCH,
+    "red_weight": sim.OTHER_EVENT_WEIGHTS["Cartão vermelho"],
+    "injury_weight": sim.OTHER_EVENT_WEIGHTS["Lesão grave"],
+}
+
+# faixas-alvo (mínimo, máximo) de cada métrica
+BANDS: Dict[str, Tuple[float, float]] = {
+    "gols/jogo": (2.3, 2.9),
+    "empates": (0.22, 0.30),
+    "mandante": (0.10, 0.22),   # vitórias do mandante menos vitórias do visitante, por jogo
+    "vermelhos/jogo": (0.10, 0.30),
+    "lesões/jogo": (0.10, 0.35),
+    "títulos": (0.25, 0.55),    # fatia de títulos estaduais do maior campeão de cada estado
+}
+MAX_SCORE = 8  # histograma de gols por jogo: 0..7 e "8 ou mais"
+
+def apply(params: Dict[str, float]):
+    """Ajusta as constantes do motor neste processo (o que faltar volta ao padrão)."""
+    unknown = set(params) - set(DEFAULTS)
+    if unknown:
+        raise KeyError(f"parâmetro desconhecido: {', '.join(sorted(unknown))}")
+    p = {**DEFAULTS, **params}
+    ELO.home_advantage, ELO.k = p["home_advantage"], p["k"]
+    ratings.BASE_GOALS, ratings.GOALS_PER_400 = p["base_goals"], p["goals_per_400"]
+    ELO._table = None  # a tabela de previsões depende das médias
+    sim.MIN_GOAL_MEAN = p["min_goal_mean"]
+    sim.OTHER_EVENTS_PER_MATCH = status.OTHER_EVENTS_PER_MATCH = p["events_per_match"]
+    weights = sim.OTHER_EVENT_WEIGHTS
+    weights["Cartão vermelho"], weights["Lesão grave"] = p["red_weight"], p["injury_weight"]
+    sim.OTHER_EVENTS = AliasTable(list(weights), list(weights.values()))
+    status.INJURY_RATE = status._per_side("Lesão grave")
+    status.RED_CARD_RATE = status._per_side("Cartão vermelho")
+
+@dataclass
+class Tally:
+    """Contagens de um lote. Serve de `stats` do `MatchEngine` (on_result)."""
+    games: int = 0
+    goals: int = 0
+    draws: int = 0
+    home_wins: int = 0
+    away_wins: int = 0
+    reds: int = 0
+    injuries: int = 0
+    scores: List[int] = field(default_factory=lambda: [0] * (MAX_SCORE + 1))
+    titles: Dict[str, Dict[str, int]] = field(default_factory=dict)  # UF -> campeão -> títulos
+
+    def on_result(self, home, away, goals_home: int, goals_away: int):
+        self.games += 1
+        total = goals_home + goals_away
+        self.goals += total
+        self.scores[min(MAX_SCORE, total)] += 1
+        if goals_home > goals_away:
+            self.home_wins += 1
+        elif goals_home < goals_away:
+            self.away_wins += 1
+        else:
+            self.draws += 1
+
+    def on_event(self, club, player, kind: str):
+        pass  # expulsões e lesões são contadas pelo calendário (jogos ao vivo e de fundo)
+
+    def champions(self, champions: Dict[str, str]):
+        for abbr, name in champions.items():
+            won = self.titles.setdefault(abbr, {})
+            won[name] = won.get(name, 0) + 1
+
+    def metrics(self) -> Dict[str, float]:
+        n = max(1, self.games)
+        tops = [max(won.values()) / sum(won.values()) for won in self.titles.values()]
+        return {"gols/jogo": self.goals / n, "empates": self.draws / n,
+                "mandante": (self.home_wins - self.away_wins) / n,
+                "vermelhos/jogo": self.reds / n, "lesões/jogo": self.injuries / n,
+                "títulos": sum(tops) / len(tops) if tops else 0.0}
+
+class _CountingCalendar(StatusCalendar):
+    """Calendário que conta expulsões e lesões graves no `Tally`."""
+    def __init__(self, universe, tally: Tally):
+        super().__init__(universe, universe.calendar.week)
+        self.tally = tally
+
+    def injure(self, club, p, rng=None, weeks=None) -> int:
+        self.tally.injuries += 1
+        return super().injure(club, p, rng, weeks)
+
+    def suspend(self, club, p, games: int = 1):
+        self.tally.reds += 1
+        super().suspend(club, p, games)
+
+def run_batch(params: Dict[str, float], seed: int, seasons: int, clubs_per_state: int = 6,
+              live: bool = False) -> Tally:
+    """Um lote: `seasons` temporadas do universo `seed` com `params`.
+    Com `live`, todos os jogos vão pelo motor minuto a minuto sem rating."""
+    from .cups import national_cup
+    from .season import build_state_leagues, end_of_season, simulate_season
+    from .snapshots import load_universe
+    apply(params)
+    clubs = load_universe(seed, clubs_per_state)
+    tally = Tally()
+    clubs.calendar = _CountingCalendar(clubs, tally)
+    engine = sim.MatchEngine(random.Random(seed), stats=tally, ratings=None if live else ELO,
+                             calendar=clubs.calendar)
+    meta = {"seed": seed, "season": 1}
+    for _ in range(seasons):
+        leagues = build_state_leagues(clubs, meta["season"], seed)
+        cups = [national_cup(clubs, start_week=1, seed=seed * 1000 + meta["season"], ratings=ELO)]
+        simulate_season(clubs, leagues, engine, None, meta["season"], cups, finals=True, seed=seed)
+        tally.champions(end_of_season(clubs, meta, cups=cups).champions)
+    return tally
+
+def grid(sets: List[str]) -> List[Dict[str, float]]:
+    """`["k=10,20", "base_goals=1.1"]` -> produto cartesiano dos valores."""
+    axes = []
+    for item in sets:
+        name, _, values = item.partition("=")
+        if name not in DEFAULTS or not values:
+            raise ValueError(f"use nome=v1,v2,... com nome em: {', '.join(DEFAULTS)}")
+        axes.append([(name, float(v)) for v in values.split(",")])
+    return [dict(point) for point in product(*axes)]
+
+def _pct(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+@dataclass
+class PointReport:
+    params: Dict[str, float]
+    batches: List[Tally]
+
+    @property
+    def games(self) -> int:
+        return sum(t.games for t in self.batches)
+
+    def summary(self) -> Dict[str, Tuple[float, float, float]]:
+        """Métrica -> (média ponderada pelos jogos, p10, p90 entre lotes)."""
+        per_batch = [t.metrics() for t in self.batches]
+        total = Tally()
+        for t in self.batches:
+            for name in ("games", "goals", "draws", "home_wins", "away_wins", "reds", "injuries"):
+                setattr(total, name, getattr(total, name) + getattr(t, name))
+        pooled = total.metrics()
+        pooled["títulos"] = sum(m["títulos"] for m in per_batch) / len(per_batch)
+        return {k: (pooled[k], _pct([m[k] for m in per_batch], 0.1), _pct([m[k] for m in per_batch], 0.9))
+                for k in BANDS}
+
+    def misses(self) -> float:
+        """Distância total (relativa à largura da faixa) das médias fora do alvo."""
+        out = 0.0
+        for k, (mean, _, _) in self.summary().items():
+            lo, hi = BANDS[k]
+            out += max(0.0, lo - mean, mean - hi) / (hi - lo)
+        return out
+
+    def score_histogram(self) -> List[float]:
+        counts = [sum(t.scores[i] for t in self.batches) for i in range(MAX_SCORE + 1)]
+        return [c / max(1, self.games) for c in counts]
+
+def sweep(points: List[Dict[str, float]], seeds: int, seasons: int, clubs_per_state: int = 6,
+          live: bool = False, workers: int | None = None) -> List[PointReport]:
+    """Joga todos os lotes (ponto x seed) em paralelo."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [[pool.submit(run_batch, p, seed, seasons, clubs_per_state, live)
+                    for seed in range(1, seeds + 1)] for p in points]
+        return [PointReport(p, [f.result() for f in fs]) for p, fs in zip(points, futures)]
+
+def _label(params: Dict[str, float]) -> str:
+    return " ".join(f"{k}={v:g}" for k, v in params.items()) or "padrão"
+
+def print_report(reports: List[PointReport]):
+    for r in reports:
+        print(f"\n{_label(r.params)}  ({r.games:,} jogos em {len(r.batches)} lotes)")
+        for k, (mean, p10, p90) in r.summary().items():
+            lo, hi = BANDS[k]
+            mark = "ok" if lo <= mean <= hi else "FORA"
+            print(f"  {k:15s} {mean:6.3f}  p10–p90 {p10:6.3f}–{p90:6.3f}  alvo {lo:g}–{hi:g}  {mark}")
+        hist = " ".join(f"{i}{'+' if i == MAX_SCORE else ''}:{x:.0%}" for i, x in enumerate(r.score_histogram()))
+        print(f"  gols por jogo   {hist}")
+    best = sorted(reports, key=PointReport.misses)
+    print("\nMais perto dos alvos:")
+    for r in best[:5]:
+        print(f"  {r.misses():6.3f}  {_label(r.params)}")
+
+def main(argv: List[str] | None = None):
+    ap = argparse.ArgumentParser(description="Varredura de parâmetros do motor de jogo")
+    ap.add_argument("--set", action="append", default=[], metavar="NOME=V1,V2",
+                    help=f"valores de um parâmetro ({', '.join(DEFAULTS)})")
+    ap.add_argument("--seeds", type=int, default=8, help="universos (lotes) por ponto")
+    ap.add_argument("--seasons", type=int, default=3, help="temporadas por lote")
+    ap.add_argument("--clubs", type=int, default=6, help="clubes por estado")
+    ap.add_argument("--live", action="store_true", help="todos os jogos minuto a minuto, sem rating")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+    points = grid(args.set)
+    workers = args.workers or os.cpu_count()
+    print(f"{len(points)} ponto(s) x {args.seeds} lotes x {args.seasons} temporadas em {workers} processos")
+    t0 = time.perf_counter()
+    reports = sweep(points, args.seeds, args.seasons, args.clubs, args.live, workers)
+    dt = time.perf_counter() - t0
+    print_report(reports)
+    games = sum(r.games for r in reports)
+    print(f"\n{games:,} jogos em {dt:.1f}s ({games / dt:,.0f} jogos/s)")
+
+if __name__ == "__main__":
+    main()
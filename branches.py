@@ -0,0 +1,230 @@
+"""
+Fotografias do mundo para desfazer semanas e testar "e se...".
+
+`freeze` congela universo, meta e estadual em tuplas imutáveis: uma linha
+por clube e uma por jogador (na ordem de `snapshots.FIELDS`). Congelar a
+partir de uma fotografia anterior (`base`) reaproveita as linhas que não
+mudaram e o calendário de jogos do estadual: só o que mudou ocupa memória
+nova. Quanto se divide depende da semana; o treino da IA e a base mexem
+em muitos jogadores, e depois de uma rodada sobram perto de 40% das
+linhas em comum (veja `main`).
+
+Fotografias nunca são alteradas: abrir um ramo (`Branch`) é O(1) e cada
+ramo só monta os próprios objetos (`thaw`) quando é usado, sem pisar em
+outros ramos. `History` guarda as últimas semanas para desfazer e
+`simulate_branches` joga vários ramos em paralelo (processos).
+
+    python -m football_world.branches   # contratar x não contratar
+"""
+from __future__ import annotations
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass
+from typing import Any, Callable, Deque, Dict, List, Sequence, Tuple
+import time
+
+from .models import Club, Player
+from .leagues import StateLeague
+from .ids import Universe
+from .snapshots import FIELDS
+
+# campos de `Club` além dos elencos, na ordem da linha congelada
+CLUB_FIELDS = ("name", "state_abbr", "state_name", "budget", "points", "goals_for", "goals_against",
+               "wins", "draws", "losses", "elo")
+
+@dataclass(frozen=True)
+class Snapshot:
+    clubs: Tuple[tuple, ...]  # (campos do clube, linhas do elenco, linhas da base)
+    next_player_id: int
+    week: int                 # semana do calendário de desfalques
+    ledger: tuple             # (semanas, histórico em bytes, totais da temporada, taxas, bilheteria)
+    league: tuple | None      # (estado, seed, semana atual, confrontos)
+    meta: Tuple[Tuple[str, Any], ...]
+
+def _rows(players: List[Player], old: Dict[int, tuple]) -> Tuple[tuple, ...]:
+    rows = []
+    for p in players:
+        row = tuple(getattr(p, f) for f in FIELDS)
+        prev = old.get(p.id)
+        rows.append(prev if prev == row else row)
+    return tuple(rows)
+
+def _freeze_club(c: Club, prev: tuple | None) -> tuple:
+    fields = tuple(getattr(c, f) for f in CLUB_FIELDS)
+    old = {}
+    if prev is not None:
+        old = {row[-1]: row for row in prev[1] + prev[2]}  # `id` é o último campo
+        if prev[0] == fields:
+            fields = prev[0]
+    squad, youth = _rows(c.squad, old), _rows(c.youth, old)
+    if prev is not None and squad == prev[1]:
+        squad = prev[1]
+    if prev is not None and youth == prev[2]:
+        youth = prev[2]
+    row = (fields, squad, youth)
+    return prev if prev is not None and prev[0] is fields and prev[1] is squad and prev[2] is youth else row
+
+def freeze(clubs: Universe, meta: Dict[str, Any], league: StateLeague | None = None,
+           base: Snapshot | None = None) -> Snapshot:
+    """Fotografia do mundo; com `base`, divide com ela o que não mudou."""
+    prev = base.clubs if base is not None and len(base.clubs) == len(clubs) else None
+    rows = tuple(_freeze_club(c, prev[i] if prev else None) for i, c in enumerate(clubs))
+    frozen_league = None
+    if league is not None:
+        fixtures = None
+        if base is not None and base.league is not None and base.league[:2] == (league.state_abbr, league.seed):
+            fixtures = base.league[3]  # o calendário de jogos não muda
+        if fixtures is None:
+            fixtures = tuple(astuple(f) for f in league.fixtures)
+        frozen_league = (league.state_abbr, league.seed, league.current_week, fixtures)
+    ld = clubs.ledger
+    ld._fold()
+    ledger = (ld.weeks, ld.history.tobytes(), tuple((k, tuple(v)) for k, v in ld.season.items()),
+              tuple((k, tuple(v)) for k, v in ld.rates.items()), tuple(ld.gate))
+    return Snapshot(rows, len(clubs.players), clubs.calendar.week, ledger, frozen_league,
+                    tuple(meta.items()))
+
+def _thaw_player(row: tuple) -> Player:
+    return Player(*row)
+
+def thaw(snap: Snapshot) -> Tuple[Universe, Dict[str, Any], StateLeague | None]:
+    """Objetos novos (e só deste chamador) a partir da fotografia."""
+    clubs = []
+    for fields, squad, youth in snap.clubs:
+        c = Club(*fields[:4], [_thaw_player(r) for r in squad], [_thaw_player(r) for r in youth])
+        for name, value in zip(CLUB_FIELDS[4:], fields[4:]):
+            setattr(c, name, value)
+        clubs.append(c)
+    universe = Universe(clubs, snap.next_player_id, snap.week)
+    weeks, history, season, rates, gate = snap.ledger
+    ld = universe.ledger
+    ld.weeks = weeks
+    ld.history = array("i")
+    ld.history.frombytes(history)
+    ld.season = {k: array("q", v) for k, v in season}
+    # as taxas da fotografia, não as recalculadas dos elencos pelo `Universe`
+    ld.rates = {k: array("q", v) for k, v in rates}
+    ld.gate = array("q", gate)
+    league = None
+    if snap.league is not None:
+        abbr, seed, current, fixtures = snap.league
+        league = StateLeague.deserialize({"state_abbr": abbr, "seed": seed, "current_week": current,
+                                          "fixtures": [dict(zip(("week", "home", "away"), f)) for f in fixtures]},
+                                         universe)
+    return universe, dict(snap.meta), league
+
+def shared(a: Snapshot, b: Snapshot) -> float:
+    """Fração das linhas de jogador de `b` que são as mesmas de `a`."""
+    mine = {id(r) for fields, squad, youth in a.clubs for r in squad + youth}
+    rows = [r for fields, squad, youth in b.clubs for r in squad + youth]
+    return sum(id(r) in mine for r in rows) / max(1, len(rows))
+
+class Branch:
+    """Linha do tempo a partir de uma fotografia.
+
+    Criar é O(1): nada é copiado até o primeiro acesso a `world`, que
+    monta objetos próprios do ramo. `commit` fotografa o ramo dividindo
+    com a fotografia de origem o que não mudou.
+    """
+    def __init__(self, snapshot: Snapshot):
+        self.base = snapshot
+        self._world: Tuple[Universe, Dict[str, Any], StateLeague | None] | None = None
+
+    @property
+    def world(self) -> Tuple[Universe, Dict[str, Any], StateLeague | None]:
+        if self._world is None:
+            self._world = thaw(self.base)
+        return self._world
+
+    def branch(self) -> Branch:
+        return Branch(self.commit() if self._world is not None else self.base)
+
+    def commit(self) -> Snapshot:
+        if self._world is None:
+            return self.base
+        clubs, meta, league = self._world
+        return freeze(clubs, meta, league, base=self.base)
+
+class History:
+    """Últimas fotografias da carreira, para desfazer semanas."""
+    def __init__(self, depth: int = 10):
+        self.snapshots: Deque[Snapshot] = deque(maxlen=depth)
+
+    def checkpoint(self, clubs: Universe, meta: Dict[str, Any], league: StateLeague | None = None) -> Snapshot:
+        snap = freeze(clubs, meta, league, base=self.snapshots[-1] if self.snapshots else None)
+        self.snapshots.append(snap)
+        return snap
+
+    def undo(self) -> Tuple[Universe, Dict[str, Any], StateLeague | None]:
+        """Volta à fotografia anterior à última (descartando a última)."""
+        if len(self.snapshots) < 2:
+            raise IndexError("nada para desfazer")
+        self.snapshots.pop()
+        return thaw(self.snapshots[-1])
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+# --- ramos em paralelo ---
+
+Plan = Callable[[Universe, Dict[str, Any], StateLeague], Any]
+
+def play_weeks(clubs: Universe, meta: Dict[str, Any], league: StateLeague, weeks: int):
+    """Joga `weeks` rodadas do estadual sem interface nem gravação."""
+    from .season import play_week
+    for _ in range(weeks):
+        if league.is_finished():
+            break
+        play_week(clubs, meta, league, save_path=None)
+
+def _run_branch(snap: Snapshot, plan: Plan | None, weeks: int) -> Snapshot:
+    branch = Branch(snap)
+    clubs, meta, league = branch.world
+    if plan is not None:
+        plan(clubs, meta, league)
+    play_weeks(clubs, meta, league, weeks)
+    return branch.commit()
+
+def simulate_branches(snap: Snapshot, plans: Sequence[Plan | None], weeks: int,
+                      workers: int | None = None) -> List[Snapshot]:
+    """Aplica cada plano num ramo próprio e joga `weeks` semanas; os ramos
+    rodam em processos separados (planos precisam ser funções de módulo)."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_branch, snap, plan, weeks) for plan in plans]
+        return [f.result() for f in futures]
+
+def sign_best(clubs: Universe, meta: Dict[str, Any], league: StateLeague):
+    """Plano de exemplo: contrata o melhor jogador que o orçamento paga."""
+    from .transfers import asking_price, listed, transfer
+    mine = clubs[meta["team_id"]]
+    options = [(p.overall(), c.id, p.id) for c, p in listed(clubs, mine) if asking_price(p) <= mine.budget]
+    if options:
+        _, cid, pid = max(options)
+        transfer(clubs.player(pid), clubs[cid], mine)
+        clubs.ledger.refresh((clubs[cid], mine))
+
+def main():
+    from .cli import start_career
+    from .data import generate_universe
+    from .season import standings
+    universe = generate_universe(1)
+    team = next(c for c in universe if c.state_abbr == "SP")
+    clubs, meta, league = start_career(universe, "Bench", team, 1)
+    t0 = time.perf_counter()
+    snap = freeze(clubs, meta, league)
+    t1 = time.perf_counter()
+    a = Branch(snap)
+    t2 = time.perf_counter()
+    print(f"fotografia {1000 * (t1 - t0):.1f} ms, abrir um ramo {1e6 * (t2 - t1):.0f} µs")
+    play_weeks(*a.world, 1)
+    print(f"uma semana depois, {shared(snap, a.commit()):.0%} das linhas seguem divididas com a origem")
+    results = simulate_branches(snap, [None, sign_best], weeks=league.total_weeks)
+    for label, out in zip(("sem contratar", "contratando"), results):
+        c2, m2, _ = thaw(out)
+        mine = c2[m2["team_id"]]
+        pos = [c.id for c in standings(c2, mine.state_abbr)].index(mine.id) + 1
+        print(f"{label:14s} {pos}º lugar, {mine.points} pts, orçamento R$ {mine.budget:,}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Set
+import threading
+
+from .models import Club
+from .leagues import StateLeague
+from .persistence import club_to_dict, encode_chunk, read_save, universe_from_save, write_save
+from .ids import NameTable, as_universe
+
+@dataclass
+class CachedCareer:
+    """Universo carregado de um save, com o controle do que mudou."""
+    path: str
+    clubs: List[Club]
+    meta: Dict[str, Any]
+    league: StateLeague | None
+    # clubes serializados e comprimidos (`encode_chunk`) na última
+    # gravação/leitura, por id(clube) (nomes de clubes podem se repetir)
+    docs: Dict[int, bytes] = field(default_factory=dict, repr=False)
+    dirty_clubs: Set[int] = field(default_factory=set)
+    dirty_meta: bool = False
+    # tabela de nomes do save; só cresce, então documentos antigos seguem válidos
+    names: NameTable = field(default_factory=NameTable, repr=False)
+
+    @property
+    def dirty(self) -> bool:
+        return self.dirty_meta or bool(self.dirty_clubs)
+
+    def mark_dirty(self, clubs: Iterable[Club] | None = None):
+        """Marca clubes alterados; sem argumento, marca meta/liga."""
+        if clubs is None:
+            self.dirty_meta = True
+        else:
+            self.dirty_clubs.update(id(c) for c in clubs)
+
+    def replace(self, clubs: List[Club], meta: Dict[str, Any], league: StateLeague | None):
+        """Troca o universo inteiro (ex.: devolvido por outro processo)."""
+        self.clubs, self.meta, self.league = clubs, meta, league
+        self.dirty_meta = True
+        self.dirty_clubs = {id(c) for c in clubs}
+
+class CareerCache:
+    """Universos carregados por caminho de save, com despejo LRU.
+
+    `open` só paga `load_game` na primeira vez; as gravações acontecem no
+    despejo ou em `save`/`flush` e apenas se algo foi marcado como sujo.
+    Só os clubes sujos são re-serializados e recomprimidos; os demais
+    reaproveitam o bloco da última leitura/gravação. `pinned(entry)` impede o
+    despejo de carreiras em uso.
+    """
+    def __init__(self, max_entries: int = 8, pinned: Callable[[CachedCareer], bool] | None = None):
+        self.max_entries = max_entries
+        self.pinned = pinned or (lambda entry: False)
+        self.entries: "OrderedDict[str, CachedCareer]" = OrderedDict()
+        self.hits = self.misses = self.writes = 0
+        self._lock = threading.RLock()
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def open(self, path: str) -> CachedCareer:
+        with self._lock:
+            entry = self.entries.get(path)
+            if entry is not None:
+                self.entries.move_to_end(path)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            data = read_save(path)
+            clubs, meta, league = universe_from_save(data)
+            entry = CachedCareer(path, clubs, meta, league,
+                                 docs={id(c): d for c, d in zip(clubs, data.get("chunks", ()))},
+                                 names=NameTable(data.get("names", ())))
+            if not data.get("chunks"):
+                entry.replace(clubs, meta, league)  # save antigo: reescreve no formato atual
+            self._insert(entry)
+            return entry
+
+    def add(self, path: str, clubs: List[Club], meta: Dict[str, Any], league: StateLeague | None) -> CachedCareer:
+        """Registra uma carreira nova (ainda não gravada)."""
+        with self._lock:
+            entry = CachedCareer(path, clubs, meta, league)
+            entry.replace(clubs, meta, league)
+            self._insert(entry)
+            return entry
+
+    def save(self, path: str) -> bool:
+        with self._lock:
+            entry = self.entries.get(path)
+            return self._write(entry) if entry is not None else False
+
+    def flush(self) -> int:
+        with self._lock:
+            return sum(self._write(e) for e in list(self.entries.values()))
+
+    def evict(self, path: str) -> bool:
+        with self._lock:
+            entry = self.entries.pop(path, None)
+            if entry is None:
+                return False
+            self._write(entry)
+            return True
+
+    def _insert(self, entry: CachedCareer):
+        self.entries[entry.path] = entry
+        self.entries.move_to_end(entry.path)
+        for path in list(self.entries):
+            if len(self.entries) <= self.max_entries:
+                break
+            victim = self.entries[path]
+            if victim is entry or self.pinned(victim):
+                continue
+            del self.entries[path]
+            self._write(victim)
+
+    def _write(self, entry: CachedCareer) -> bool:
+        if not entry.dirty:
+            return False
+        docs = entry.docs
+        universe = entry.clubs = as_universe(entry.clubs)
+        live = {id(c) for c in universe}
+        for key in list(docs):
+            if key not in live:  # clube removido ou substituído
+                del docs[key]
+        for c in universe:
+            if id(c) in entry.dirty_clubs or id(c) not in docs:
+                docs[id(c)] = encode_chunk(club_to_dict(c, entry.names))
+        write_save(entry.path, entry.meta, [docs[id(c)] for c in universe], entry.league,
+                   entry.names, len(universe.players), week=universe.calendar.week,
+                   ledger=universe.ledger.serialize())
+        entry.dirty_clubs.clear()
+        entry.dirty_meta = False
+        self.writes += 1
+        return True
@@ -1,15 +1,24 @@
 
 from __future__ import annotations
-import os, sys, json, random
+import os, sys, random, time
 from typing import List, Dict, Tuple
 
-from .data import generate_club_rosters, BR_STATES
-from .models import Player, Club, make_player
-from .sim import MatchEngine
+from .data import BR_STATES
+from .models import Club
 from .leagues import StateLeague
-from .persistence import save_game, load_game
-
-SAVE_FILE = "saves/career.save.json"
+from .persistence import CorruptSave, read_save, rebuild_lost, save_game, universe_from_save
+from .season import end_of_season, play_week, standings
+from .training import train_squad
+from .lineup import lineup_of
+from .stats import StatsEngine, NATIONAL
+from .ids import Universe
+from .finance import Ledger
+from .events import Inbox
+from .snapshots import CAREER_SEEDS, bucket_of, load_universe
+
+SAVE_FILE = "saves/career.save"
+LEGACY_SAVE_FILE = "saves/career.save.json"  # JSON das versões antigas
+RESULTS_FILE = "saves/career.results.bin"
 
 def clear():
     os.system("cls" if os.name == "nt" else "clear")
@@ -46,55 +55,64 @@ def pick_club(clubs: List[Club]) -> Club:
             pass
         print("Entrada inválida.")
 
-def generate_universe(seed: int):
-    data = generate_club_rosters(clubs_per_state=6, seniors_per_club=28, youth_per_club=18, seed=seed)
-    clubs: List[Club] = []
-    for (s_abbr, s_name), club_list in data.items():
-        for cd in club_list:
-            clubs.append(Club(
-                name=cd["name"],
-                state_abbr=cd["state_abbr"],
-                state_name=cd["state_name"],
-                budget=cd["budget"],
-                squad=[make_player(p) for p in cd["squad"]],
-                youth=[make_player(p) for p in cd["youth"]],
-            ))
-    return clubs
-
 def new_game():
     clear()
     print("=== NOVA CARREIRA ===\n")
     coach = input("Seu nome: ").strip() or "Treinador"
     abbr, state = pick_state()
 
-    seed = random.randint(1, 1_000_000)
-    clubs = generate_universe(seed)
+    # o universo sai de um dos baldes pré-gerados (snapshots)
+    seed = random.randint(1, CAREER_SEEDS)
+    clubs = load_universe(bucket_of(seed))
     my_clubs = [c for c in clubs if c.state_abbr == abbr]
     my_team = pick_club(my_clubs)
 
-    # cria campeonato estadual completo
-    st_league = StateLeague(abbr, clubs, seed=seed)
+    # o primeiro save fica para a primeira rodada (ou para a saída)
+    return start_career(clubs, coach, my_team, seed, universe=bucket_of(seed))
 
+def start_career(clubs: List[Club], coach: str, my_team: Club, seed: int, universe: int | None = None):
+    """Monta meta e estadual de uma carreira nova (sem interface).
+    `universe` é a seed de que `clubs` saiu, se não for a própria `seed`."""
+    # cria campeonato estadual completo
+    st_league = StateLeague(my_team.state_abbr, clubs, seed=seed)
     meta = {
         "coach": coach,
         "seed": seed,
+        "universe": seed if universe is None else universe,
         "season": 1,
         "team": my_team.name,
-        "state": state,
+        "team_id": my_team.id,
+        "state": my_team.state_name,
     }
-    save_game(SAVE_FILE, clubs, meta, st_league)
     return clubs, meta, st_league
 
 def load_or_new():
-    if os.path.exists(SAVE_FILE):
+    path = next((p for p in (SAVE_FILE, SAVE_FILE + ".bak", LEGACY_SAVE_FILE) if os.path.exists(p)), None)
+    if path:
         ans = input("Carregar carreira existente? [S/n] ").strip().lower()
         if ans in ("", "s", "sim", "y"):
-            return load_game(SAVE_FILE)
+            data = None
+            try:
+                data = read_save(path)
+            except CorruptSave as e:
+                print(f"Save danificado: {e}")
+                if e.lost and input("Refazer esses clubes como no início da carreira? [S/n] ").strip().lower() in ("", "s", "sim", "y"):
+                    data = rebuild_lost(e.data, e.lost)
+            if data is not None:
+                clubs, meta, st_league = universe_from_save(data)
+                if data.get("recovered"):
+                    print("Clubes danificados, voltaram como no save anterior: "
+                          + ", ".join(clubs[i].name for i in data["recovered"]))
+                    press_enter()
+                return clubs, meta, st_league
     return new_game()
 
-def show_team(club: Club):
+def show_team(club: Club, ledger: Ledger | None = None):
     clear()
     print(f"{club.name} — {club.state_name} | Orçamento: R$ {club.budget:,}")
+    if ledger is not None:
+        st = ledger.statement(club)
+        print("Temporada: " + " | ".join(f"{cat} R$ {v:,}" for cat, v in st.items()))
     print("=== PROFISSIONAL ({} jogadores) ===".format(len(club.squad)))
     for i,p in enumerate(club.squad, start=1):
         print(f"{i:2d}. {p.name:22s} {p.age:2d}a  OVR {p.overall():3d}  ({p.personality})")
@@ -108,47 +126,67 @@ def train_team(club: Club):
     print("1) Força  2) Técnica  3) Velocidade  4) Moral")
     choice = input("Escolha o foco: ").strip()
     focus = {"1":"strength","2":"technique","3":"speed","4":"morale"}.get(choice, "strength")
+    train_n = apply_training(club, focus)
+    print(f"Treino concluído ({train_n} jogadores focados em {focus}).")
+
+def apply_training(club: Club, focus: str) -> int:
     # treina 30% do elenco aleatoriamente
     pool = club.squad[:]
     random.shuffle(pool)
-    train_n = max(1, len(pool)//3)
-    for p in pool[:train_n]:
-        p.train(focus)
-    print(f"Treino concluído ({train_n} jogadores focados em {focus}).")
+    train_n = train_squad(pool[:max(1, len(pool)//3)], focus)
+    lineup_of(club).invalidate()
+    return train_n
 
 def show_table_state(clubs: List[Club], state_abbr: str):
     clear()
-    st = [c for c in clubs if c.state_abbr == state_abbr]
-    st.sort(key=lambda c: (c.points, c.goals_for - c.goals_against, c.goals_for), reverse=True)
+    st = standings(clubs, state_abbr)
     print(f"TABELA — {st[0].state_name} ({state_abbr})")
     print("Pos Clube                               P  V  E  D  GP  GC  SG")
     for i,c in enumerate(st, start=1):
         sg = c.goals_for - c.goals_against
         print(f"{i:2d}  {c.name:33.33s} {c.points:2d} {c.wins:2d} {c.draws:2d} {c.losses:2d} {c.goals_for:2d} {c.goals_against:2d} {sg:2d}")
 
-def play_week(clubs: List[Club], meta: Dict, st_league: StateLeague):
-    rng = random.Random(meta["season"] * 10_000 + st_league.current_week)
-    engine = MatchEngine(rng)
-
-    fixtures = st_league.fixtures_of_week(st_league.current_week)
-    # dicionário rápido: nome -> objeto
-    name_to_club = {c.name: c for c in clubs}
-
-    results = []
-    for fx in fixtures:
-        h, a = name_to_club[fx.home], name_to_club[fx.away]
-        res = engine.simulate(h, a)
-        results.append(res)
-
-    st_league.advance_week()
+def show_stats(stats: StatsEngine, club: Club):
+    clear()
+    print(f"ESTATÍSTICAS DA TEMPORADA — {club.state_name}\n")
+    for title, stat in (("Artilharia", "goals"), ("Cartões amarelos", "yellow"), ("Cartões vermelhos", "red")):
+        print(f"{title}:")
+        for i, (ps, n) in enumerate(stats.top(stat, 5, club.state_abbr), start=1):
+            print(f" {i}. {ps.player.name:22s} {ps.club.name:30.30s} {n:3d}")
+    print("\nArtilharia nacional:")
+    for i, (ps, n) in enumerate(stats.top("goals", 5, NATIONAL), start=1):
+        print(f" {i}. {ps.player.name:22s} {ps.club.name:30.30s} {n:3d}")
+    cs = stats.club(club)
+    print(f"\n{club.name}: forma {cs.form_str() or '-'}")
+    print("Casa  V/E/D {}/{}/{}  GP {} GC {}".format(*cs.home))
+    print("Fora  V/E/D {}/{}/{}  GP {} GC {}".format(*cs.away))
+
+def render_live(match, ev):
+    h, a = match.home_state, match.away_state
+    print(f"{ev.minute:2d}' {h.club.name} {h.goals} x {a.goals} {a.club.name} — {ev.kind} "
+          f"({match.last_player.name}, {match.last_side.club.name})")
+    time.sleep(0.3)
+
+def new_season(clubs: Universe, meta: Dict, st_league: StateLeague) -> StateLeague:
+    """Fecha a temporada (todo o universo) e monta o novo estadual."""
+    clear()
+    report = end_of_season(clubs, meta)
+    champion = report.champions.get(st_league.state_abbr, "-")
+    print(f"FIM DA TEMPORADA {report.season}\n")
+    print(f"Campeão estadual: {champion}")
+    print(f"Aposentadorias: {report.retired} | Promovidos da base: {report.promoted} | Novos na base: {report.intake}")
+    st_league = StateLeague(st_league.state_abbr, clubs, seed=meta["seed"] * 1000 + meta["season"])
     save_game(SAVE_FILE, clubs, meta, st_league)
-    return results
+    return st_league
 
 def main():
     clubs, meta, st_league = load_or_new()
+    stats = StatsEngine()  # estatísticas da temporada (em memória)
+    from .archive import ArchiveWriter
+    archive = ArchiveWriter(RESULTS_FILE)
 
     while True:
-        my = next(c for c in clubs if c.name == meta["team"])
+        my = clubs[meta["team_id"]]
         clear()
         print(f"Treinador: {meta['coach']}   |  Temporada: {meta['season']}  Semana: {st_league.current_week}/{st_league.total_weeks}")
         print(f"Time: {meta['team']} ({meta['state']})\n")
@@ -156,31 +194,46 @@ def main():
         print("2) Treinar (efeito no elenco)")
         print("3) Jogar esta semana (rodada do Estadual)")
         print("4) Ver tabela do Estadual")
-        print("5) Salvar")
-        print("6) Sair")
+        print("5) Estatísticas da temporada")
+        print("6) Salvar")
+        print("7) Sair")
         choice = input("\nEscolha: ").strip()
         if choice == "1":
-            show_team(my); press_enter()
+            show_team(my, clubs.ledger); press_enter()
         elif choice == "2":
             train_team(my); press_enter()
         elif choice == "3":
             if st_league.is_finished():
-                print("O Estadual terminou! (Próximo passo: fase final/nacional em iteração futura)")
+                print("O Estadual terminou!")
+                if input("Iniciar a próxima temporada? [S/n] ").strip().lower() in ("", "s", "sim", "y"):
+                    st_league = new_season(clubs, meta, st_league)
+                    stats = StatsEngine()
                 press_enter()
             else:
-                results = play_week(clubs, meta, st_league)
+                live = input("Assistir ao seu jogo ao vivo? [s/N] ").strip().lower() in ("s", "sim", "y")
+                news = Inbox()
+                results = play_week(clubs, meta, st_league, on_event=render_live if live else None, save_path=SAVE_FILE,
+                                    stats=stats, archive=archive, inbox=news)
+                if live:
+                    press_enter()
                 clear()
                 print(f"RESULTADOS — Semana {st_league.current_week - 1}\n")
                 for r in results:
-                    print(f"{r.home} {r.goals_home} x {r.goals_away} {r.away}")
-                    tl = ", ".join([f"{ev.minute}' {ev.club}: {ev.kind} ({ev.player})" for ev in r.timeline[:8]])
+                    print(f"{clubs[r.home].name} {r.goals_home} x {r.goals_away} {clubs[r.away].name}")
+                    tl = ", ".join([f"{ev.minute}' {clubs[ev.club].name}: {ev.kind} ({clubs.player(ev.player).name})"
+                                    for ev in r.timeline[:8]])
                     if tl: print(" - Eventos:", tl)
+                print(f"\nNotícias do clube: {' '.join(news)}")
                 press_enter()
         elif choice == "4":
             show_table_state(clubs, my.state_abbr); press_enter()
         elif choice == "5":
-            save_game(SAVE_FILE, clubs, meta, st_league); print("Salvo."); press_enter()
+            show_stats(stats, my); press_enter()
         elif choice == "6":
+            save_game(SAVE_FILE, clubs, meta, st_league); print("Salvo."); press_enter()
+        elif choice == "7":
+            save_game(SAVE_FILE, clubs, meta, st_league)
+            archive.close()
             print("Até mais!"); break
         else:
             print("Opção inválida"); press_enter()
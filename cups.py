@@ -0,0 +1,469 @@
+"""
+Copas: fase de grupos, confrontos de ida e volta e mata-mata.
+
+Uma `Cup` anda no mesmo calendário semanal dos estaduais: na semana
+marcada ela tem uma rodada (`fixtures_of_week`) e `play_week` a joga com o
+`MatchEngine` sem mexer na classificação dos estaduais. O chaveamento da
+fase seguinte é montado quando a anterior termina.
+
+`odds` repete o restante da copa milhares de vezes para estimar a chance
+de cada clube chegar a cada fase. No mata-mata cada confronto é um único
+sorteio com a chance exata de passar (`advance_chance`, pelos placares
+Poisson da tabela do rating ou das médias de `sim.goal_means`); com fase
+de grupos em andamento, a copa inteira é rejogada placar a placar.
+
+    python -m football_world.cups 2000
+"""
+from __future__ import annotations
+from bisect import bisect
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Tuple
+import math, random, sys, time
+
+from .models import Club
+from .leagues import BYE, Fixture, round_robin
+from .lineup import lineup_of
+from .sim import MatchEngine, MatchResult, goal_means
+from .ratings import ELO, Odds, odds_from_means
+
+PENALTY_KICK = 0.75   # chance de converter uma cobrança
+ROUND_NAMES = {1: "Final", 2: "Semifinal", 4: "Quartas de final", 8: "Oitavas de final"}
+
+Score = Tuple[int, int]
+
+def shootout(rng: random.Random) -> Score:
+    """Disputa de pênaltis: cinco cobranças para cada lado e alternadas."""
+    h = sum(rng.random() < PENALTY_KICK for _ in range(5))
+    a = sum(rng.random() < PENALTY_KICK for _ in range(5))
+    while h == a:
+        h += rng.random() < PENALTY_KICK
+        a += rng.random() < PENALTY_KICK
+    return h, a
+
+def bracket_order(size: int) -> List[int]:
+    """Posição dos cabeças de chave (0 = melhor) numa chave de `size`:
+    1º e 2º só se cruzam na final, e as folgas ficam com os melhores."""
+    order = [0]
+    while len(order) < size:
+        m = len(order) * 2
+        order = [y for x in order for y in (x, m - 1 - x)]
+    return order
+
+@dataclass
+class Tie:
+    """Confronto eliminatório; `home` manda o primeiro jogo."""
+    home: int
+    away: int
+    legs: int = 2
+    scores: List[Score] = field(default_factory=list)  # (gols home, gols away) por jogo
+    penalties: Score | None = None
+    winner: int = BYE
+
+    def fixture(self) -> Score:
+        """Próximo jogo como (mandante, visitante)."""
+        return (self.home, self.away) if len(self.scores) % 2 == 0 else (self.away, self.home)
+
+    def aggregate(self) -> Score:
+        return sum(s[0] for s in self.scores), sum(s[1] for s in self.scores)
+
+    def record(self, goals_host: int, goals_visitor: int, rng: random.Random):
+        host, _ = self.fixture()
+        self.scores.append((goals_host, goals_visitor) if host == self.home else (goals_visitor, goals_host))
+        if len(self.scores) < self.legs:
+            return
+        gh, ga = self.aggregate()
+        if gh == ga:
+            self.penalties = gh, ga = shootout(rng)
+        self.winner = self.home if gh > ga else self.away
+
+class Group:
+    """Grupo em pontos corridos; cada linha é [P, V, E, D, GP, GC]."""
+    def __init__(self, name: str, clubs: Sequence[int], legs: int = 1):
+        self.name = name
+        self.clubs = list(clubs)
+        self.rows: Dict[int, List[int]] = {c: [0, 0, 0, 0, 0, 0] for c in self.clubs}
+        rounds = round_robin(self.clubs)
+        if legs == 2:
+            rounds += [[(a, h) for h, a in r] for r in rounds]
+        self.rounds = rounds
+        self.results: Dict[Score, Score] = {}  # (mandante, visitante) -> placar
+
+    def record(self, h: int, a: int, gh: int, ga: int):
+        self.results[(h, a)] = (gh, ga)
+        for c, gf, gc in ((h, gh, ga), (a, ga, gh)):
+            row = self.rows[c]
+            if gf > gc:
+                row[0] += 3; row[1] += 1
+            elif gf == gc:
+                row[0] += 1; row[2] += 1
+            else:
+                row[3] += 1
+            row[4] += gf
+            row[5] += gc
+
+    def ranking(self, rng: random.Random) -> List[int]:
+        """Pontos, saldo, gols pró, vitórias; persistindo o empate, confronto
+        direto entre os empatados e, por fim, sorteio."""
+        order = self.clubs[:]
+        rng.shuffle(order)  # sorteio: desempate final (o sort é estável)
+
+        def key(c):
+            p, v, _, _, gp, gc = self.rows[c]
+            return p, gp - gc, gp, v
+        order.sort(key=key, reverse=True)
+        out: List[int] = []
+        i = 0
+        while i < len(order):
+            j = i + 1
+            while j < len(order) and key(order[j]) == key(order[i]):
+                j += 1
+            tied = order[i:j]
+            if len(tied) > 1:
+                tied.sort(key=lambda c: self._head_to_head(c, tied), reverse=True)
+            out += tied
+            i = j
+        return out
+
+    def _head_to_head(self, club: int, tied: List[int]) -> Tuple[int, int]:
+        pts = gd = 0
+        for other in tied:
+            for h, a in ((club, other), (other, club)):
+                score = self.results.get((h, a))
+                if score is None:
+                    continue
+                gf, gc = score if h == club else score[::-1]
+                pts += 3 if gf > gc else 1 if gf == gc else 0
+                gd += gf - gc
+        return pts, gd
+
+class Cup:
+    """Copa com fase de grupos opcional seguida de mata-mata.
+
+    `entrants` vem em ordem de cabeça de chave (melhor primeiro). Com
+    `groups`, os clubes são distribuídos em potes (serpentina) e os
+    `advance` primeiros de cada grupo seguem. Cada rodada (ou jogo de
+    ida/volta) ocupa uma semana a partir de `start_week`, de `gap` em `gap`.
+    """
+    def __init__(self, name: str, entrants: Sequence[int], start_week: int = 1, groups: int = 0,
+                 advance: int = 2, group_legs: int = 1, legs: int = 2, final_legs: int = 1,
+                 gap: int = 1, seed: int = 0, state_abbr: str | None = None):
+        self.name = name
+        self.state_abbr = state_abbr  # fase final de um estadual (o vencedor é o campeão)
+        self.rng = random.Random(seed)
+        self.week = start_week  # semana da próxima rodada
+        self.gap = gap
+        self.legs, self.final_legs = legs, final_legs
+        self.champion = BYE
+        self.groups: List[Group] = []
+        self.matchday = 0
+        self.ties: List[Tie] = []
+        self.seed_of: Dict[int, int] = {}
+        # fase mais avançada de cada clube (índice em `stages`; -1 = caiu nos grupos)
+        self.reached: Dict[int, int] = {}
+        self.round = 0
+
+        entrants = list(entrants)
+        if groups:
+            for g in range(groups):
+                pot = [entrants[i] for i in range(len(entrants)) if _snake(i, groups) == g]
+                self.groups.append(Group(chr(ord("A") + g), pot, group_legs))
+            qualifiers = groups * advance
+            self.advance = advance
+            self.reached = {c: -1 for c in entrants}
+        else:
+            qualifiers = len(entrants)
+        size = 1 << max(1, math.ceil(math.log2(max(2, qualifiers))))
+        self.stages = [ROUND_NAMES.get(n, f"Fase de {2 * n}") for n in _halves(size)] + ["Campeão"]
+        if not groups:
+            self._draw(entrants)
+
+    # --- calendário ---
+
+    def is_finished(self) -> bool:
+        return self.champion != BYE
+
+    def pending(self) -> List[Score]:
+        """Jogos da próxima rodada como (mandante, visitante)."""
+        if self.is_finished():
+            return []
+        if self.groups:
+            return [p for g in self.groups if self.matchday < len(g.rounds) for p in g.rounds[self.matchday]]
+        return [t.fixture() for t in self.ties if t.winner == BYE]
+
+    def fixtures_of_week(self, week: int) -> List[Fixture]:
+        if week != self.week:
+            return []
+        return [Fixture(week, h, a) for h, a in self.pending()]
+
+    def play_week(self, clubs: Sequence[Club], week: int, engine: MatchEngine) -> List[MatchResult]:
+        """Joga a rodada da copa marcada para `week` (se houver)."""
+        if week != self.week or self.is_finished():
+            return []
+        results = [engine.simulate_background(clubs[h], clubs[a], register=False) for h, a in self.pending()]
+        self.record([(r.goals_home, r.goals_away) for r in results])
+        self.week += self.gap
+        return results
+
+    def record(self, scores: Sequence[Score]):
+        """Registra os placares de `pending()` (mesma ordem) e avança a copa."""
+        if self.groups:
+            fixtures = self.pending()
+            for (h, a), (gh, ga) in zip(fixtures, scores):
+                self._group_of(h).record(h, a, gh, ga)
+            self.matchday += 1
+            if self.matchday >= max(len(g.rounds) for g in self.groups):
+                self._close_groups()
+            return
+        it = iter(scores)
+        for t in self.ties:
+            if t.winner == BYE:
+                t.record(*next(it), self.rng)
+        if all(t.winner != BYE for t in self.ties):
+            self._next_round()
+
+    # --- fases ---
+
+    def _group_of(self, club: int) -> Group:
+        for g in self.groups:
+            if club in g.rows:
+                return g
+        raise KeyError(club)
+
+    def _close_groups(self):
+        tables = [g.ranking(self.rng) for g in self.groups]
+        # 1ºs de todos os grupos, depois 2ºs, ... (cruza grupos diferentes)
+        qualified = [t[k] for k in range(self.advance) for t in tables if k < len(t)]
+        self.groups = []
+        self._draw(qualified)
+
+    def _draw(self, seeded: List[int]):
+        self.seed_of = {c: i for i, c in enumerate(seeded)}
+        size = 1 << (len(self.stages) - 1)
+        slots = [seeded[i] if i < len(seeded) else BYE for i in bracket_order(size)]
+        for c in seeded:
+            self.reached[c] = 0
+        self._pair(slots)
+
+    def _pair(self, slots: List[int]):
+        legs = self.final_legs if len(slots) == 2 else self.legs
+        self.ties = []
+        for a, b in zip(slots[::2], slots[1::2]):
+            if b == BYE or a == BYE:
+                t = Tie(a, b, 0, winner=a if b == BYE else b)
+            else:
+                t = Tie(*self._sides(a, b, legs), legs)
+            self.ties.append(t)
+        if all(t.winner != BYE for t in self.ties):
+            self._next_round()
+
+    def _sides(self, a: int, b: int, legs: int) -> Tuple[int, int]:
+        """(mandante do primeiro jogo, visitante): em ida e volta o melhor
+        cabeça de chave decide em casa; em jogo único, joga em casa."""
+        if (self.seed_of[a] < self.seed_of[b]) == (legs > 1):
+            return b, a
+        return a, b
+
+    def _next_round(self):
+        self.round += 1
+        winners = [t.winner for t in self.ties]
+        for c in winners:
+            if c != BYE:
+                self.reached[c] = self.round
+        if len(winners) == 1:
+            self.champion = winners[0]
+            return
+        self._pair(winners)
+
+    # --- simulações em lote ---
+
+    def clone(self, rng: random.Random) -> "Cup":
+        """Cópia independente do estado atual (para simulações)."""
+        c = Cup.__new__(Cup)
+        c.__dict__.update(self.__dict__)
+        c.rng = rng
+        c.reached = dict(self.reached)
+        c.ties = [Tie(t.home, t.away, t.legs, list(t.scores), t.penalties, t.winner) for t in self.ties]
+        groups = []
+        for g in self.groups:
+            ng = Group.__new__(Group)
+            ng.__dict__.update(g.__dict__)
+            ng.rows = {k: row[:] for k, row in g.rows.items()}
+            ng.results = dict(g.results)
+            groups.append(ng)
+        c.groups = groups
+        return c
+
+    def odds(self, clubs: Sequence[Club], n: int = 2000, rng: random.Random | None = None,
+             ratings=None) -> Dict[int, List[float]]:
+        """Chance de cada clube chegar a cada fase (`stages`), a partir do
+        estado atual, em `n` simulações. Com `ratings` (EloModel) os placares
+        saem da tabela de previsões; sem, da força atual dos titulares."""
+        rng = rng or random.Random(0)
+        if ratings is not None:
+            odds = lambda h, a: ratings.odds(clubs[h], clubs[a])
+        else:
+            strength = {c: lineup_of(clubs[c]).rating() for c in self.participants()}
+            odds = lambda h, a: _strength_odds(strength[h], strength[a])
+        if not self.groups:
+            return self._bracket_odds(odds, n, rng)
+        sampler = ScoreSampler(odds, rng)
+        counts = {c: [0] * len(self.stages) for c in self.participants()}
+        for _ in range(n):
+            sim = self.clone(rng)
+            while not sim.is_finished():
+                sim.record([sampler(h, a) for h, a in sim.pending()])
+            for c, k in sim.reached.items():
+                row = counts[c]
+                for i in range(k + 1):
+                    row[i] += 1
+        return {c: [v / n for v in row] for c, row in counts.items()}
+
+    def _bracket_odds(self, odds: Callable[[int, int], Odds], n: int, rng: random.Random) -> Dict[int, List[float]]:
+        """`odds` só com mata-mata: cada confronto é um único sorteio com a
+        chance exata de o mandante da ida passar (`advance_chance`, em cache
+        por confronto), sem montar cópias da copa."""
+        counts = {c: [0] * len(self.stages) for c in self.participants()}
+        for c, k in self.reached.items():  # o que já foi alcançado vale para todas
+            row = counts[c]
+            for i in range(k + 1):
+                row[i] += n
+        if self.is_finished():
+            return {c: [v / n for v in row] for c, row in counts.items()}
+        rand = rng.random
+        chance: Dict[Tuple[int, int, int], float] = {}
+        current = [(t.winner, t.home, t.away, advance_chance(t, odds) if t.winner == BYE else 1.0)
+                   for t in self.ties]
+        for _ in range(n):
+            winners = [w if w != BYE else h if rand() < p else a for w, h, a, p in current]
+            rnd = self.round
+            while True:
+                rnd += 1
+                for c in winners:
+                    if c != BYE:
+                        counts[c][rnd] += 1
+                if len(winners) == 1:
+                    break
+                legs = self.final_legs if len(winners) == 2 else self.legs
+                nxt = []
+                for a, b in zip(winners[::2], winners[1::2]):
+                    if a == BYE or b == BYE:
+                        nxt.append(a if b == BYE else b)
+                        continue
+                    a, b = self._sides(a, b, legs)
+                    p = chance.get((a, b, legs))
+                    if p is None:
+                        p = chance[(a, b, legs)] = advance_chance(Tie(a, b, legs), odds)
+                    nxt.append(a if rand() < p else b)
+                winners = nxt
+        return {c: [v / n for v in row] for c, row in counts.items()}
+
+    def participants(self) -> List[int]:
+        return list(self.reached)
+
+def _snake(i: int, groups: int) -> int:
+    """Grupo do i-ésimo cabeça de chave na distribuição em serpentina."""
+    pot, pos = divmod(i, groups)
+    return pos if pot % 2 == 0 else groups - 1 - pos
+
+def _halves(size: int) -> List[int]:
+    """Número de confrontos em cada fase de uma chave de `size` clubes."""
+    out = []
+    while size > 1:
+        size //= 2
+        out.append(size)
+    return out
+
+class ScoreSampler:
+    """Placar aleatório por confronto em O(log MAX_GOALS).
+
+    `odds(h, a)` dá a previsão (`ratings.Odds`) de cada par (mandante,
+    visitante); ela é obtida uma única vez e reaproveitada.
+    """
+    def __init__(self, odds: Callable[[int, int], Odds], rng: random.Random):
+        self.odds = odds
+        self.rng = rng
+        self.cache: Dict[Score, Odds] = {}
+
+    def __call__(self, h: int, a: int) -> Score:
+        o = self.cache.get((h, a))
+        if o is None:
+            o = self.cache[(h, a)] = self.odds(h, a)
+        r = self.rng.random
+        return bisect(o.home_cdf, r()), bisect(o.away_cdf, r())
+
+def _goal_pmf(cdf: Tuple[float, ...]) -> List[float]:
+    """Distribuição do sorteio por `bisect` na CDF (a sobra vira o último valor)."""
+    pmf = [cdf[0]] + [cdf[k] - cdf[k - 1] for k in range(1, len(cdf))]
+    pmf.append(max(0.0, 1.0 - cdf[-1]))
+    return pmf
+
+def _margin_pmf(o: Odds) -> Dict[int, float]:
+    """Saldo do mandante num jogo -> probabilidade."""
+    ph, pa = _goal_pmf(o.home_cdf), _goal_pmf(o.away_cdf)
+    out: Dict[int, float] = {}
+    for i, x in enumerate(ph):
+        for j, y in enumerate(pa):
+            out[i - j] = out.get(i - j, 0.0) + x * y
+    return out
+
+def advance_chance(t: Tie, odds: Callable[[int, int], Odds]) -> float:
+    """Chance de `t.home` passar, dado o que já foi jogado: soma os saldos
+    dos jogos que faltam (placares de `odds`); empate no agregado vai aos
+    pênaltis, meio a meio (as cobranças dos dois lados são iguais)."""
+    gh, ga = t.aggregate()
+    dist = {gh - ga: 1.0}
+    for leg in range(len(t.scores), t.legs):
+        if leg % 2 == 0:
+            step, sign = _margin_pmf(odds(t.home, t.away)), 1
+        else:
+            step, sign = _margin_pmf(odds(t.away, t.home)), -1
+        nxt: Dict[int, float] = {}
+        for d, p in dist.items():
+            for s, q in step.items():
+                k = d + sign * s
+                nxt[k] = nxt.get(k, 0.0) + p * q
+        dist = nxt
+    return sum(p for d, p in dist.items() if d > 0) + 0.5 * dist.get(0, 0.0)
+
+def _strength_odds(home: float, away: float) -> Odds:
+    """Previsão pela média dos titulares (as médias do motor minuto a minuto)."""
+    return odds_from_means(*goal_means(home, away))
+
+# --- competições do calendário ---
+
+def state_finals(clubs: Sequence[Club], abbr: str, start_week: int, seed: int = 0, qualifiers: int = 4) -> Cup:
+    """Fase final do estadual: os `qualifiers` primeiros em mata-mata de ida e volta."""
+    from .season import standings
+    table = [c.id for c in standings(clubs, abbr)[:qualifiers]]
+    return Cup(f"Estadual {abbr} — fase final", table, start_week, legs=2, final_legs=2,
+               seed=seed, state_abbr=abbr)
+
+def national_cup(clubs: Sequence[Club], start_week: int = 1, seed: int = 0, ratings=None) -> Cup:
+    """Copa nacional com todos os clubes; os mais fortes (pelo rating, se
+    houver) são cabeças de chave."""
+    seeded = sorted(clubs, key=ratings.rating if ratings is not None else Club.rating, reverse=True)
+    return Cup("Copa Nacional", [c.id for c in seeded], start_week, legs=2, final_legs=1, seed=seed)
+
+def play_cups(cups: Sequence[Cup], clubs: Sequence[Club], week: int, engine: MatchEngine) -> List[MatchResult]:
+    """Joga a rodada da semana de todas as copas em andamento."""
+    results: List[MatchResult] = []
+    for cup in cups:
+        results += cup.play_week(clubs, week, engine)
+    return results
+
+def main(argv: List[str] | None = None):
+    from .data import generate_universe
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 2000
+    clubs = generate_universe(1)
+    cup = national_cup(clubs, ratings=ELO)
+    t0 = time.perf_counter()
+    odds = cup.odds(clubs, n, ratings=ELO)
+    dt = time.perf_counter() - t0
+    print(f"{cup.name}: {n} simulações em {dt:.2f}s ({n / dt:.0f}/s, {len(clubs)} clubes)")
+    print(f"{'Clube':32s} " + " ".join(f"{s[:8]:>8s}" for s in cup.stages[-4:]))
+    for c, row in sorted(odds.items(), key=lambda kv: kv[1][-1], reverse=True)[:10]:
+        print(f"{clubs[c].name:32.32s} " + " ".join(f"{100 * p:7.1f}%" for p in row[-4:]))
+
+if __name__ == "__main__":
+    main()
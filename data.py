@@ -26,7 +26,9 @@ PERSONALITIES = [
     "Líder silencioso", "Falastrão de vestiário", "Decisivo em finais", "Some em jogo grande",
     "Treino exemplar", "Indisciplinado", "Amado pela torcida", "Pavio curto",
     "Ídolo local", "Promessa da base", "Veterano cascudo", "Frio em pênaltis",
+    "Preguiçoso", "Carismático", "Frágil", "Ambicioso",
 ]
+AMBITIOUS = "Ambicioso"  # menos fiel ao clube
 
 def rand_name() -> str:
     return f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
@@ -38,6 +40,24 @@ def make_club_name(state_abbr: str) -> str:
     mascot = random.choice(MASCOTS)
     return f"{city} {color} {mascot} {state_abbr}".strip()
 
+def random_player(rng, age_min: int, age_max: int, attr_min: int, attr_max: int) -> dict:
+    """Sorteia um jogador (dict) usando `rng` (módulo random ou random.Random)."""
+    player = {
+        "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        "age": rng.randint(age_min, age_max),
+        "strength": rng.randint(attr_min, attr_max),
+        "technique": rng.randint(attr_min, attr_max),
+        "speed": rng.randint(attr_min, attr_max),
+        "morale": rng.randint(40, 90),
+        "personality": rng.choice(PERSONALITIES),
+        "isLegendary": False,
+    }
+    # potencial nunca abaixo do nível atual
+    ovr = round((player["strength"] + player["technique"] + player["speed"]) / 3)
+    player["potential"] = max(ovr, rng.randint(55, 100))
+    player["loyalty"] = rng.randint(10, 70) if player["personality"] == AMBITIOUS else rng.randint(30, 100)
+    return player
+
 def generate_club_rosters(
     clubs_per_state: int = 6,
     seniors_per_club: int = 28,
@@ -55,33 +75,9 @@ def generate_club_rosters(
         for _ in range(clubs_per_state):
             club_name = make_club_name(abbr)
             # Elenco profissional
-            squad = []
-            for i in range(seniors_per_club):
-                player = {
-                    "name": rand_name(),
-                    "age": random.randint(18, 35),
-                    "strength": random.randint(30, 90),
-                    "technique": random.randint(30, 90),
-                    "speed": random.randint(30, 90),
-                    "morale": random.randint(40, 90),
-                    "personality": random.choice(PERSONALITIES),
-                    "isLegendary": False,
-                }
-                squad.append(player)
+            squad = [random_player(random, 18, 35, 30, 90) for _ in range(seniors_per_club)]
             # Base
-            youth = []
-            for i in range(youth_per_club):
-                player = {
-                    "name": rand_name(),
-                    "age": random.randint(15, 18),
-                    "strength": random.randint(25, 70),
-                    "technique": random.randint(25, 70),
-                    "speed": random.randint(25, 70),
-                    "morale": random.randint(40, 90),
-                    "personality": random.choice(PERSONALITIES),
-                    "isLegendary": False,
-                }
-                youth.append(player)
+            youth = [random_player(random, 15, 18, 25, 70) for _ in range(youth_per_club)]
 
             clubs.append({
                 "name": club_name,
@@ -93,3 +89,22 @@ def generate_club_rosters(
             })
         data[(abbr, state)] = clubs
     return data
+
+def generate_universe(seed: int, clubs_per_state: int = 6):
+    """Universo (`ids.Universe`) gerado da `seed`, clubes na ordem dos estados."""
+    from .models import Club, make_player
+    from .ids import Universe
+    data = generate_club_rosters(clubs_per_state=clubs_per_state, seniors_per_club=28, youth_per_club=18, seed=seed)
+    clubs = Universe()
+    for (s_abbr, s_name), club_list in data.items():
+        for cd in club_list:
+            clubs.append(Club(
+                name=cd["name"],
+                state_abbr=cd["state_abbr"],
+                state_name=cd["state_name"],
+                budget=cd["budget"],
+                squad=[make_player(p) for p in cd["squad"]],
+                youth=[make_player(p) for p in cd["youth"]],
+            ))
+    clubs.reindex()
+    return clubs
@@ -0,0 +1,182 @@
+"""
+Eventos da semana de todos os clubes.
+
+Cada tipo de evento é uma linha de `EVENTS`: peso base, quem ele atinge
+(um jogador sorteado pelo peso `subject`, que depende de personalidade,
+fidelidade, moral ou potencial; ou o clube inteiro) e o efeito, que mexe
+em orçamento, moral, fidelidade ou manda o jogador para o calendário de
+desfalques. Por semana só os clubes sorteados são visitados (pulos
+geométricos sobre a lista), então o custo acompanha o número de eventos
+e não o de clubes.
+"""
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterator, List, Tuple
+import math, random
+
+from .models import Club, Player
+from .data import AMBITIOUS
+from .lineup import CARD_PRONE, INJURY_PRONE
+from .sampling import AliasTable
+from .status import StatusCalendar
+
+EVENT_CHANCE = 0.25  # chance de cada clube ter um evento na semana
+MAX_TRIES = 16       # sorteios por rejeição antes de desistir do jogador
+INBOX_SIZE = 100
+
+def _clamp(x: int) -> int:
+    return max(0, min(100, x))
+
+# --- efeitos: (clube, jogador ou None, rng, calendário) -> mensagem ---
+
+def _sponsor(club: Club, p, rng, calendar: StatusCalendar) -> str:
+    amount = rng.randint(500_000, 5_000_000)
+    club.budget += amount
+    return f"Um novo patrocinador assinou contrato, adicionando R$ {amount:,} ao orçamento."
+
+def _investor(club: Club, p, rng, calendar: StatusCalendar) -> str:
+    amount = rng.randint(5_000_000, 20_000_000)
+    club.budget += amount
+    return f"Um investidor comprou parte do clube e aportou R$ {amount:,}."
+
+def _wants_out(club: Club, p: Player, rng, calendar: StatusCalendar) -> str:
+    p.loyalty = _clamp(p.loyalty - 20)
+    p.morale = _clamp(p.morale - 5)
+    return f"{p.name} solicitou transferência para um clube maior."
+
+def _unhappy(club: Club, p: Player, rng, calendar: StatusCalendar) -> str:
+    p.loyalty = _clamp(p.loyalty - 10)
+    return f"{p.name} reclamou publicamente da falta de oportunidades."
+
+def _training_injury(club: Club, p: Player, rng, calendar: StatusCalendar) -> str:
+    weeks = calendar.injure(club, p, rng)
+    return f"O jogador {p.name} se lesionou durante o treino e ficará fora por {weeks} semana(s)."
+
+def _call_up(club: Club, p: Player, rng, calendar: StatusCalendar) -> str:
+    calendar.suspend(club, p, 1)
+    p.morale = _clamp(p.morale + 5)
+    return f"{p.name} foi convocado para a seleção nacional e desfalcará o próximo jogo."
+
+def _indiscipline(club: Club, p: Player, rng, calendar: StatusCalendar) -> str:
+    calendar.suspend(club, p, 1)
+    p.morale = _clamp(p.morale - 5)
+    return f"{p.name} brigou no treino e foi afastado do próximo jogo."
+
+def _crisis(club: Club, p, rng, calendar: StatusCalendar) -> str:
+    for q in club.squad:
+        q.morale = _clamp(q.morale - 3)
+    return "Houve um desentendimento entre diretores, prejudicando a moral do clube."
+
+def _team_spirit(club: Club, p, rng, calendar: StatusCalendar) -> str:
+    for q in club.squad:
+        q.morale = _clamp(q.morale + 3)
+    return "O churrasco do elenco uniu o vestiário; a moral do grupo subiu."
+
+def _youth_shines(club: Club, p: Player, rng, calendar: StatusCalendar) -> str:
+    p.potential = _clamp(p.potential + 3)
+    return f"Um jovem da base ({p.name}) tem se destacado e pede oportunidades."
+
+@dataclass(frozen=True)
+class EventKind:
+    """Um tipo de evento. Sem `subject`, atinge o clube; com ele, um jogador
+    de `pool` sorteado com peso `subject(p)` (no máximo `top`)."""
+    name: str
+    weight: float
+    apply: Callable[[Club, Player | None, random.Random, StatusCalendar], str]
+    subject: Callable[[Player], float] | None = None
+    top: float = 1.0
+    pool: str = "squad"
+
+EVENTS: List[EventKind] = [
+    EventKind("patrocinador", 3.0, _sponsor),
+    EventKind("investidor", 0.5, _investor),
+    EventKind("pede_saida", 2.0, _wants_out,
+              lambda p: (100 - p.loyalty) * (2 if p.personality == AMBITIOUS else 1), 200.0),
+    EventKind("insatisfeito", 1.5, _unhappy, lambda p: 100 - p.morale, 100.0),
+    EventKind("lesao_treino", 2.0, _training_injury, lambda p: INJURY_PRONE.get(p.personality, 1.0),
+              max(1.0, *INJURY_PRONE.values())),
+    EventKind("convocacao", 1.0, _call_up, lambda p: max(0, p.overall() - 70), 30.0),
+    EventKind("indisciplina", 1.0, _indiscipline, lambda p: CARD_PRONE.get(p.personality, 0.2),
+              max(1.0, *CARD_PRONE.values())),
+    EventKind("crise", 1.0, _crisis),
+    EventKind("vestiario_unido", 1.0, _team_spirit),
+    EventKind("destaque_base", 1.5, _youth_shines, lambda p: p.potential, 100.0, "youth"),
+]
+_TABLE = AliasTable(EVENTS, [e.weight for e in EVENTS])
+
+def _subject(kind: EventKind, club: Club, rng) -> Player | None:
+    """Jogador sorteado pelo peso do evento (rejeição: O(1) esperado)."""
+    pool = getattr(club, kind.pool)
+    if not pool:
+        return None
+    for _ in range(MAX_TRIES):
+        p = pool[int(rng.random() * len(pool))]
+        if rng.random() * kind.top < kind.subject(p):
+            return p
+    return None
+
+def fire(club: Club, calendar: StatusCalendar, rng) -> str | None:
+    """Sorteia e aplica um evento no clube; None se ninguém se encaixou."""
+    kind = _TABLE.sample(rng)
+    p = None
+    if kind.subject is not None:
+        p = _subject(kind, club, rng)
+        if p is None:
+            return None
+    return kind.apply(club, p, rng, calendar)
+
+def weekly_event(club: Club, calendar: StatusCalendar, rng=None) -> str:
+    """Um evento garantido para o clube (o do treinador)."""
+    rng = rng or random
+    for _ in range(MAX_TRIES):
+        msg = fire(club, calendar, rng)
+        if msg is not None:
+            return msg
+    return _sponsor(club, None, rng, calendar)
+
+class Inbox:
+    """Caixa de entrada limitada: as mensagens mais antigas saem sozinhas."""
+    def __init__(self, capacity: int = INBOX_SIZE):
+        self.items: Deque[Tuple[int, str]] = deque(maxlen=capacity)
+
+    def push(self, text: str, week: int = 0):
+        self.items.append((week, text))
+
+    def extend(self, texts, week: int = 0):
+        for text in texts:
+            self.push(text, week)
+
+    def recent(self, n: int = 10) -> List[str]:
+        return [text for _, text in list(self.items)[-n:]]
+
+    def __iter__(self) -> Iterator[str]:
+        return (text for _, text in self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+def run_week(clubs: List[Club], calendar: StatusCalendar, rng=None, chance: float = EVENT_CHANCE,
+             follow: int | None = None, inbox: Inbox | None = None) -> str | None:
+    """Eventos da semana de todo o universo.
+
+    Cada clube tem `chance` de evento; o clube `follow` (id) sempre tem um,
+    que vai para `inbox` e é devolvido.
+    """
+    rng = rng or random
+    msg = None
+    if follow is not None:
+        msg = weekly_event(clubs[follow], calendar, rng)
+        if inbox is not None:
+            inbox.push(msg, calendar.week)
+    if chance <= 0:
+        return msg
+    log_miss = math.log(1.0 - chance) if chance < 1 else -math.inf
+    i, n = -1, len(clubs)
+    while True:
+        # pula direto para o próximo clube sorteado (distribuição geométrica)
+        i += 1 + int(math.log(1.0 - rng.random()) / log_miss)
+        if i >= n:
+            return msg
+        if i != follow:
+            fire(clubs[i], calendar, rng)
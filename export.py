@@ -0,0 +1,241 @@
+"""
+Exportação em tabelas (CSV/TSV) para análise fora do jogo, e o caminho
+de volta.
+
+Uma carreira vira um diretório com `clubs`, `players`, `fixtures`,
+`results` e `events` (uma linha por lance) mais `meta.json`. Os
+resultados saem direto do arquivo de partidas (`archive`), registro a
+registro, e são gravados em blocos de `CHUNK_ROWS` linhas: a memória não
+depende de quantas temporadas o arquivo cobre.
+
+`import_tables` faz o inverso em lote: lê as tabelas em sequência (os
+jogadores vêm agrupados por clube), grava o save clube a clube e, se
+pedido, remonta o arquivo de partidas.
+
+    python -m football_world.export dump saves/career.save analise/ --results saves/career.results.bin
+    python -m football_world.export load analise/ saves/importado.save --results saves/importado.results.bin
+"""
+from __future__ import annotations
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+import csv, json, os, time
+
+from .leagues import StateLeague
+from .ids import Universe
+from .snapshots import FIELDS
+from .persistence import encode_chunk, write_save
+from .archive import EVENTS, HEADER, KIND_CODE, MAGIC, RECORD, VERSION, AWAY_BIT, ArchiveReader
+
+CHUNK_ROWS = 10_000
+TABLES = ("clubs", "players", "fixtures", "results", "events")
+FORMATS = {"csv": ",", "tsv": "\t"}
+
+CLUB_COLUMNS = ("id", "name", "state_abbr", "state_name", "budget", "points", "goals_for",
+                "goals_against", "wins", "draws", "losses", "elo")
+PLAYER_COLUMNS = ("club_id", "group") + FIELDS  # group: squad (profissional) ou youth (base)
+FIXTURE_COLUMNS = ("state_abbr", "week", "home", "away")
+RESULT_COLUMNS = ("match", "season", "week", "home", "away", "goals_home", "goals_away")
+EVENT_COLUMNS = ("match", "minute", "side", "kind")  # side: 0 mandante, 1 visitante
+
+def _bool(s: str) -> bool:
+    return s in ("1", "True", "true")
+
+# conversão de cada campo de `Player` ao ler de volta
+_PLAYER_TYPES = {"name": str, "personality": str, "isLegendary": _bool, "injured": _bool}
+
+def _table_path(root: str, table: str, fmt: str) -> str:
+    return os.path.join(root, f"{table}.{fmt}")
+
+def _write_rows(path: str, columns: Tuple[str, ...], rows: Iterable[tuple], fmt: str) -> int:
+    """Grava o cabeçalho e as linhas em blocos de `CHUNK_ROWS`."""
+    n = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f, delimiter=FORMATS[fmt], lineterminator="\n")
+        w.writerow(columns)
+        block: List[tuple] = []
+        for row in rows:
+            block.append(row)
+            if len(block) >= CHUNK_ROWS:
+                w.writerows(block)
+                n += len(block)
+                block.clear()
+        w.writerows(block)
+        n += len(block)
+    return n
+
+def _read_header(path: str, fmt: str) -> List[str]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f, delimiter=FORMATS[fmt]), [])
+
+def _read_rows(path: str, fmt: str) -> Iterator[List[str]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        r = csv.reader(f, delimiter=FORMATS[fmt])
+        next(r, None)  # cabeçalho
+        yield from r
+
+def _player_rows(clubs: Universe) -> Iterator[tuple]:
+    for c in clubs:
+        for group in ("squad", "youth"):
+            for p in getattr(c, group):
+                yield (c.id, group) + tuple(int(v) if isinstance(v, bool) else v
+                                            for v in (getattr(p, f) for f in FIELDS))
+
+def _result_rows(reader: ArchiveReader, events: List[tuple]) -> Iterator[tuple]:
+    """Partidas do arquivo; os lances de cada uma vão para `events` (o
+    chamador esvazia a lista a cada bloco)."""
+    for i, (season, week, home, away, gh, ga, n, raw) in enumerate(RECORD.iter_unpack(reader.body)):
+        for k in range(n):
+            code = raw[2 * k + 1]
+            events.append((i, raw[2 * k], code >> 7, EVENTS[code & 0x7F]))
+        yield (i, season, week, home, away, gh, ga)
+
+def _export_results(archive_path: str, root: str, fmt: str) -> Tuple[int, int]:
+    """Resultados e lances lado a lado, bloco a bloco."""
+    n_results = n_events = 0
+    with ArchiveReader(archive_path) as reader, \
+            open(_table_path(root, "results", fmt), "w", newline="", encoding="utf-8") as rf, \
+            open(_table_path(root, "events", fmt), "w", newline="", encoding="utf-8") as ef:
+        rw = csv.writer(rf, delimiter=FORMATS[fmt], lineterminator="\n")
+        ew = csv.writer(ef, delimiter=FORMATS[fmt], lineterminator="\n")
+        rw.writerow(RESULT_COLUMNS)
+        ew.writerow(EVENT_COLUMNS)
+        events: List[tuple] = []
+        block: List[tuple] = []
+        for row in _result_rows(reader, events):
+            block.append(row)
+            if len(block) >= CHUNK_ROWS:
+                rw.writerows(block)
+                ew.writerows(events)
+                n_results, n_events = n_results + len(block), n_events + len(events)
+                block.clear()
+                events.clear()
+        rw.writerows(block)
+        ew.writerows(events)
+        n_results, n_events = n_results + len(block), n_events + len(events)
+    return n_results, n_events
+
+def export_tables(clubs: Universe, meta: Dict[str, Any], root: str, state_league: StateLeague | None = None,
+                  archive_path: str | None = None, fmt: str = "csv") -> Dict[str, int]:
+    """Grava as tabelas da carreira em `root`; devolve linhas por tabela."""
+    if fmt not in FORMATS:
+        raise ValueError(f"formato desconhecido: {fmt} (use {', '.join(FORMATS)})")
+    os.makedirs(root, exist_ok=True)
+    counts = {}
+    counts["clubs"] = _write_rows(_table_path(root, "clubs", fmt), CLUB_COLUMNS,
+                                  (tuple(getattr(c, k) for k in CLUB_COLUMNS) for c in clubs), fmt)
+    counts["players"] = _write_rows(_table_path(root, "players", fmt), PLAYER_COLUMNS, _player_rows(clubs), fmt)
+    fixtures = state_league.fixtures if state_league is not None else []
+    counts["fixtures"] = _write_rows(_table_path(root, "fixtures", fmt), FIXTURE_COLUMNS,
+                                     ((state_league.state_abbr, f.week, f.home, f.away) for f in fixtures), fmt)
+    if archive_path is not None and os.path.exists(archive_path):
+        counts["results"], counts["events"] = _export_results(archive_path, root, fmt)
+    league = None
+    if state_league is not None:
+        league = {"state_abbr": state_league.state_abbr, "seed": state_league.seed,
+                  "current_week": state_league.current_week}
+    with open(os.path.join(root, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"format": fmt, "meta": meta, "next_player_id": len(clubs.players), "week": clubs.calendar.week,
+                   "state_league": league, "rows": counts}, f, ensure_ascii=False, indent=2)
+    return counts
+
+# --- importação ---
+
+def _club_docs(root: str, fmt: str) -> Iterator[Dict[str, Any]]:
+    """Clubes no formato de `persistence.club_to_dict`, um por vez.
+
+    As colunas valem pelo nome do cabeçalho: tabelas de outra versão (com
+    campos em outra ordem, a mais ou a menos) ainda são lidas, e o que
+    faltar fica com o padrão de `Player`."""
+    players_path, clubs_path = _table_path(root, "players", fmt), _table_path(root, "clubs", fmt)
+    header = _read_header(players_path, fmt)
+    club_col, group_col = header.index("club_id"), header.index("group")
+    columns = [(i, f, _PLAYER_TYPES.get(f, int)) for i, f in enumerate(header) if f in FIELDS]
+    club_columns = [(i, k) for i, k in enumerate(_read_header(clubs_path, fmt)) if k in CLUB_COLUMNS]
+    players = groupby(_read_rows(players_path, fmt), key=lambda r: int(r[club_col]))
+    pending = next(players, None)
+    for row in _read_rows(clubs_path, fmt):
+        doc: Dict[str, Any] = {"squad": [], "youth": []}
+        for i, k in club_columns:
+            v = row[i]
+            doc[k] = v if k in ("name", "state_abbr", "state_name") else float(v) if k == "elo" else int(v)
+        if pending is not None and pending[0] == doc["id"]:
+            for r in pending[1]:
+                doc[r[group_col]].append({f: conv(r[i]) for i, f, conv in columns})
+            pending = next(players, None)
+        yield doc
+
+def _fixtures(root: str, fmt: str) -> List[Dict[str, int]]:
+    path = _table_path(root, "fixtures", fmt)
+    if not os.path.exists(path):
+        return []
+    return [{"week": int(w), "home": int(h), "away": int(a)} for _, w, h, a in _read_rows(path, fmt)]
+
+def _import_results(root: str, fmt: str, archive_path: str) -> int:
+    """Remonta o arquivo de partidas (substitui o que houver em `archive_path`)."""
+    events = _read_rows(_table_path(root, "events", fmt), fmt)
+    ev = next(events, None)
+    os.makedirs(os.path.dirname(archive_path) or ".", exist_ok=True)
+    n = 0
+    with open(archive_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        block = bytearray()
+        for match, season, week, home, away, gh, ga in _read_rows(_table_path(root, "results", fmt), fmt):
+            codes = bytearray()
+            while ev is not None and ev[0] == match:
+                codes += bytes((int(ev[1]), (AWAY_BIT if ev[2] == "1" else 0) | KIND_CODE[ev[3]]))
+                ev = next(events, None)
+            block += RECORD.pack(int(season), int(week), int(home), int(away), int(gh), int(ga),
+                                 len(codes) // 2, bytes(codes))
+            n += 1
+            if n % CHUNK_ROWS == 0:
+                f.write(block)
+                block.clear()
+        f.write(block)
+    return n
+
+def import_tables(root: str, save_path: str, archive_path: str | None = None) -> Dict[str, int]:
+    """Grava um save (e, com `archive_path`, o arquivo de partidas) a partir
+    das tabelas de `export_tables`. As finanças recomeçam do zero."""
+    with open(os.path.join(root, "meta.json"), encoding="utf-8") as f:
+        info = json.load(f)
+    fmt = info.get("format", "csv")
+    docs, players = [], 0
+    for doc in _club_docs(root, fmt):
+        players += len(doc["squad"]) + len(doc["youth"])
+        docs.append(encode_chunk(doc))  # só o clube comprimido fica na memória
+    league = None
+    if info.get("state_league"):
+        league = dict(info["state_league"], fixtures=_fixtures(root, fmt))
+    write_save(save_path, info["meta"], docs, league, None, info["next_player_id"], week=info["week"])
+    counts = {"clubs": len(docs), "players": players}
+    if archive_path is not None and os.path.exists(_table_path(root, "results", fmt)):
+        counts["results"] = _import_results(root, fmt, archive_path)
+    return counts
+
+def main(argv: List[str] | None = None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Tabelas (CSV/TSV) de uma carreira")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    d = sub.add_parser("dump", help="save (+ arquivo de partidas) -> tabelas")
+    d.add_argument("save")
+    d.add_argument("out")
+    d.add_argument("--results", help="arquivo de partidas (archive)")
+    d.add_argument("--format", choices=list(FORMATS), default="csv")
+    ld = sub.add_parser("load", help="tabelas -> save (+ arquivo de partidas)")
+    ld.add_argument("src")
+    ld.add_argument("save")
+    ld.add_argument("--results", help="arquivo de partidas a remontar")
+    args = ap.parse_args(argv)
+    t0 = time.perf_counter()
+    if args.cmd == "dump":
+        from .persistence import load_game
+        clubs, meta, league = load_game(args.save)
+        counts = export_tables(clubs, meta, args.out, league, args.results, args.format)
+    else:
+        counts = import_tables(args.src, args.save, args.results)
+    dt = time.perf_counter() - t0
+    rows = sum(counts.values())
+    print(", ".join(f"{k}: {v:,}" for k, v in counts.items()) + f"  ({dt:.2f}s, {rows / dt:,.0f} linhas/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Finanças dos clubes: salários, bilheteria, TV, patrocínio e custeio.
+
+`Ledger` guarda as taxas semanais de cada clube em arrays alinhados com
+o universo (`Club.id`). As taxas só mudam em `refresh` (virada de
+temporada, transferências); a semana fecha numa passada em bloco sobre
+os arrays (`close_week`), que credita o saldo em `Club.budget` e acrescenta
+uma linha à série histórica: o saldo líquido de cada clube, em int32.
+"""
+from __future__ import annotations
+from array import array
+from operator import add, sub
+from typing import TYPE_CHECKING, Dict, Iterable, List
+import base64, math, zlib
+
+from .models import Club, Player
+from .ratings import BASE_RATING, squad_rating
+
+if TYPE_CHECKING:
+    from .ids import Universe
+
+WAGE_PER_OVERALL2 = 8     # salário semanal: R$ por ponto de overall ao quadrado
+YOUTH_WAGE = 2_000        # ajuda de custo semanal de quem é da base
+TV_WEEKLY = 400_000       # cota de TV, igual para todos
+SPONSOR_WEEKLY = 350_000  # patrocínio de um clube de rating médio
+GATE_PER_GAME = 450_000   # bilheteria de um jogo em casa de um clube médio
+UPKEEP_WEEKLY = 120_000   # estrutura, viagens e comissão técnica
+DRAW_PER_400 = 1.0        # log-razão de público/patrocínio a cada 400 de rating
+
+CATEGORIES = ("bilheteria", "tv", "patrocínio", "salários", "custeio")
+EXPENSES = ("salários", "custeio")
+
+def wage(p: Player) -> int:
+    return WAGE_PER_OVERALL2 * p.overall() ** 2
+
+def wage_bill(club: Club) -> int:
+    return sum(wage(p) for p in club.squad) + YOUTH_WAGE * len(club.youth)
+
+def appeal(club: Club) -> float:
+    """Quanto o clube atrai de público e patrocínio (1 = clube médio)."""
+    return math.exp(DRAW_PER_400 * ((club.elo or squad_rating(club)) - BASE_RATING) / 400)
+
+def _zeros(n: int) -> array:
+    return array("q", bytes(8 * n))
+
+class Ledger:
+    """Livro-caixa semanal de todos os clubes de um universo.
+
+    `rates[cat]` é o valor semanal de cada categoria (despesas positivas);
+    a bilheteria (`gate`, por jogo) entra jogo a jogo em `close_week`. `season[cat]` soma a
+    temporada corrente e `history` tem o saldo líquido de cada semana
+    (semana a semana, um valor por clube).
+    """
+    def __init__(self, universe: Universe):
+        # as taxas saem em `refresh`, chamado por `Universe.reindex`
+        self.universe = universe
+        self.rates: Dict[str, array] = {}
+        self.gate = array("q")  # bilheteria de cada jogo em casa
+        self.season: Dict[str, array] = {}
+        self.history = array("i")
+        self.weeks = 0
+        self._pending = 0  # semanas fechadas com as taxas atuais, ainda fora de `season`
+
+    def __len__(self) -> int:
+        return len(self.universe)
+
+    def refresh(self, clubs: Iterable[Club] | None = None):
+        """Recalcula as taxas (de todos, ou só de `clubs`): elenco e rating mudaram."""
+        n = len(self.universe)
+        if any(len(a) != n for a in self.season.values()) or not self.season:
+            # universo novo (ou de outro tamanho): começa do zero
+            self.rates = {cat: _zeros(n) for cat in CATEGORIES if cat != "bilheteria"}
+            self.gate = _zeros(n)
+            self.season = {cat: _zeros(n) for cat in CATEGORIES}
+            self.history, self.weeks, self._pending = array("i"), 0, 0
+            clubs = None
+        self._fold()
+        rates = self.rates
+        for c in self.universe if clubs is None else clubs:
+            a = appeal(c)
+            self.gate[c.id] = round(GATE_PER_GAME * a)
+            rates["tv"][c.id] = TV_WEEKLY
+            rates["patrocínio"][c.id] = round(SPONSOR_WEEKLY * a)
+            rates["salários"][c.id] = wage_bill(c)
+            rates["custeio"][c.id] = UPKEEP_WEEKLY
+
+    def _fold(self):
+        """Leva para `season` as semanas fechadas com as taxas atuais."""
+        w = self._pending
+        if w:
+            for cat, rate in self.rates.items():
+                total = self.season[cat]
+                for i, r in enumerate(rate):
+                    total[i] += r * w
+            self._pending = 0
+
+    def close_week(self, home: Iterable[int] = ()):
+        """Fecha a semana: `home` são os ids dos mandantes que jogaram."""
+        clubs, rates, per_game = self.universe, self.rates, self.gate
+        gate = _zeros(len(clubs))
+        for cid in home:
+            gate[cid] += per_game[cid]
+        income = map(add, map(add, rates["tv"], rates["patrocínio"]), gate)
+        costs = map(add, rates["salários"], rates["custeio"])
+        net = array("i", map(sub, income, costs))
+        for c, x in zip(clubs, net):
+            c.budget += x
+        season = self.season
+        season["bilheteria"] = array("q", map(add, season["bilheteria"], gate))
+        self.history.extend(net)
+        self.weeks += 1
+        self._pending += 1
+
+    def new_season(self):
+        """Zera a temporada e refaz as taxas (elencos e ratings novos)."""
+        self._pending = 0
+        for total in self.season.values():
+            total[:] = _zeros(len(total))
+        self.refresh()
+
+    def statement(self, club: Club) -> Dict[str, int]:
+        """Receitas e despesas da temporada do clube (despesas negativas)."""
+        i, w = club.id, self._pending
+        out = {"bilheteria": self.season["bilheteria"][i]}
+        for cat, rate in self.rates.items():
+            total = self.season[cat][i] + rate[i] * w
+            out[cat] = -total if cat in EXPENSES else total
+        out["saldo"] = sum(out.values())
+        return out
+
+    def net_series(self, club: Club) -> List[int]:
+        """Saldo líquido de cada semana fechada, da mais antiga à atual."""
+        return self.history[club.id::len(self.universe)].tolist()
+
+    def serialize(self) -> Dict:
+        self._fold()
+        return {"weeks": self.weeks,
+                "history": base64.b64encode(zlib.compress(self.history.tobytes())).decode(),
+                "season": {cat: total.tolist() for cat, total in self.season.items()},
+                "rates": {cat: rate.tolist() for cat, rate in self.rates.items()},
+                "gate": self.gate.tolist()}
+
+    def restore(self, doc: Dict | None):
+        """Volta histórico, totais e taxas gravados por `serialize`.
+
+        As taxas ficam como estavam (só mudam em `refresh`); saves sem
+        elas, ou de outro tamanho, ficam com as recalculadas dos elencos."""
+        n = len(self.universe)
+        if not doc or any(len(v) != n for v in doc["season"].values()):
+            return
+        self.history = array("i")
+        self.history.frombytes(zlib.decompress(base64.b64decode(doc["history"])))
+        self.weeks = doc["weeks"]
+        self.season = {cat: array("q", v) for cat, v in doc["season"].items()}
+        self._pending = 0
+        rates = doc.get("rates")
+        if rates and set(rates) == set(self.rates) and len(doc.get("gate", ())) == n \
+                and all(len(v) == n for v in rates.values()):
+            self.rates = {cat: array("q", v) for cat, v in rates.items()}
+            self.gate = array("q", doc["gate"])
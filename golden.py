@@ -0,0 +1,313 @@
+"""
+Seeds de referência: determinismo e desempenho de cada etapa do jogo.
+
+Cada etapa (`STAGES`) roda com seeds fixas e vira uma impressão digital
+(sha256 das linhas canônicas do que produziu) e algumas métricas. `check`
+compara com `GOLDEN_PATH`, gravado por `update`:
+
+* exato (padrão): a impressão digital tem de ser a mesma. Qualquer
+  mudança de resultado, por menor que seja (um sorteio a mais no rng),
+  aparece aqui;
+* estatístico (`--stat`): para motores mais rápidos que sorteiam de outro
+  jeito, vale a média das métricas nas seeds, dentro de `TOLERANCES`.
+
+O tempo de cada etapa (melhor de `--repeat`, só a parte medida, sem a
+preparação) tem de caber em `BUDGETS`, multiplicado por `--budget-scale`
+em máquinas mais lentas. Com `--repeat` > 1, repetições com impressões
+diferentes acusam não determinismo dentro do mesmo processo.
+
+    python -m football_world.golden check
+    python -m football_world.golden check --stat --stage match --stage season
+    python -m football_world.golden update      # depois de uma mudança intencional
+"""
+from __future__ import annotations
+from dataclasses import astuple, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+import argparse, hashlib, json, os, random, sys, time
+
+from .data import generate_club_rosters
+from .ratings import ELO
+from .sim import MatchEngine
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden.json")
+SEEDS = (1, 7, 42)
+CLUBS = 6       # clubes por estado em todas as etapas
+MATCHES = 400   # partidas ao vivo da etapa `match`
+WEEKS = 3       # rodadas da etapa `week` (caminho dos CLIs)
+SEASONS = 1     # temporadas completas da etapa `season`
+
+# segundos por seed (só a parte medida); folgados para não acusar ruído
+BUDGETS: Dict[str, float] = {"generation": 1.0, "schedule": 0.2, "match": 1.0, "week": 1.0, "season": 2.5}
+# modo estatístico: diferença aceita na média de cada métrica sobre as
+# seeds (cerca de três desvios do ruído dos sorteios); as demais métricas
+# aceitam `TOLERANCE` relativa
+TOLERANCES: Dict[str, float] = {"gols/jogo": 0.15, "empates": 0.04, "mandante": 0.07, "lances/jogo": 0.5,
+                                "overall": 1.0, "base": 1.0, "potencial": 1.0}
+TOLERANCE = 0.05
+
+Rows = Iterable[tuple]
+
+def _canon(v: Any) -> Any:
+    """Floats arredondados: a impressão não depende da última casa da plataforma."""
+    if isinstance(v, float):
+        return round(v, 6)
+    if isinstance(v, (tuple, list)):
+        return tuple(_canon(x) for x in v)
+    if isinstance(v, dict):
+        return tuple((k, _canon(v[k])) for k in sorted(v))
+    return v
+
+def digest(rows: Rows) -> str:
+    h = hashlib.sha256()
+    for row in rows:
+        h.update(repr(_canon(row)).encode())
+        h.update(b"\n")
+    return h.hexdigest()
+
+def _universe(seed: int):
+    from .data import generate_universe
+    random.seed(seed)  # quem ainda usa o `random` global também fica fixo
+    return generate_universe(seed, CLUBS)
+
+def _player_rows(clubs) -> Rows:
+    for c in clubs:
+        for group in (c.squad, c.youth):
+            for p in group:
+                yield (c.id,) + astuple(p)
+
+def _mean(values: List[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+# --- etapas: preparar (fora do tempo) e rodar (medido) ---
+
+def _generation(seed: int) -> Callable[[], Tuple[list, Dict[str, float]]]:
+    def run():
+        data = generate_club_rosters(CLUBS, 28, 18, seed=seed)
+        rows, squad, youth = [], [], []
+        for (abbr, _), clubs in data.items():
+            for cd in clubs:
+                rows.append((abbr, cd["name"], cd["budget"]))
+                for group, out in (("squad", squad), ("youth", youth)):
+                    for p in cd[group]:
+                        rows.append((group,) + _canon(p))
+                        out.append(p)
+        ovr = lambda p: (p["strength"] + p["technique"] + p["speed"]) / 3
+        return rows, {"overall": _mean([ovr(p) for p in squad]), "base": _mean([ovr(p) for p in youth]),
+                      "potencial": _mean([p["potential"] for p in youth])}
+    return run
+
+def _schedule(seed: int):
+    from .cups import national_cup
+    from .season import build_state_leagues
+    clubs = _universe(seed)
+
+    def run():
+        leagues = build_state_leagues(clubs, 1, seed)
+        cup = national_cup(clubs, start_week=1, seed=seed * 1000 + 1, ratings=ELO)
+        rows = [(abbr, f.week, f.home, f.away) for abbr, lg in leagues.items() for f in lg.fixtures]
+        rows += [("copa", t.home, t.away, t.legs, t.winner) for t in cup.ties]
+        # equilíbrio de mandos: cada clube manda metade dos jogos
+        home = {}
+        for _, _, h, a in rows[:len(rows) - len(cup.ties)]:
+            home[h] = home.get(h, 0) + 1
+            home[a] = home.get(a, 0) - 1
+        return rows, {"jogos": float(len(rows) - len(cup.ties)),
+                      "semanas": float(max(lg.total_weeks for lg in leagues.values())),
+                      "desequilíbrio": float(max(abs(v) for v in home.values()))}
+    return run
+
+def _match(seed: int):
+    clubs = _universe(seed)
+
+    def run():
+        engine = MatchEngine(random.Random(seed))
+        rows, goals, draws, margin, events = [], 0, 0, 0, 0
+        n = len(clubs)
+        for i in range(MATCHES):
+            h, a = clubs[i % n], clubs[(i * 7 + 1 + i // n) % n]
+            if h is a:
+                continue
+            res = engine.simulate(h, a, register=False)
+            rows.append((res.home, res.away, res.goals_home, res.goals_away,
+                         tuple((e.minute, e.club, e.player, e.kind) for e in res.timeline)))
+            goals += res.goals_home + res.goals_away
+            draws += res.goals_home == res.goals_away
+            margin += (res.goals_home > res.goals_away) - (res.goals_home < res.goals_away)
+            events += len(res.timeline)
+        games = max(1, len(rows))
+        return rows, {"gols/jogo": goals / games, "empates": draws / games, "mandante": margin / games,
+                      "lances/jogo": events / games}
+    return run
+
+def _week(seed: int):
+    """Rodadas do jeito dos CLIs (`season.play_week`, com os eventos da semana)."""
+    from .season import play_week
+    from .events import Inbox
+    from .leagues import StateLeague
+    clubs = _universe(seed)
+    mine = clubs[seed % len(clubs)]
+    meta = {"seed": seed, "season": 1, "team_id": mine.id}
+    league = StateLeague(mine.state_abbr, clubs, seed=seed * 1000 + 1)
+
+    def run():
+        rows, goals, games = [], 0, 0
+        for _ in range(WEEKS):
+            news = Inbox()
+            for r in play_week(clubs, meta, league, save_path=None, inbox=news):
+                rows.append((r.home, r.away, r.goals_home, r.goals_away,
+                             tuple((e.minute, e.club, e.player, e.kind) for e in r.timeline)))
+                goals += r.goals_home + r.goals_away
+                games += 1
+            rows.append(("evento", " ".join(news)))
+        rows += _player_rows(clubs)
+        rows += [(c.id, c.points, c.goals_for, c.goals_against, c.elo, c.budget) for c in clubs]
+        return rows, {"gols/jogo": goals / max(1, games),
+                      "overall": _mean([p.overall() for c in clubs for p in c.squad])}
+    return run
+
+def _season(seed: int):
+    from .balance import Tally
+    from .cups import national_cup
+    from .season import build_state_leagues, end_of_season, simulate_season
+    clubs = _universe(seed)
+
+    def run():
+        tally = Tally()
+        engine = MatchEngine(random.Random(seed), stats=tally, ratings=ELO, calendar=clubs.calendar)
+        meta = {"seed": seed, "season": 1}
+        rows = []
+        for _ in range(SEASONS):
+            leagues = build_state_leagues(clubs, meta["season"], seed)
+            cups = [national_cup(clubs, start_week=1, seed=seed * 1000 + meta["season"], ratings=ELO)]
+            simulate_season(clubs, leagues, engine, None, meta["season"], cups, finals=True, seed=seed, events=True)
+            report = end_of_season(clubs, meta, cups=cups)
+            tally.champions(report.champions)
+            rows.append(astuple(report))
+        rows += _player_rows(clubs)
+        rows += [(c.id, c.elo, c.budget) for c in clubs]
+        metrics = {k: tally.metrics()[k] for k in ("gols/jogo", "empates", "mandante")}
+        metrics["overall"] = _mean([p.overall() for c in clubs for p in c.squad])
+        metrics["base"] = _mean([p.overall() for c in clubs for p in c.youth])
+        return rows, metrics
+    return run
+
+STAGES: Dict[str, Callable[[int], Callable[[], Tuple[list, Dict[str, float]]]]] = {
+    "generation": _generation, "schedule": _schedule, "match": _match, "week": _week, "season": _season,
+}
+
+# --- execução e comparação ---
+
+@dataclass
+class StageRun:
+    stage: str
+    seed: int
+    digest: str
+    metrics: Dict[str, float]
+    seconds: float  # melhor das repetições
+    stable: bool = True  # todas as repetições deram a mesma impressão
+
+def run_stage(stage: str, seed: int, repeat: int = 1) -> StageRun:
+    digests, best = set(), float("inf")
+    for _ in range(max(1, repeat)):
+        run = STAGES[stage](seed)  # cada repetição parte do zero
+        t0 = time.perf_counter()
+        rows, metrics = run()
+        best = min(best, time.perf_counter() - t0)
+        digests.add(digest(rows))
+    return StageRun(stage, seed, digests.pop(), metrics, best, not digests)
+
+@dataclass
+class Verdict:
+    stage: str
+    failures: List[str] = field(default_factory=list)
+    lines: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+def _config() -> Dict[str, int]:
+    return {"clubs": CLUBS, "matches": MATCHES, "weeks": WEEKS, "seasons": SEASONS}
+
+def load_golden(path: str = GOLDEN_PATH) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def update(stages: Iterable[str], seeds: Iterable[int] = SEEDS, path: str = GOLDEN_PATH) -> Dict[str, Any]:
+    """Regrava as referências das etapas pedidas (as demais ficam como estão)."""
+    try:
+        golden = load_golden(path)
+    except (OSError, ValueError):
+        golden = {}
+    golden.setdefault("stages", {})
+    golden["config"] = _config()
+    for stage in stages:
+        ref = golden["stages"][stage] = {}
+        for seed in seeds:
+            r = run_stage(stage, seed)
+            ref[str(seed)] = {"digest": r.digest, "metrics": r.metrics}
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(golden, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+    return golden
+
+def check(stages: Iterable[str], stat: bool = False, repeat: int = 1, budget_scale: float = 1.0,
+          path: str = GOLDEN_PATH) -> List[Verdict]:
+    golden = load_golden(path)
+    if golden.get("config") != _config():
+        raise ValueError(f"referências gravadas com outra configuração: {golden.get('config')}")
+    verdicts = []
+    for stage in stages:
+        v = Verdict(stage)
+        ref = golden["stages"].get(stage)
+        if not ref:
+            v.failures.append("sem referência (rode `update`)")
+            verdicts.append(v)
+            continue
+        runs = [run_stage(stage, int(seed), repeat) for seed in ref]
+        budget = BUDGETS[stage] * budget_scale
+        for r in runs:
+            exact = r.digest == ref[str(r.seed)]["digest"]
+            v.lines.append(f"seed {r.seed:3d}  {r.seconds * 1000:7.1f} ms  {'igual' if exact else 'DIFERENTE'}")
+            if not r.stable:
+                v.failures.append(f"seed {r.seed}: repetições com resultados diferentes (não determinístico)")
+            if not exact and not stat:
+                v.failures.append(f"seed {r.seed}: impressão digital diferente da referência")
+            if r.seconds > budget:
+                v.failures.append(f"seed {r.seed}: {r.seconds:.3f}s acima do orçamento de {budget:.3f}s")
+        if stat:
+            for k in ref[str(runs[0].seed)]["metrics"]:
+                want = _mean([ref[s]["metrics"][k] for s in ref])
+                got = _mean([r.metrics.get(k, 0.0) for r in runs])
+                ok = abs(got - want) <= TOLERANCES.get(k, TOLERANCE * abs(want))
+                v.lines.append(f"  {k:15s} {got:8.3f}  ref {want:8.3f}  {'ok' if ok else 'FORA'}")
+                if not ok:
+                    v.failures.append(f"{k}: {got:.3f} longe da referência {want:.3f}")
+        verdicts.append(v)
+    return verdicts
+
+def main(argv: List[str] | None = None):
+    ap = argparse.ArgumentParser(description="Determinismo e desempenho com seeds de referência")
+    ap.add_argument("cmd", choices=("check", "update"))
+    ap.add_argument("--stage", action="append", choices=list(STAGES), help="etapa (padrão: todas)")
+    ap.add_argument("--stat", action="store_true", help="compara as métricas, não a impressão digital")
+    ap.add_argument("--repeat", type=int, default=1, help="repetições por seed (melhor tempo)")
+    ap.add_argument("--budget-scale", type=float, default=1.0, help="multiplica os orçamentos de tempo")
+    args = ap.parse_args(argv)
+    stages = args.stage or list(STAGES)
+    if args.cmd == "update":
+        update(stages)
+        print(f"referências de {', '.join(stages)} gravadas em {GOLDEN_PATH}")
+        return
+    failed = 0
+    for v in check(stages, args.stat, args.repeat, args.budget_scale):
+        print(f"{v.stage:11s} {'ok' if v.ok else 'FALHOU'}")
+        for line in v.lines + [f"  ! {f}" for f in v.failures]:
+            print(f"  {line}")
+        failed += not v.ok
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
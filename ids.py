@@ -0,0 +1,98 @@
+"""
+Ids inteiros para clubes e jogadores.
+
+O `id` de um clube é a sua posição na lista do universo; jogadores recebem
+ids sequenciais que não são reaproveitados. Calendários, lances,
+resultados e o arquivo de partidas guardam apenas esses inteiros e a busca
+vira indexação (`universe[club_id]`, `universe.player(pid)`). Nomes são só
+rótulos: podem se repetir ou mudar sem afetar nenhuma referência.
+"""
+from __future__ import annotations
+from typing import Dict, Iterable, List
+import sys
+
+from .models import Club, Player
+from .status import StatusCalendar
+from .finance import Ledger
+
+class NameTable:
+    """Nomes internados: cada nome distinto é guardado uma única vez."""
+    __slots__ = ("names", "index")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        i = self.index.get(name)
+        if i is None:
+            i = self.index[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return i
+
+    def __getitem__(self, i: int) -> str:
+        return self.names[i]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+class Universe(list):
+    """Lista de clubes indexada por `Club.id`, com a tabela de jogadores.
+
+    `players[pid]` é o jogador com aquele id (None depois de aposentado ou
+    dispensado). Quem cria jogadores no meio da carreira chama `add`.
+    `calendar` agenda a volta de lesionados e suspensos e `ledger` fecha as
+    finanças da semana.
+    """
+    def __init__(self, clubs: Iterable[Club] = (), next_player_id: int = 0, week: int = 0):
+        super().__init__(clubs)
+        self.players: List[Player | None] = [None] * next_player_id
+        self.calendar = StatusCalendar(self, week)
+        self.ledger = Ledger(self)
+        self.reindex()
+
+    def reindex(self):
+        """Renumera os clubes pela posição e registra todos os jogadores.
+
+        Ids de jogador já atribuídos (ex.: vindos do save) são mantidos;
+        ausentes ou repetidos recebem um novo.
+        """
+        everyone = []
+        for i, c in enumerate(self):
+            c.id = i
+            everyone += c.squad
+            everyone += c.youth
+        top = max((p.id for p in everyone), default=-1)
+        players = self.players = [None] * max(len(self.players), top + 1)
+        fresh = []
+        for p in everyone:
+            if p.id < 0 or players[p.id] is not None:
+                fresh.append(p)
+            else:
+                players[p.id] = p
+        for p in fresh:
+            self.add(p)
+        self.calendar.rebuild()
+        self.ledger.refresh()
+
+    def add(self, p: Player) -> int:
+        p.id = len(self.players)
+        self.players.append(p)
+        return p.id
+
+    def release(self, p: Player):
+        """Tira o jogador da tabela (o id não volta a ser usado)."""
+        if 0 <= p.id < len(self.players) and self.players[p.id] is p:
+            self.players[p.id] = None
+
+    def player(self, pid: int) -> Player | None:
+        return self.players[pid]
+
+    def find(self, name: str) -> Club | None:
+        """Primeiro clube com esse nome (só para saves antigos/entrada do usuário)."""
+        return next((c for c in self if c.name == name), None)
+
+def as_universe(clubs: Iterable[Club]) -> Universe:
+    return clubs if isinstance(clubs, Universe) else Universe(clubs)
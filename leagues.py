@@ -9,17 +9,43 @@ from .models import Club
 @dataclass
 class Fixture:
     week: int
-    home: str
-    away: str
+    home: int  # Club.id
+    away: int
+
+BYE = -1
+
+def round_robin(teams: List[int]) -> List[List[Tuple[int, int]]]:
+    """Rodadas de um turno pelo algoritmo do círculo (BYE folga se ímpar)."""
+    teams = list(teams)
+    n = len(teams)
+    if n % 2 == 1:
+        teams.append(BYE)  # se ímpar, adiciona BYE
+        n += 1
+    left = teams[: n//2]
+    right = teams[n//2:][::-1]
+    rounds: List[List[Tuple[int, int]]] = []
+    for _ in range(n-1):
+        pairs = []
+        for i in range(n//2):
+            home, away = left[i], right[i]
+            if BYE not in (home, away):
+                pairs.append((home, away))
+        rounds.append(pairs)
+        # rotaciona mantendo o primeiro time fixo
+        if n > 2:
+            left, right = [left[0], right[0]] + left[1:-1], right[1:] + [left[-1]]
+    return rounds
 
 class StateLeague:
     """Campeonato estadual com turno e returno (round-robin duplo).
     Gera tabela de confrontos (fixtures) e aponta a semana atual.
+    Os confrontos guardam `Club.id`: `clubs` deve ser um `ids.Universe`.
     """
     def __init__(self, state_abbr: str, clubs: List[Club], seed: int = 42):
         # mantém apenas clubes do estado
         self.state_abbr = state_abbr
         self.clubs = [c for c in clubs if c.state_abbr == state_abbr]
+        self.seed = seed
         self.rng = random.Random(seed)
         self.fixtures: List[Fixture] = []
         self._build_double_round_robin()
@@ -28,29 +54,10 @@ class StateLeague:
         self.current_week: int = 1
 
     def _build_double_round_robin(self):
-        teams = [c.name for c in self.clubs]
-        n = len(teams)
-        if n % 2 == 1:
-            teams.append("BYE")  # se ímpar, adiciona BYE
-            n += 1
-        # Algoritmo do círculo para round-robin
-        left = teams[: n//2]
-        right = teams[n//2:][::-1]
-
+        teams = [c.id for c in self.clubs]
+        self.rng.shuffle(teams)  # varia o calendário entre temporadas
+        rounds = round_robin(teams)
         week = 1
-        rounds: List[List[Tuple[str, str]]] = []
-        for _ in range(n-1):
-            pairs = []
-            for i in range(n//2):
-                home, away = left[i], right[i]
-                if "BYE" not in (home, away):
-                    pairs.append((home, away))
-            rounds.append(pairs)
-            # rotaciona
-            keep = left[0]
-            left = [keep] + [right[0]] + left[1:-0 if len(left)>1 else None]
-            right = right[1:] + [left[-1]]
-            left = left[:-1]
 
         # turno (ida)
         for r in rounds:
@@ -67,7 +74,7 @@ class StateLeague:
         return [f for f in self.fixtures if f.week == week]
 
     def advance_week(self):
-        if self.current_week < self.total_weeks:
+        if self.current_week <= self.total_weeks:
             self.current_week += 1
 
     def is_finished(self) -> bool:
@@ -78,7 +85,7 @@ class StateLeague:
             "state_abbr": self.state_abbr,
             "current_week": self.current_week,
             "fixtures": [f.__dict__ for f in self.fixtures],
-            "seed": self.rng.seed if hasattr(self.rng, "seed") else 42,
+            "seed": self.seed,
         }
 
     @staticmethod
@@ -86,6 +93,11 @@ class StateLeague:
         lg = StateLeague(data["state_abbr"], clubs, seed=data.get("seed", 42))
         # overwrite generated fixtures with saved ones to preserve week mapping
         lg.fixtures = [Fixture(**f) for f in data["fixtures"]]
+        if lg.fixtures and isinstance(lg.fixtures[0].home, str):
+            # saves antigos referenciavam os clubes pelo nome
+            ids = {c.name: c.id for c in reversed(lg.clubs)}
+            for f in lg.fixtures:
+                f.home, f.away = ids[f.home], ids[f.away]
         lg.current_week = data["current_week"]
         lg.total_weeks = max((f.week for f in lg.fixtures), default=0)
         return lg
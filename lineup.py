@@ -0,0 +1,161 @@
+from __future__ import annotations
+from typing import Callable, Dict, List
+
+from .sampling import AliasTable
+
+XI_SIZE = 11
+BENCH_SIZE = 7
+
+# Peso de cada jogador em campo por tipo de lance
+CARD_PRONE = {"Indisciplinado": 3.0, "Pavio curto": 2.0}
+INJURY_PRONE = {"Frágil": 3.0}
+INVOLVEMENT: Dict[str, Callable] = {
+    "goal": lambda p: p.speed + p.technique,
+    "card": lambda p: CARD_PRONE.get(p.personality, 1.0),
+    "injury": lambda p: INJURY_PRONE.get(p.personality, 1.0),
+    "any": lambda p: 1.0,
+}
+
+def is_available(p) -> bool:
+    return not getattr(p, "injured", False) and getattr(p, "suspended", 0) == 0
+
+def _overall(p) -> float:
+    return p.overall()
+
+def _drop(lst: List, p) -> bool:
+    """Remove `p` por identidade (dataclasses comparam por valor)."""
+    for i, q in enumerate(lst):
+        if q is p:
+            del lst[i]
+            return True
+    return False
+
+class Lineup:
+    """Titulares, banco e desfalques de um clube.
+
+    O pool de aptos é montado uma vez e depois mantido incrementalmente:
+    lesões trocam o titular pelo melhor reserva e expulsões tiram o jogador
+    de campo. A escalação só é refeita quando o elenco muda (`invalidate`)
+    ou alguém volta a ficar apto (`recover`, chamado pelo calendário de
+    desfalques em status.py).
+    """
+    __slots__ = ("players", "xi", "bench", "out", "_dirty", "_reselect", "_tables")
+
+    def __init__(self, players: List):
+        self.players = players  # a própria lista do clube (squad)
+        self.xi: List = []
+        self.bench: List = []
+        self.out: List = []
+        self._dirty = True       # elenco mudou: refazer antes de qualquer uso
+        self._reselect = False   # refazer só no próximo pontapé inicial
+        self._tables: Dict[str, AliasTable] = {}
+
+    def invalidate(self):
+        self._dirty = True
+
+    def _ensure(self):
+        if self._dirty:
+            self.refresh()
+
+    def refresh(self):
+        pool, out = [], []
+        for p in self.players:
+            (pool if is_available(p) else out).append(p)
+        pool.sort(key=_overall, reverse=True)
+        self.xi = pool[:XI_SIZE]
+        self.bench = pool[XI_SIZE:XI_SIZE + BENCH_SIZE]
+        self.out = out
+        self._dirty = self._reselect = False
+        self._tables.clear()
+
+    def kickoff(self) -> List:
+        """Escalação para a próxima partida (refeita só se necessário)."""
+        if self._dirty or self._reselect:
+            self.refresh()
+        return self.xi
+
+    def starters(self) -> List:
+        self._ensure()
+        return self.xi
+
+    def rating(self, default: float = 0.0) -> float:
+        xi = self.kickoff()
+        if not xi:
+            return default
+        return sum(p.overall() for p in xi) / len(xi)
+
+    def strength(self) -> float:
+        """Força de quem está em campo agora (desfalques contam como zero)."""
+        return sum(p.overall() for p in self.xi) / XI_SIZE
+
+    def substitute(self, out, on) -> bool:
+        """Troca um titular por um reserva durante a partida."""
+        self._ensure()
+        if not any(q is on for q in self.bench) or not _drop(self.xi, out):
+            return False
+        _drop(self.bench, on)
+        self.xi.append(on)
+        self._tables.clear()
+        self._reselect = True
+        return True
+
+    def pick(self, role: str, rng):
+        """Sorteia um titular pelo peso de envolvimento `role` (ver INVOLVEMENT).
+
+        A tabela de alias de cada papel é montada uma vez por escalação e
+        descartada quando alguém sai de campo.
+        """
+        table = self._tables.get(role)
+        if table is None:
+            xi = self.starters() or self.players
+            weight = INVOLVEMENT[role]
+            table = self._tables[role] = AliasTable(xi, [weight(p) for p in xi])
+        return table.sample(rng)
+
+    def injure(self, p):
+        """Lesão: sai do time e, se era titular, entra o melhor reserva."""
+        self._ensure()
+        was_out = not is_available(p)
+        p.injured = True
+        if was_out:
+            return
+        self._tables.clear()
+        if _drop(self.xi, p):
+            if self.bench:
+                self.xi.append(self.bench.pop(0))
+        else:
+            _drop(self.bench, p)
+        self.out.append(p)
+
+    def send_off(self, p, games: int = 1):
+        """Expulsão: fica fora da partida (sem reposição) e cumpre suspensão."""
+        self._ensure()
+        was_out = not is_available(p)
+        p.suspended += games
+        if was_out:
+            return
+        self._tables.clear()
+        if not _drop(self.xi, p):
+            _drop(self.bench, p)
+        self.out.append(p)
+        # a próxima partida volta a ter onze
+        self._reselect = True
+
+    def recover(self, p):
+        """Fim de lesão/suspensão: volta a contar na próxima escalação."""
+        p.injured = False
+        p.suspended = 0
+        self._reselect = True
+
+def lineup_of(team) -> Lineup:
+    """Escalação em cache do clube (`Club.squad`).
+
+    Fica guardada no próprio objeto, fora dos campos do dataclass, e é
+    recriada se a lista do elenco for substituída.
+    """
+    roster = team.squad
+    lu = team.__dict__.get("_lineup")
+    if lu is None or lu.players is not roster:
+        lu = Lineup(roster)
+        team._lineup = lu
+    return lu
@@ -0,0 +1,90 @@
+"""
+Teste de carga do servidor de carreiras.
+
+Sobe um servidor local (ou usa --port de um já rodando) e dispara N
+clientes simultâneos; cada um cria uma carreira, treina e joga algumas
+rodadas. Ao final mostra latências (p50/p95/p99) por comando.
+
+    python -m football_world.loadtest --clients 200 --weeks 3
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Dict, List
+import argparse, asyncio, json, random, shutil, tempfile, time
+
+from .data import BR_STATES
+from .server import serve
+
+async def _client(i: int, port: int, weeks: int, lat: Dict[str, List[float]], errors: List[str]):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 22)
+    rng = random.Random(i)
+
+    async def call(req: Dict):
+        t0 = time.perf_counter()
+        writer.write(json.dumps(req).encode() + b"\n")
+        await writer.drain()
+        resp = json.loads(await reader.readline())
+        lat[req["cmd"]].append(time.perf_counter() - t0)
+        if not resp.get("ok"):
+            errors.append(f"cliente {i}: {req['cmd']}: {resp.get('error')}")
+        return resp
+
+    abbr = rng.choice(BR_STATES)[0]
+    await call({"cmd": "new", "career": f"load{i}", "coach": f"Técnico {i}", "state": abbr,
+                "club": rng.randrange(6), "seed": i + 1})
+    for _ in range(weeks):
+        await call({"cmd": "train", "focus": rng.choice(["strength", "technique", "speed", "morale"])})
+        await call({"cmd": "play"})
+        await call({"cmd": "table"})
+    # reabre depois de possivelmente ter sido despejada
+    await call({"cmd": "open", "career": f"load{i}"})
+    writer.write(b'{"cmd": "quit"}\n')
+    await writer.drain()
+    writer.close()
+
+def _pct(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+async def run(clients: int, weeks: int, port: int | None, hot: int, workers: int | None):
+    server_task, saves = None, None
+    if port is None:
+        saves = tempfile.mkdtemp(prefix="fw-load-")
+        ready = asyncio.get_running_loop().create_future()
+        server_task = asyncio.create_task(serve("127.0.0.1", 0, saves, hot, workers, ready))
+        port = await ready
+
+    lat: Dict[str, List[float]] = defaultdict(list)
+    errors: List[str] = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_client(i, port, weeks, lat, errors) for i in range(clients)))
+    total = time.perf_counter() - t0
+
+    n = sum(len(v) for v in lat.values())
+    print(f"{clients} clientes, {n} comandos em {total:.2f}s ({n / total:.0f} cmd/s), {len(errors)} erros")
+    print("comando     n    p50(ms)  p95(ms)  p99(ms)")
+    for cmd, values in sorted(lat.items()):
+        print(f"{cmd:8s} {len(values):5d} {_pct(values, .5):9.1f} {_pct(values, .95):8.1f} {_pct(values, .99):8.1f}")
+    for e in errors[:5]:
+        print(" -", e)
+
+    if server_task is not None:
+        server_task.cancel()
+        try:
+            await server_task
+        except asyncio.CancelledError:
+            pass
+        shutil.rmtree(saves, ignore_errors=True)
+
+def main(argv: List[str] | None = None):
+    ap = argparse.ArgumentParser(description="Teste de carga do servidor de carreiras")
+    ap.add_argument("--clients", type=int, default=200)
+    ap.add_argument("--weeks", type=int, default=3)
+    ap.add_argument("--port", type=int, default=None, help="servidor já em execução (padrão: sobe um local)")
+    ap.add_argument("--hot", type=int, default=32)
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+    asyncio.run(run(args.clients, args.weeks, args.port, args.hot, args.workers))
+
+if __name__ == "__main__":
+    main()
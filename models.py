@@ -2,7 +2,9 @@
 from __future__ import annotations
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional
-import random
+
+from .training import train_squad
+from .lineup import lineup_of
 
 @dataclass
 class Player:
@@ -14,16 +16,19 @@ class Player:
     morale: int
     personality: str = "Neutro"
     isLegendary: bool = False
+    potential: int = 0  # teto de evolução (0–100); 0 = desconhecido
+    loyalty: int = 50   # 0–100; baixo = quer sair do clube
+    injured: bool = False
+    suspended: int = 0  # jogos de suspensão a cumprir
+    back_week: int = 0  # semana do calendário em que volta (status.StatusCalendar)
+    loan_weeks: int = 0  # semanas de empréstimo que faltam (academy; só base)
+    id: int = -1  # atribuído pelo universo (ids.Universe)
 
     def overall(self) -> int:
         return round((self.strength + self.technique + self.speed) / 3)
 
     def train(self, focus: str):
-        delta = random.randint(1, 3)
-        if focus == "strength": self.strength += delta
-        elif focus == "technique": self.technique += delta
-        elif focus == "speed": self.speed += delta
-        elif focus == "morale": self.morale = min(100, self.morale + 1)
+        train_squad((self,), focus)
 
 @dataclass
 class Club:
@@ -39,10 +44,17 @@ class Club:
     wins: int = 0
     draws: int = 0
     losses: int = 0
+    elo: float = 0.0  # rating (ratings.EloModel); 0 = ainda não avaliado
+    id: int = -1  # posição no universo (ids.Universe)
 
     def rating(self) -> float:
-        if not self.squad: return 50.0
-        return sum(p.overall() for p in self.squad) / len(self.squad)
+        """Média dos onze titulares aptos."""
+        return lineup_of(self).rating(50.0)
+
+    def reset_stats(self):
+        """Zera a classificação da temporada."""
+        self.points = self.goals_for = self.goals_against = 0
+        self.wins = self.draws = self.losses = 0
 
     def register_result(self, gf: int, ga: int):
         self.goals_for += gf
@@ -1,60 +1,348 @@
-
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from dataclasses import asdict
-import json, os
+import os, struct, zlib
 
 from .models import Club, Player, make_player
 from .leagues import StateLeague
+from .ids import NameTable, Universe, as_universe
+from .season import PEAK_AGE
 
-def save_game(filepath: str, clubs: List[Club], meta: Dict[str, Any], state_league: StateLeague | None = None) -> None:
+LEGACY_GROWTH_PER_YEAR = 2  # pontos de potencial por ano até o auge (saves antigos)
+
+def _player_to_dict(p: Player, names: NameTable | None) -> Dict[str, Any]:
+    d = asdict(p)
+    if names is not None:
+        d["name"] = names.intern(p.name)
+    return d
+
+def _player_from_dict(d: Dict[str, Any], names: NameTable | None) -> Player:
+    if isinstance(d["name"], int):
+        d = dict(d, name=names[d["name"]])
+    p = make_player(d)
+    if not p.potential:
+        backfill_potential(p)
+    return p
+
+def backfill_potential(p: Player):
+    """Saves de antes do potencial (0 = desconhecido): dá a quem ainda não
+    chegou ao auge uma margem de evolução pela idade, senão ninguém evolui."""
+    ovr = p.overall()
+    p.potential = min(100, ovr + LEGACY_GROWTH_PER_YEAR * max(0, PEAK_AGE - p.age))
+
+def club_to_dict(c: Club, names: NameTable | None = None) -> Dict[str, Any]:
+    """Com `names`, os nomes viram índices na tabela (gravada junto no save)."""
+    return {
+        "id": c.id,
+        "name": names.intern(c.name) if names is not None else c.name,
+        "state_abbr": c.state_abbr,
+        "state_name": c.state_name,
+        "budget": c.budget,
+        "points": c.points,
+        "goals_for": c.goals_for,
+        "goals_against": c.goals_against,
+        "wins": c.wins,
+        "draws": c.draws,
+        "losses": c.losses,
+        "elo": c.elo,
+        "squad": [_player_to_dict(p, names) for p in c.squad],
+        "youth": [_player_to_dict(p, names) for p in c.youth],
+    }
+
+def club_from_dict(c: Dict[str, Any], names: NameTable | None = None) -> Club:
+    name = c["name"]
+    return Club(
+        name=names[name] if isinstance(name, int) else name,
+        state_abbr=c["state_abbr"],
+        state_name=c["state_name"],
+        budget=c["budget"],
+        squad=[_player_from_dict(p, names) for p in c["squad"]],
+        youth=[_player_from_dict(p, names) for p in c["youth"]],
+        points=c.get("points", 0),
+        goals_for=c.get("goals_for", 0),
+        goals_against=c.get("goals_against", 0),
+        wins=c.get("wins", 0),
+        draws=c.get("draws", 0),
+        losses=c.get("losses", 0),
+        elo=c.get("elo", 0.0),
+    )
+
+class CorruptSave(ValueError):
+    """Save com trechos ilegíveis que nem o backup cobriu.
+
+    `data` traz o que foi recuperado (clubes perdidos ficam como None) e
+    `lost` os índices desses clubes."""
+    def __init__(self, message: str, data: Dict[str, Any] | None = None, lost: List[int] = ()):
+        super().__init__(message)
+        self.data, self.lost = data or {}, list(lost)
+
+# Formato do save: MAGIC, depois blocos [marca, tipo, índice, tamanho,
+# crc32] + conteúdo JSON compacto comprimido. Um bloco "M" (meta, nomes,
+# estadual) no começo e outro igual no fim; um "C" por clube. Um bloco
+# danificado só perde aquele clube: a leitura procura a próxima marca.
+MAGIC = b"FWSAVE\x01\n"
+CHUNK = struct.Struct("<4scIII")  # marca, tipo, índice, tamanho, crc32 do conteúdo
+MARK = b"FWCK"
+
+def encode_chunk(doc: Any, codec: str = "z") -> bytes:
+    """Conteúdo comprimido de um bloco (reaproveitável entre gravações).
+
+    `codec` "z" (zlib, padrão) ou "x" (lzma: ~5% menor, ~2x mais lento)."""
+    import json
+    raw = json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode()
+    if codec == "x":
+        import lzma
+        return b"x" + lzma.compress(raw, preset=0)
+    return b"z" + zlib.compress(raw, 6)
+
+def _decode_chunk(payload: bytes) -> Any:
+    """Levanta ValueError se o conteúdo não abre."""
+    import json
+    try:
+        if payload[:1] == b"x":
+            import lzma
+            raw = lzma.decompress(payload[1:])
+        else:
+            raw = zlib.decompress(payload[1:])
+        return json.loads(raw)
+    except Exception as e:
+        raise ValueError(f"bloco ilegível: {e}") from e
+
+def _try_decode(payload: bytes | None) -> Any:
+    try:
+        return _decode_chunk(payload) if payload is not None else None
+    except ValueError:
+        return None
+
+def _chunk(kind: bytes, index: int, payload: bytes) -> bytes:
+    return CHUNK.pack(MARK, kind, index, len(payload), zlib.crc32(payload)) + payload
+
+def write_save(filepath: str, meta: Dict[str, Any], club_docs: List[Dict[str, Any] | bytes],
+               state_league: StateLeague | Dict[str, Any] | None = None,
+               names: NameTable | None = None, next_player_id: int = 0, codec: str = "z", week: int = 0,
+               ledger: Dict[str, Any] | None = None) -> None:
+    """Grava um save a partir de clubes já serializados (`club_to_dict`, ou
+    já comprimidos por `encode_chunk`); o estadual pode vir serializado.
+
+    Escreve clube a clube num arquivo temporário e só então o troca pelo
+    save; o save anterior fica em `<arquivo>.bak`, de onde a leitura
+    recupera clubes danificados.
+    """
     os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
-    data = {
+    head = encode_chunk({
         "meta": meta,
-        "clubs": [
-            {
-                "name": c.name,
-                "state_abbr": c.state_abbr,
-                "state_name": c.state_name,
-                "budget": c.budget,
-                "points": c.points,
-                "goals_for": c.goals_for,
-                "goals_against": c.goals_against,
-                "wins": c.wins,
-                "draws": c.draws,
-                "losses": c.losses,
-                "squad": [asdict(p) for p in c.squad],
-                "youth": [asdict(p) for p in c.youth],
-            }
-            for c in clubs
-        ],
-        "state_league": state_league.serialize() if state_league else None,
-    }
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def load_game(filepath: str) -> tuple[list[Club], Dict[str, Any], StateLeague | None]:
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    clubs = []
-    for c in data["clubs"]:
-        club = Club(
-            name=c["name"],
-            state_abbr=c["state_abbr"],
-            state_name=c["state_name"],
-            budget=c["budget"],
-            squad=[make_player(p) for p in c["squad"]],
-            youth=[make_player(p) for p in c["youth"]],
-            points=c.get("points", 0),
-            goals_for=c.get("goals_for", 0),
-            goals_against=c.get("goals_against", 0),
-            wins=c.get("wins", 0),
-            draws=c.get("draws", 0),
-            losses=c.get("losses", 0),
-        )
-        clubs.append(club)
+        "names": names.names if names is not None else [],
+        "next_player_id": next_player_id,
+        "week": week,  # semana do calendário de desfalques
+        "clubs": len(club_docs),
+        "state_league": state_league.serialize() if isinstance(state_league, StateLeague) else state_league,
+        "ledger": ledger,  # finance.Ledger.serialize
+    }, codec)
+    tmp = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(_chunk(b"M", 0, head))
+        for i, doc in enumerate(club_docs):
+            f.write(_chunk(b"C", i, doc if isinstance(doc, bytes) else encode_chunk(doc, codec)))
+        f.write(_chunk(b"M", len(club_docs), head))
+        f.flush()
+        os.fsync(f.fileno())
+    if os.path.exists(filepath):
+        os.replace(filepath, filepath + ".bak")
+    os.replace(tmp, filepath)
+
+def save_game(filepath: str, clubs: List[Club], meta: Dict[str, Any], state_league: StateLeague | None = None) -> None:
+    universe = as_universe(clubs)
+    names = NameTable()
+    docs = [club_to_dict(c, names) for c in universe]
+    write_save(filepath, meta, docs, state_league, names, len(universe.players),
+               week=universe.calendar.week, ledger=universe.ledger.serialize())
+
+def _scan_chunks(buf: bytes) -> Tuple[Dict[str, Any] | None, Dict[int, bytes]]:
+    """Cabeçalho e conteúdo (ainda comprimido) dos clubes legíveis.
+
+    Blocos com crc errado, cortados ou ilegíveis são pulados."""
+    head, clubs = None, {}
+    pos = len(MAGIC)
+    while True:
+        pos = buf.find(MARK, pos)
+        if pos < 0 or pos + CHUNK.size > len(buf):
+            return head, clubs
+        _, kind, index, size, crc = CHUNK.unpack_from(buf, pos)
+        start = pos + CHUNK.size
+        payload = buf[start:start + size]
+        if len(payload) != size or zlib.crc32(payload) != crc:
+            pos += 1  # bloco danificado: procura a próxima marca
+            continue
+        if kind == b"C":
+            clubs.setdefault(index, payload)
+        elif head is None:
+            head = _try_decode(payload)
+        pos = start + size
+
+def _read_chunked(filepath: str) -> Tuple[Dict[str, Any] | None, Dict[int, bytes]]:
+    try:
+        with open(filepath, "rb") as f:
+            buf = f.read()
+    except OSError:
+        return None, {}
+    return _scan_chunks(buf) if buf.startswith(MAGIC) else (None, {})
+
+def read_save(filepath: str) -> Dict[str, Any]:
+    """Conteúdo do save (também lê o formato JSON antigo).
+
+    Clubes danificados vêm do `.bak` (listados em `"recovered"`), sem os
+    jogadores que já estão em outro clube; se nem ele os tem, levanta
+    `CorruptSave`. `"chunks"` guarda o conteúdo
+    comprimido de cada clube, para regravar sem recomprimir.
+    """
+    backup = filepath + ".bak"
+    if not os.path.exists(filepath) and os.path.exists(backup):
+        filepath = backup  # queda entre as duas trocas de arquivo
+    with open(filepath, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            import json
+            f.seek(0)
+            return json.loads(f.read().decode("utf-8"))
+    head, chunks = _read_chunked(filepath)
+    if head is None:
+        head, _ = _read_chunked(backup)
+        if head is None:
+            raise CorruptSave(f"{filepath}: cabeçalho ilegível e sem backup")
+    n = head["clubs"]
+    clubs = [_try_decode(chunks.get(i)) for i in range(n)]
+    recovered = [i for i in range(n) if clubs[i] is None]
+    if recovered:
+        old_head, old = _read_chunked(backup)
+        if old_head is not None:
+            for i in recovered:
+                clubs[i] = _try_decode(old.get(i))
+        recovered = [i for i in recovered if clubs[i] is not None]
+        if recovered:
+            head = _reconcile(head, clubs, recovered, old_head)
+            for i in recovered:
+                chunks[i] = encode_chunk(clubs[i])
+    data = dict(head, clubs=clubs, recovered=recovered, chunks=[chunks.get(i) for i in range(n)])
+    lost = [i for i, c in enumerate(clubs) if c is None]
+    if lost:
+        raise CorruptSave(f"{filepath}: {len(lost)} clube(s) ilegíveis e sem backup", data, lost)
+    return data
+
+def _reconcile(head: Dict[str, Any], clubs: List[Dict[str, Any] | None], recovered: List[int],
+               old_head: Dict[str, Any]) -> Dict[str, Any]:
+    """Acerta os clubes vindos do `.bak` com o resto do save: os nomes vão
+    da tabela do backup para a do save e saem os jogadores que, desde o
+    backup, passaram a outro clube (vale a versão mais nova)."""
+    names, old_names = NameTable(head.get("names", ())), NameTable(old_head.get("names", ()))
+
+    def rename(name):
+        return names.intern(old_names[name]) if isinstance(name, int) else name
+    skip = set(recovered)
+    taken = {p.get("id", -1) for i, c in enumerate(clubs) if i not in skip and c is not None
+             for p in c["squad"] + c["youth"]}
+    taken.discard(-1)  # sem id (save antigo): não dá para comparar
+    for i in recovered:
+        c = clubs[i]
+        c["name"] = rename(c["name"])
+        for group in ("squad", "youth"):
+            c[group] = [dict(p, name=rename(p["name"])) for p in c[group] if p.get("id", -1) not in taken]
+    return dict(head, names=names.names)
+
+def universe_from_save(data: Dict[str, Any]) -> tuple[Universe, Dict[str, Any], StateLeague | None]:
+    """Monta universo, meta e estadual a partir do conteúdo de `read_save`."""
+    names = NameTable(data.get("names", ()))
+    clubs = Universe([club_from_dict(c, names) for c in data["clubs"]], data.get("next_player_id", 0), data.get("week", 0))
+    clubs.ledger.restore(data.get("ledger"))
+    meta = data.get("meta", {})
+    if "team" in meta and "team_id" not in meta:
+        meta["team_id"] = clubs.find(meta["team"]).id  # save antigo
     state_league = None
     if data.get("state_league"):
-        from .leagues import StateLeague
         state_league = StateLeague.deserialize(data["state_league"], clubs)
-    return clubs, data.get("meta", {}), state_league
+    return clubs, meta, state_league
+
+def rebuild_lost(data: Dict[str, Any], lost: List[int]) -> Dict[str, Any]:
+    """Troca os clubes perdidos de um `CorruptSave` pela versão do início
+    da carreira (o universo sai da mesma seed, na mesma ordem)."""
+    from .data import BR_STATES
+    from .snapshots import load_universe
+    meta = data["meta"]
+    fresh = load_universe(meta.get("universe", meta["seed"]), len(data["clubs"]) // len(BR_STATES))
+    for i in lost:
+        c = fresh[i]
+        for p in c.squad + c.youth:
+            p.id = -1  # ids novos: os antigos podem estar em outro clube
+        data["clubs"][i] = club_to_dict(c)
+    return data
+
+def load_game(filepath: str, rebuild: bool = False) -> tuple[Universe, Dict[str, Any], StateLeague | None]:
+    """Com `rebuild`, clubes ilegíveis (e fora do backup) são refeitos por
+    `rebuild_lost` em vez de levantar `CorruptSave`."""
+    try:
+        data = read_save(filepath)
+    except CorruptSave as e:
+        if not (rebuild and e.lost):
+            raise
+        data = rebuild_lost(e.data, e.lost)
+    return universe_from_save(data)
+
+# --- verificação e benchmark ---
+
+def check(filepath: str) -> Dict[str, Any]:
+    """Resumo da integridade de um save (sem levantar CorruptSave)."""
+    try:
+        data = read_save(filepath)
+        lost = []
+    except CorruptSave as e:
+        data, lost = e.data, e.lost
+    return {"clubs": len(data.get("clubs", ())), "recovered": data.get("recovered", []), "lost": lost,
+            "readable": bool(data)}
+
+def bench(clubs_per_state: int = 50, seed: int = 1) -> List[tuple]:
+    """Gravação e leitura: JSON indentado (formato antigo) contra blocos
+    comprimidos com zlib e lzma. Linhas (formato, segundos de gravação,
+    bytes em disco, segundos de leitura)."""
+    import json, tempfile, time
+    from .data import generate_universe
+    clubs = generate_universe(seed, clubs_per_state)
+    names = NameTable()
+    docs = [club_to_dict(c, names) for c in clubs]
+    meta = {"seed": seed}
+    root = tempfile.mkdtemp(prefix="fw-save-")
+    rows = []
+
+    def run(label, path, write):
+        t0 = time.perf_counter()
+        write(path)
+        dt = time.perf_counter() - t0
+        size = os.path.getsize(path)
+        t0 = time.perf_counter()
+        read_save(path)
+        rows.append((label, dt, size, time.perf_counter() - t0))
+
+    def legacy(path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "names": names.names, "next_player_id": len(clubs.players), "clubs": docs,
+                       "state_league": None}, f, ensure_ascii=False, indent=2)
+    run("json (antigo)", os.path.join(root, "legacy.json"), legacy)
+    for codec in ("z", "x"):
+        run(f"blocos {codec}", os.path.join(root, f"chunked-{codec}.save"),
+            lambda p: write_save(p, meta, docs, None, names, len(clubs.players), codec))
+    return rows
+
+def main(argv: List[str] | None = None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Integridade e benchmark dos saves")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("check").add_argument("path")
+    b = sub.add_parser("bench")
+    b.add_argument("--clubs", type=int, default=50, help="clubes por estado")
+    args = ap.parse_args(argv)
+    if args.cmd == "check":
+        print(check(args.path))
+    else:
+        for label, write, size, read in bench(args.clubs):
+            print(f"{label:14s} gravação {write:5.2f}s  {size / 1e6:7.2f} MB  leitura {read:.2f}s")
+
+if __name__ == "__main__":
+    main()
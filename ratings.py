@@ -0,0 +1,130 @@
+"""
+Força dos clubes por rating Elo, atualizado em O(1) a cada resultado.
+
+O rating fica em `Club.elo` (0 = ainda não avaliado: nasce da força dos
+titulares). A expectativa de gols de um confronto depende só da diferença
+de rating (com o mando), então `EloModel` pré-calcula uma tabela por faixa
+de diferença com as médias de gols, as chances de vitória/empate/derrota e
+as CDFs de Poisson para sortear placares. Previsões e jogos de fundo
+(`MatchEngine.simulate_rated`) não precisam olhar o elenco.
+"""
+from __future__ import annotations
+from bisect import bisect
+from dataclasses import dataclass
+from typing import List, Tuple
+import math, random
+
+from .models import Club
+
+BASE_RATING = 1500.0
+ELO_PER_OVERALL = 25.0   # rating inicial: pontos por ponto de média dos titulares
+BASE_STRENGTH = 70.0
+K_FACTOR = 20.0
+HOME_ADVANTAGE = 60.0
+BASE_GOALS = 1.0         # média de cada lado num confronto equilibrado
+GOALS_PER_400 = 0.8      # log-razão de gols a cada 400 pontos de diferença
+MAX_GOALS = 12
+MAX_GOAL_MEAN = 5.0
+
+@dataclass(frozen=True)
+class Odds:
+    """Previsão de um confronto (mandante x visitante)."""
+    home_goals: float
+    away_goals: float
+    home_win: float
+    draw: float
+    away_win: float
+    home_cdf: Tuple[float, ...]
+    away_cdf: Tuple[float, ...]
+
+    def sample(self, rng: random.Random) -> Tuple[int, int]:
+        return bisect(self.home_cdf, rng.random()), bisect(self.away_cdf, rng.random())
+
+def _poisson_pmf(lam: float) -> List[float]:
+    term = math.exp(-lam)
+    pmf = [term]
+    for k in range(1, MAX_GOALS):
+        term *= lam / k
+        pmf.append(term)
+    return pmf
+
+def _cdf(pmf: List[float]) -> Tuple[float, ...]:
+    out, total = [], 0.0
+    for p in pmf:
+        total += p
+        out.append(total)
+    return tuple(out)
+
+def odds_from_means(lh: float, la: float) -> Odds:
+    """Previsão completa a partir das médias de gols (Poisson independentes)."""
+    ph, pa = _poisson_pmf(lh), _poisson_pmf(la)
+    win = draw = 0.0
+    for i, x in enumerate(ph):
+        draw += x * pa[i]
+        win += x * sum(pa[:i])
+    total = sum(ph) * sum(pa)
+    return Odds(lh, la, win / total, draw / total, (total - win - draw) / total, _cdf(ph), _cdf(pa))
+
+def _odds(diff: float) -> Odds:
+    return odds_from_means(min(MAX_GOAL_MEAN, BASE_GOALS * math.exp(GOALS_PER_400 * diff / 400)),
+                           min(MAX_GOAL_MEAN, BASE_GOALS * math.exp(-GOALS_PER_400 * diff / 400)))
+
+def squad_rating(club: Club) -> float:
+    """Rating equivalente à média atual dos titulares."""
+    return BASE_RATING + ELO_PER_OVERALL * (club.rating() - BASE_STRENGTH)
+
+def margin(goal_diff: int) -> float:
+    """Peso do placar na atualização (goleadas mexem mais no rating)."""
+    gd = abs(goal_diff)
+    return 1.0 if gd <= 1 else 1.5 if gd == 2 else (11 + gd) / 8
+
+class EloModel:
+    """Parâmetros do Elo e a tabela de previsões por diferença de rating.
+
+    A tabela cobre ±`span` pontos em faixas de `step`; diferenças maiores
+    usam a última faixa. Ela só é montada no primeiro uso (não pesa no
+    import).
+    """
+    def __init__(self, k: float = K_FACTOR, home_advantage: float = HOME_ADVANTAGE,
+                 step: float = 5.0, span: float = 1000.0):
+        self.k = k
+        self.home_advantage = home_advantage
+        self.step = step
+        self.half = int(span // step)
+        self._table: List[Odds] | None = None
+
+    @property
+    def table(self) -> List[Odds]:
+        if self._table is None:
+            self._table = [_odds(i * self.step) for i in range(-self.half, self.half + 1)]
+        return self._table
+
+    def rating(self, club: Club) -> float:
+        if not club.elo:
+            club.elo = squad_rating(club)
+        return club.elo
+
+    def diff(self, home: Club, away: Club) -> float:
+        return self.rating(home) + self.home_advantage - self.rating(away)
+
+    def odds(self, home: Club, away: Club) -> Odds:
+        i = round(self.diff(home, away) / self.step)
+        return self.table[min(self.half, max(-self.half, i)) + self.half]
+
+    def expected(self, home: Club, away: Club) -> float:
+        """Pontuação esperada do mandante (1 vitória, 0,5 empate)."""
+        return 1.0 / (1.0 + 10 ** (-self.diff(home, away) / 400))
+
+    def update(self, home: Club, away: Club, goals_home: int, goals_away: int):
+        score = 1.0 if goals_home > goals_away else 0.5 if goals_home == goals_away else 0.0
+        delta = self.k * margin(goals_home - goals_away) * (score - self.expected(home, away))
+        home.elo += delta
+        away.elo -= delta
+
+    def new_season(self, clubs: List[Club], carry: float = 0.75):
+        """Virada de temporada: o rating puxa parte do caminho rumo à força
+        do elenco renovado (aposentadorias e promoções mudam o time)."""
+        for c in clubs:
+            c.elo = carry * self.rating(c) + (1 - carry) * squad_rating(c)
+
+ELO = EloModel()  # modelo padrão (o estado fica nos clubes)
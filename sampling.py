@@ -0,0 +1,39 @@
+from __future__ import annotations
+from typing import Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+class AliasTable(Generic[T]):
+    """Sorteio ponderado em O(1) pelo método de alias (Vose).
+
+    A tabela é montada uma vez em O(n); cada sorteio custa um índice e
+    uma comparação, independente do número de itens.
+    """
+    __slots__ = ("items", "prob", "alias", "n")
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        n = len(items)
+        if n == 0 or n != len(weights):
+            raise ValueError("AliasTable precisa de itens e pesos do mesmo tamanho")
+        total = float(sum(weights))
+        if total <= 0:
+            weights, total = [1.0] * n, float(n)
+        self.items: List[T] = list(items)
+        self.n = n
+        self.prob = [0.0] * n
+        self.alias = list(range(n))
+        scaled = [w * n / total for w in weights]
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rng) -> T:
+        i = int(rng.random() * self.n)
+        return self.items[i if rng.random() < self.prob[i] else self.alias[i]]
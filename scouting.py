@@ -0,0 +1,215 @@
+"""
+Busca de jogadores (olheiro): nome aproximado e filtros de atributos.
+
+Os nomes se repetem muito (poucos nomes e sobrenomes em `data`), então o
+índice é por nome distinto: cada nome tem seus trigramas e palavras, e a
+lista dos jogadores que o usam. Uma consulta acha primeiro os nomes (por
+prefixo de cada palavra ou por trigramas em comum) e só depois olha os
+jogadores, com os atributos lidos na hora: treino e desfalques nunca
+deixam o índice velho.
+
+O índice acompanha o universo sozinho, a cada busca: jogadores novos são
+os ids além do último visto (a tabela de `ids.Universe` só cresce),
+aposentados e dispensados viram None na tabela e quem mudou de clube é
+achado pelos elencos que mudaram (lista ou tamanho diferentes).
+
+    python -m football_world.scouting "dieg fre" --min-overall 60 --max-age 25
+"""
+from __future__ import annotations
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
+import heapq, time, unicodedata
+
+from .models import Club, Player
+from .ids import Universe
+from .lineup import is_available
+from .transfers import asking_price
+
+MIN_SIMILARITY = 0.35  # Dice dos trigramas abaixo disso não conta como parecido
+PREFIX_SCORE = 1.0     # todas as palavras da busca são começo de palavras do nome
+
+def normalize(text: str) -> str:
+    """Minúsculas, sem acentos e com espaços simples."""
+    text = unicodedata.normalize("NFKD", text)
+    return " ".join("".join(ch for ch in text if not unicodedata.combining(ch)).lower().split())
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+@dataclass
+class Hit:
+    score: float  # semelhança do nome (1 = casou por prefixo; sem texto, 0)
+    player: Player
+    club: Club
+    youth: bool
+
+class ScoutIndex:
+    """Índice de nomes de um universo e buscas sobre ele."""
+    def __init__(self, universe: Universe):
+        self.universe = universe
+        self.names: List[str] = []                 # nome normalizado de cada nome distinto
+        self.grams: List[Set[str]] = []
+        self.by_name: Dict[str, int] = {}
+        self.holders: List[List[int]] = []         # ids de jogador de cada nome distinto
+        self.by_gram: Dict[str, List[int]] = {}    # trigrama -> nomes distintos
+        self.words: List[Tuple[str, int]] = []     # (palavra, nome distinto), ordenada
+        self.club_of = array("i")                  # id do jogador -> id do clube (-1 sem clube)
+        self._seen = 0                             # jogadores já indexados
+        self._rosters: List[Tuple[int, int, int, int]] = []
+        self.sync()
+
+    # --- manutenção ---
+
+    def _add_name(self, norm: str) -> int:
+        nid = len(self.names)
+        self.by_name[norm] = nid
+        self.names.append(norm)
+        grams = trigrams(norm)
+        self.grams.append(grams)
+        self.holders.append([])
+        for g in grams:
+            self.by_gram.setdefault(g, []).append(nid)
+        for w in set(norm.split()):
+            insort(self.words, (w, nid))
+        return nid
+
+    def sync(self):
+        """Põe em dia jogadores novos e quem trocou de clube (chamado em toda busca)."""
+        players = self.universe.players
+        if len(self.club_of) < len(players):
+            self.club_of.extend([-1] * (len(players) - len(self.club_of)))
+        for pid in range(self._seen, len(players)):
+            p = players[pid]
+            if p is None:
+                continue
+            norm = normalize(p.name)
+            nid = self.by_name.get(norm)
+            if nid is None:
+                nid = self._add_name(norm)
+            self.holders[nid].append(pid)
+        self._seen = len(players)
+        clubs = self.universe
+        if len(self._rosters) != len(clubs):
+            self._rosters = [(-1, -1, -1, -1)] * len(clubs)
+        club_of, rosters = self.club_of, self._rosters
+        for c in clubs:
+            sig = (id(c.squad), len(c.squad), id(c.youth), len(c.youth))
+            if rosters[c.id] != sig:
+                rosters[c.id] = sig
+                for p in c.squad:
+                    club_of[p.id] = c.id
+                for p in c.youth:
+                    club_of[p.id] = c.id
+
+    # --- busca ---
+
+    def _prefix(self, word: str) -> Set[int]:
+        words, out = self.words, set()
+        i = bisect_left(words, (word, -1))
+        while i < len(words) and words[i][0].startswith(word):
+            out.add(words[i][1])
+            i += 1
+        return out
+
+    def match_names(self, text: str) -> Dict[int, float]:
+        """Nomes distintos parecidos com `text` -> semelhança."""
+        norm = normalize(text)
+        if not norm:
+            return {}
+        scores: Dict[int, float] = {}
+        prefix = None
+        for w in norm.split():
+            found = self._prefix(w)
+            prefix = found if prefix is None else prefix & found
+        for nid in prefix or ():
+            scores[nid] = PREFIX_SCORE + (0.1 if self.names[nid] == norm else 0.0)
+        q = trigrams(norm)
+        shared = Counter(nid for g in q for nid in self.by_gram.get(g, ()))
+        for nid, n in shared.items():
+            dice = 2 * n / (len(q) + len(self.grams[nid]))
+            if dice >= MIN_SIMILARITY and dice > scores.get(nid, 0.0):
+                scores[nid] = dice
+        return scores
+
+    def search(self, text: str = "", *, limit: int = 20, min_overall: int = 0, min_age: int = 0,
+               max_age: int = 99, min_potential: int = 0, max_price: int | None = None,
+               state: str | None = None, personality: str | None = None, available: bool = False,
+               youth: bool = False, exclude: Club | None = None) -> List[Hit]:
+        """Melhores `limit` jogadores: pela semelhança do nome (com `text`) e
+        depois pelo overall. Com `youth`, inclui a base."""
+        self.sync()
+        if limit <= 0:
+            return []
+        clubs, players = self.universe, self.universe.players
+
+        def fits(p: Player) -> bool:
+            return (min_age <= p.age <= max_age and p.potential >= min_potential
+                    and p.overall() >= min_overall
+                    and (personality is None or p.personality == personality)
+                    and (not available or is_available(p))
+                    and (max_price is None or asking_price(p) <= max_price))
+
+        def club_fits(c: Club) -> bool:
+            return (state is None or c.state_abbr == state) and c is not exclude
+
+        # os `limit` melhores até aqui, num heap mínimo por (nome, overall, -id)
+        heap: List[tuple] = []
+
+        def offer(score: float, p: Player, c: Club, in_youth: bool):
+            key = (score, p.overall(), -p.id)
+            if len(heap) >= limit and key <= heap[0][:3] or not fits(p):
+                return  # pior que o último da lista: nem passa pelos filtros
+            if len(heap) < limit:
+                heapq.heappush(heap, key + (p, c, in_youth))
+            else:
+                heapq.heapreplace(heap, key + (p, c, in_youth))
+
+        if text:
+            for nid, score in self.match_names(text).items():
+                for pid in self.holders[nid]:
+                    p, cid = players[pid], self.club_of[pid]
+                    if p is None or cid < 0 or not club_fits(clubs[cid]):
+                        continue
+                    c = clubs[cid]
+                    in_youth = not any(q is p for q in c.squad)
+                    if youth or not in_youth:
+                        offer(score, p, c, in_youth)
+        else:
+            # todos com nota 0: quem não passa do pior overall da lista nem é oferecido
+            for c in filter(club_fits, clubs):
+                for group, in_youth in ((c.squad, False), (c.youth, True)) if youth else ((c.squad, False),):
+                    for p in group:
+                        o = p.overall()
+                        if o >= min_overall and (len(heap) < limit or o >= heap[0][1]):
+                            offer(0.0, p, c, in_youth)
+        return [Hit(score, p, c, in_youth) for score, _, _, p, c, in_youth in sorted(heap, reverse=True)]
+
+def main(argv: List[str] | None = None):
+    import argparse
+    from .snapshots import load_universe
+    ap = argparse.ArgumentParser(description="Busca de jogadores")
+    ap.add_argument("text", nargs="?", default="")
+    ap.add_argument("--clubs", type=int, default=50, help="clubes por estado do universo de teste")
+    ap.add_argument("--min-overall", type=int, default=0)
+    ap.add_argument("--max-age", type=int, default=99)
+    ap.add_argument("--state")
+    ap.add_argument("--youth", action="store_true")
+    args = ap.parse_args(argv)
+    universe = load_universe(1, args.clubs)
+    t0 = time.perf_counter()
+    index = ScoutIndex(universe)
+    t1 = time.perf_counter()
+    hits = index.search(args.text, min_overall=args.min_overall, max_age=args.max_age, state=args.state,
+                        youth=args.youth)
+    t2 = time.perf_counter()
+    for h in hits:
+        print(f"{h.score:4.2f}  {h.player.name:28s} {h.player.age:2d} anos  ovr {h.player.overall():3d}"
+              f"  {h.club.name}{' (base)' if h.youth else ''}")
+    print(f"{len(universe.players):,} jogadores: índice {1000 * (t1 - t0):.0f} ms, busca {1000 * (t2 - t1):.1f} ms")
+
+if __name__ == "__main__":
+    main()
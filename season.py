@@ -0,0 +1,289 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Dict
+import random, sys, time
+
+from .models import Club, Player, make_player
+from .data import random_player
+from .leagues import StateLeague
+from .sim import MatchEngine
+from .ids import Universe, as_universe
+from .ratings import ELO, EloModel
+from .events import Inbox, run_week
+from .lineup import lineup_of
+from .training import train_rosters
+from . import academy
+
+if TYPE_CHECKING:
+    from .archive import ArchiveWriter
+    from .cups import Cup
+    from .stats import StatsEngine
+
+# Parâmetros da virada de temporada
+PEAK_AGE = 27          # até aqui o jogador evolui rumo ao potencial
+DECLINE_AGE = 31       # a partir daqui os atributos caem
+RETIREMENT_AGE = 33    # começa a chance de aposentadoria
+MAX_AGE = 39           # aposentadoria compulsória
+PROMOTION_AGE = 19     # base acima desta idade sobe ou é dispensada
+SQUAD_SIZE = 28
+YOUTH_SIZE = 18
+INTAKE_AGES = (15, 16)
+
+@dataclass
+class SeasonReport:
+    season: int
+    champions: Dict[str, str] = field(default_factory=dict)  # UF -> campeão
+    cups: Dict[str, str] = field(default_factory=dict)       # copa -> campeão
+    retired: int = 0
+    promoted: int = 0
+    released: int = 0
+    intake: int = 0
+
+def standings(clubs: List[Club], state_abbr: str) -> List[Club]:
+    st = [c for c in clubs if c.state_abbr == state_abbr]
+    st.sort(key=lambda c: (c.points, c.goals_for - c.goals_against, c.goals_for), reverse=True)
+    return st
+
+def build_state_leagues(clubs: List[Club], season: int, seed: int) -> Dict[str, StateLeague]:
+    """Monta o calendário de todos os estaduais da temporada."""
+    abbrs = sorted({c.state_abbr for c in clubs})
+    return {abbr: StateLeague(abbr, clubs, seed=seed * 1000 + season) for abbr in abbrs}
+
+def _age_and_develop(players: List[Player], rng: random.Random):
+    """Envelhece e ajusta atributos de todos os jogadores numa única passada."""
+    rand = rng.random
+    for p in players:
+        p.age += 1
+        if p.age <= PEAK_AGE:
+            # cresce uma fração da distância até o potencial
+            gap = p.potential - p.overall()
+            if gap > 0:
+                step = gap * (0.15 + 0.25 * rand())
+                p.strength = min(100, p.strength + round(step * rand() * 1.5))
+                p.technique = min(100, p.technique + round(step * rand() * 1.5))
+                p.speed = min(100, p.speed + round(step * rand() * 1.5))
+        elif p.age >= DECLINE_AGE:
+            loss = p.age - DECLINE_AGE + 1
+            p.strength = max(1, p.strength - round(loss * rand() * 1.5))
+            p.speed = max(1, p.speed - round(loss * rand() * 2))
+
+def _retires(p: Player, roll: float) -> bool:
+    if p.age >= MAX_AGE:
+        return True
+    if p.age < RETIREMENT_AGE:
+        return False
+    return roll < (p.age - RETIREMENT_AGE + 1) / (MAX_AGE - RETIREMENT_AGE + 1)
+
+def end_of_season(clubs: List[Club], meta: Dict, rng: random.Random | None = None,
+                  cups: List[Cup] = (), ratings: EloModel | None = ELO) -> SeasonReport:
+    """Fecha a temporada de todo o universo e prepara a próxima.
+
+    Registra campeões (a fase final em `cups`, se houver, decide o
+    estadual), envelhece todos os jogadores, aposenta veteranos,
+    promove a base (pelo potencial), renova a base, zera a classificação,
+    aproxima os ratings do elenco novo e abre as finanças da temporada.
+    Incrementa `meta["season"]`. Os
+    calendários são refeitos por `build_state_leagues`/`StateLeague` pelo
+    chamador.
+    """
+    universe = as_universe(clubs)
+    season = meta.get("season", 1)
+    rng = rng or random.Random(meta.get("seed", 0) * 7919 + season)
+    report = SeasonReport(season=season)
+
+    for abbr in sorted({c.state_abbr for c in clubs}):
+        table = standings(clubs, abbr)
+        if table and any(c.wins + c.draws + c.losses for c in table):
+            report.champions[abbr] = table[0].name
+    for cup in cups:
+        if cup.is_finished():
+            winner = universe[cup.champion].name
+            if cup.state_abbr:
+                report.champions[cup.state_abbr] = winner
+            else:
+                report.cups[cup.name] = winner
+
+    # passadas em bloco sobre o universo inteiro; a base evolui semana a
+    # semana (academy.run_week), aqui só envelhece
+    _age_and_develop([p for c in clubs for p in c.squad], rng)
+    for c in clubs:
+        for p in c.youth:
+            p.age += 1
+
+    for c in clubs:
+        staying = []
+        for p in c.squad:
+            if _retires(p, rng.random()):
+                universe.release(p)
+            else:
+                staying.append(p)
+        report.retired += len(c.squad) - len(staying)
+        c.squad = staying
+
+        # base: quem passou da idade sobe (melhores potenciais) ou sai
+        ready = [p for p in c.youth if p.age >= PROMOTION_AGE]
+        c.youth = [p for p in c.youth if p.age < PROMOTION_AGE]
+        ready.sort(key=lambda p: (p.potential, p.overall()), reverse=True)
+        for p in ready:
+            p.loan_weeks = 0  # empréstimos acabam com a temporada de quem sobe
+        # sem vagas suficientes, a base restante também completa o elenco
+        if len(c.squad) + len(ready) < SQUAD_SIZE:
+            c.youth.sort(key=lambda p: (p.potential, p.overall()), reverse=True)
+            extra = SQUAD_SIZE - len(c.squad) - len(ready)
+            ready += c.youth[:extra]
+            c.youth = c.youth[extra:]
+        slots = max(0, SQUAD_SIZE - len(c.squad))
+        c.squad.extend(ready[:slots])
+        report.promoted += min(slots, len(ready))
+        report.released += max(0, len(ready) - slots)
+        for p in ready[slots:]:
+            universe.release(p)
+
+        missing = YOUTH_SIZE - len(c.youth)
+        if missing > 0:
+            for _ in range(missing):
+                p = make_player(random_player(rng, *INTAKE_AGES, 25, 60))
+                universe.add(p)
+                c.youth.append(p)
+            report.intake += missing
+
+        c.reset_stats()
+
+    if ratings is not None:
+        ratings.new_season(universe)
+    universe.ledger.new_season()  # folha e receitas do elenco novo
+    meta["season"] = season + 1
+    return report
+
+def play_round(clubs: Universe, league: StateLeague, engine: MatchEngine, archive=None, season: int = 0):
+    """Joga a rodada atual de um estadual sem interação.
+
+    Com `archive` (ArchiveWriter), cada resultado é gravado.
+    """
+    week = league.current_week
+    results = []
+    for fx in league.fixtures_of_week(week):
+        res = engine.simulate_background(clubs[fx.home], clubs[fx.away])
+        if archive is not None:
+            archive.append(season, week, fx.home, fx.away, res)
+        results.append(res)
+    league.advance_week()
+    return results
+
+def play_week(clubs: Universe, meta: Dict, st_league: StateLeague, on_event=None, save_path: str | None = None,
+              stats: StatsEngine | None = None, archive: ArchiveWriter | None = None, inbox: Inbox | None = None):
+    """Rodada da carreira: o jogo do clube do treinador (`meta["team_id"]`)
+    sai com linha do tempo (e, com `on_event`, ao vivo); os demais são
+    simulados sem timeline. Depois dos jogos vêm os eventos da semana (a
+    notícia do clube do treinador vai para `inbox`), antes do fechamento
+    do caixa. Com `save_path`, grava a carreira no fim."""
+    rng = random.Random(meta["season"] * 10_000 + st_league.current_week)
+    engine = MatchEngine(rng, stats, ELO, clubs.calendar)
+
+    # clubes da IA também treinam toda semana
+    mine = meta["team_id"]
+    ai = [c for c in clubs if c.id != mine]
+    train_rosters([c.squad for c in ai], rng)
+    for c in ai:
+        lineup_of(c).invalidate()  # atributos mudaram no treino
+    clubs.calendar.advance()
+    academy.run_week(clubs, rng, user=mine)
+
+    fixtures = st_league.fixtures_of_week(st_league.current_week)
+    results = []
+    for fx in fixtures:
+        h, a = clubs[fx.home], clubs[fx.away]
+        if mine not in (fx.home, fx.away):
+            res = engine.simulate_fast(h, a)
+        else:
+            match = engine.live(h, a)
+            for ev in match:
+                if on_event:
+                    on_event(match, ev)
+            res = match.finish()
+        if archive is not None:
+            archive.append(meta["season"], st_league.current_week, h.id, a.id, res)
+        results.append(res)
+    if archive is not None:
+        archive.flush()
+
+    run_week(clubs, clubs.calendar, rng, follow=mine, inbox=inbox)
+    clubs.ledger.close_week(r.home for r in results)
+    st_league.advance_week()
+    if save_path:
+        from .persistence import save_game
+        save_game(save_path, clubs, meta, st_league)
+    return results
+
+def simulate_season(clubs: Universe, leagues: Dict[str, StateLeague], engine: MatchEngine,
+                    archive=None, season: int = 0, cups: List[Cup] | None = None,
+                    finals: bool = False, seed: int = 0, events: bool = False) -> int:
+    """Disputa os estaduais e as copas de `cups` semana a semana até o fim.
+
+    Com `finals`, cada estadual ganha sua fase final (mata-mata dos quatro
+    primeiros) na semana seguinte ao término; ela é acrescentada a `cups`.
+    Com `events`, os eventos da semana (events.run_week) rodam para todos
+    os clubes depois dos jogos. Retorna o número de partidas.
+    """
+    cups = cups if cups is not None else []
+    waiting = set(leagues) if finals else set()
+    played = 0
+    week = 1
+    while True:
+        busy = False
+        clubs.calendar.advance()
+        academy.run_week(clubs, engine.rng)
+        results = []
+        for abbr, lg in leagues.items():
+            if not lg.is_finished():
+                results += play_round(clubs, lg, engine, archive, season)
+                busy = True
+                continue
+            if abbr in waiting:
+                waiting.discard(abbr)
+                from .cups import state_finals
+                cups.append(state_finals(clubs, abbr, week, seed=seed * 1000 + season))
+        for cup in cups:
+            if not cup.is_finished():
+                results += cup.play_week(clubs, week, engine)
+                busy = True
+        if not busy:
+            return played
+        if events:
+            run_week(clubs, clubs.calendar, engine.rng)
+        clubs.ledger.close_week(r.home for r in results)
+        played += len(results)
+        week += 1
+
+def run_seasons(n_seasons: int, seed: int = 1, clubs_per_state: int = 6, archive=None):
+    """Carreira sem interface: `n_seasons` temporadas completas em sequência.
+
+    Com `archive` (ArchiveWriter), todos os resultados são arquivados."""
+    from .data import generate_universe
+    from .cups import national_cup
+    clubs = generate_universe(seed, clubs_per_state=clubs_per_state)
+    meta = {"seed": seed, "season": 1}
+    engine = MatchEngine(random.Random(seed), ratings=ELO, calendar=clubs.calendar)
+    reports: List[SeasonReport] = []
+    for _ in range(n_seasons):
+        leagues = build_state_leagues(clubs, meta["season"], seed)
+        cups = [national_cup(clubs, start_week=1, seed=seed * 1000 + meta["season"], ratings=ELO)]
+        simulate_season(clubs, leagues, engine, archive, meta["season"], cups, finals=True, seed=seed, events=True)
+        reports.append(end_of_season(clubs, meta, cups=cups))
+    return clubs, meta, reports
+
+def main(argv: List[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 50
+    from .archive import ArchiveWriter
+    archive = ArchiveWriter(argv[1]) if len(argv) > 1 else None
+    t0 = time.perf_counter()
+    clubs, meta, reports = run_seasons(n, archive=archive)
+    dt = time.perf_counter() - t0
+    retired = sum(r.retired for r in reports)
+    print(f"{n} temporadas, {len(clubs)} clubes em {dt:.2f}s ({retired} aposentadorias)")
+    if archive is not None:
+        archive.close()
+
+if __name__ == "__main__":
+    main()
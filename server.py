@@ -0,0 +1,218 @@
+"""
+Servidor de carreiras (asyncio, protocolo de linhas JSON sobre TCP).
+
+Cada linha enviada pelo cliente é um comando JSON e recebe uma linha JSON
+de resposta (`{"ok": true, ...}` ou `{"ok": false, "error": ...}`):
+
+    {"cmd": "new", "career": "ana", "coach": "Ana", "state": "SP", "club": 0}
+    {"cmd": "open", "career": "ana"}
+    {"cmd": "team"}
+    {"cmd": "train", "focus": "speed"}
+    {"cmd": "play"}
+    {"cmd": "table"}
+    {"cmd": "save"}
+    {"cmd": "quit"}
+
+As rodadas rodam numa thread sobre os próprios objetos da carreira em
+memória (nada de copiar o universo entre processos, e o cache reconhece os
+clubes já gravados); universos novos são gerados num pool de processos.
+As carreiras mais usadas ficam em memória (`cache.CareerCache`) e as
+demais são gravadas em disco.
+
+    python -m football_world.server --port 8765 --saves saves/server
+"""
+from __future__ import annotations
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+import argparse, asyncio, json, os, random, re
+
+from .models import Club
+from .leagues import StateLeague
+from .cache import CareerCache, CachedCareer
+from .training import FOCUSES
+from .season import end_of_season, play_week, standings
+from .snapshots import CAREER_SEEDS, bucket_of, load_universe
+from .events import Inbox
+from . import cli
+
+def team_of(career: CachedCareer) -> Club:
+    return career.clubs[career.meta["team_id"]]
+
+# --- tarefas fora do loop de eventos ---
+
+def _new_job(coach: str, abbr: str, club_idx: int, seed: int):
+    clubs = load_universe(bucket_of(seed))  # os baldes saem do cache
+    mine = [c for c in clubs if c.state_abbr == abbr]
+    if not mine:
+        raise ValueError(f"estado inválido: {abbr}")
+    return cli.start_career(clubs, coach, mine[club_idx % len(mine)], seed, universe=bucket_of(seed))
+
+def _play_job(career: CachedCareer) -> Dict:
+    """Joga a rodada (ou vira a temporada se o estadual acabou) no próprio
+    universo da carreira. Roda numa thread, com a carreira travada."""
+    clubs, meta, league = career.clubs, career.meta, career.league
+    # o treino da IA e a base mexem em todos os clubes toda semana
+    career.mark_dirty(clubs)
+    career.mark_dirty()
+    if league.is_finished():
+        report = end_of_season(clubs, meta)
+        career.league = StateLeague(league.state_abbr, clubs, seed=meta["seed"] * 1000 + meta["season"])
+        return {"season_over": report.season, "champion": report.champions.get(league.state_abbr)}
+    week = league.current_week
+    news = Inbox()
+    results = play_week(clubs, meta, league, save_path=None, inbox=news)
+    summary = {"week": week, "news": " ".join(news), "results": [
+        {"home": clubs[r.home].name, "away": clubs[r.away].name, "score": [r.goals_home, r.goals_away],
+         "events": [f"{ev.minute}' {ev.kind} ({clubs.player(ev.player).name})" for ev in r.timeline]}
+        for r in results
+    ]}
+    return summary
+
+class CareerStore:
+    """Carreiras quentes em memória (`CareerCache`), uma trava por carreira.
+
+    As carreiras em uso nunca são despejadas; as ociosas menos usadas vão
+    para disco quando o limite `max_hot` é ultrapassado.
+    """
+    def __init__(self, root: str, max_hot: int, pool: ProcessPoolExecutor):
+        self.root = root
+        self.pool = pool
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self.cache = CareerCache(max_hot, pinned=self._in_use)
+        os.makedirs(root, exist_ok=True)
+
+    def _in_use(self, entry: CachedCareer) -> bool:
+        lock = self.locks.get(entry.path)
+        return lock is not None and lock.locked()
+
+    def path_of(self, key: str) -> str:
+        if not re.fullmatch(r"[\w-]{1,64}", key):
+            raise ValueError("nome de carreira inválido")
+        path = os.path.join(self.root, f"{key}.save")
+        legacy = path + ".json"  # carreiras gravadas antes dos saves em blocos
+        return legacy if not os.path.exists(path) and os.path.exists(legacy) else path
+
+    async def create(self, key: str, coach: str, abbr: str, club_idx: int, seed: int | None = None) -> CachedCareer:
+        path = self.path_of(key)
+        seed = seed if seed is not None else random.randint(1, CAREER_SEEDS)
+        loop = asyncio.get_running_loop()
+        clubs, meta, league = await loop.run_in_executor(self.pool, _new_job, coach, abbr, club_idx, seed)
+        return await asyncio.to_thread(self.cache.add, path, clubs, meta, league)
+
+    async def get(self, key: str) -> CachedCareer:
+        path = self.path_of(key)
+        if path not in self.cache and not os.path.exists(path):
+            raise KeyError(f"carreira não encontrada: {key}")
+        return await asyncio.to_thread(self.cache.open, path)
+
+    @asynccontextmanager
+    async def checkout(self, key: str):
+        """Uso exclusivo de uma carreira quente (recarrega se foi despejada)."""
+        while True:
+            career = await self.get(key)
+            lock = self.locks.setdefault(career.path, asyncio.Lock())
+            async with lock:
+                if self.cache.entries.get(career.path) is career:
+                    yield career
+                    return
+
+    async def save(self, career: CachedCareer):
+        await asyncio.to_thread(self.cache.save, career.path)
+
+    async def flush(self):
+        await asyncio.to_thread(self.cache.flush)
+
+class CareerServer:
+    def __init__(self, store: CareerStore):
+        self.store = store
+        self.clients = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.clients += 1
+        key: str | None = None
+        try:
+            while line := await reader.readline():
+                try:
+                    req = json.loads(line)
+                    if req.get("cmd") == "quit":
+                        break
+                    key, resp = await self.dispatch(key, req)
+                    resp = {"ok": True, **resp}
+                except Exception as e:
+                    resp = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(resp, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    async def dispatch(self, key: str | None, req: Dict):
+        cmd = req.get("cmd")
+        store = self.store
+        if cmd == "new":
+            key = req["career"]
+            career = await store.create(key, req.get("coach", "Treinador"),
+                                        req.get("state", "SP"), int(req.get("club", 0)), req.get("seed"))
+            return key, {"team": career.meta["team"], "season": career.meta["season"]}
+        if cmd == "open":
+            key = req["career"]
+            career = await store.get(key)
+            return key, {"team": career.meta["team"], "season": career.meta["season"],
+                         "week": career.league.current_week}
+        if key is None:
+            raise ValueError("abra ou crie uma carreira primeiro")
+        async with store.checkout(key) as career:
+            team = team_of(career)
+            if cmd == "team":
+                return key, {"team": team.name, "budget": team.budget,
+                             "finances": career.clubs.ledger.statement(team), "squad": [
+                    {"name": p.name, "age": p.age, "ovr": p.overall(), "injured": p.injured,
+                     "suspended": p.suspended} for p in team.squad]}
+            if cmd == "train":
+                focus = req.get("focus", "strength")
+                if focus not in FOCUSES:
+                    raise ValueError(f"foco inválido: {focus}")
+                career.mark_dirty([team])
+                return key, {"trained": cli.apply_training(team, focus)}
+            if cmd == "play":
+                return key, await asyncio.to_thread(_play_job, career)
+            if cmd == "table":
+                return key, {"table": [
+                    {"club": c.name, "points": c.points, "wins": c.wins, "draws": c.draws,
+                     "losses": c.losses, "gf": c.goals_for, "ga": c.goals_against}
+                    for c in standings(career.clubs, team.state_abbr)]}
+            if cmd == "save":
+                career.mark_dirty()
+                await store.save(career)
+                return key, {"saved": career.path}
+        raise ValueError(f"comando desconhecido: {cmd}")
+
+async def serve(host: str, port: int, saves: str, max_hot: int, workers: int | None, ready=None):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        store = CareerStore(saves, max_hot, pool)
+        app = CareerServer(store)
+        server = await asyncio.start_server(app.handle, host, port, limit=1 << 20)
+        if ready is not None:
+            ready.set_result(server.sockets[0].getsockname()[1])
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await store.flush()
+
+def main(argv: List[str] | None = None):
+    ap = argparse.ArgumentParser(description="Servidor de carreiras do Football World")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--saves", default="saves/server")
+    ap.add_argument("--hot", type=int, default=64, help="carreiras mantidas em memória")
+    ap.add_argument("--workers", type=int, default=None, help="processos de geração de universos")
+    args = ap.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.saves, args.hot, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
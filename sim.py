@@ -1,10 +1,12 @@
 
 from __future__ import annotations
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator
 from dataclasses import dataclass
 import random
 
 from .models import Club, Player, make_player
+from .lineup import lineup_of
+from .sampling import AliasTable
 
 EVENTS = [
     "Cartão amarelo",
@@ -16,83 +18,228 @@ EVENTS = [
     "Defesa espetacular",
 ]
 
+# Frequência relativa dos lances que não são gol e o papel de quem participa
+OTHER_EVENT_WEIGHTS = {
+    "Cartão amarelo": 3.0,
+    "Cartão vermelho": 0.4,
+    "Lesão leve": 1.0,
+    "Lesão grave": 0.4,
+    "Impedimento": 3.0,
+    "Defesa espetacular": 2.0,
+}
+EVENT_ROLE = {
+    "Gol": "goal",
+    "Impedimento": "goal",
+    "Cartão amarelo": "card",
+    "Cartão vermelho": "card",
+    "Lesão leve": "injury",
+    "Lesão grave": "injury",
+    "Defesa espetacular": "any",
+}
+OTHER_EVENTS = AliasTable(list(OTHER_EVENT_WEIGHTS), list(OTHER_EVENT_WEIGHTS.values()))
+
 @dataclass
 class MatchEvent:
     minute: int
-    club: str
-    player: str
+    club: int    # Club.id
+    player: int  # Player.id
     kind: str
 
 @dataclass
 class MatchResult:
-    home: str
-    away: str
+    home: int  # Club.id
+    away: int
     goals_home: int
     goals_away: int
     timeline: List[MatchEvent]
 
-class MatchEngine:
-    def __init__(self, rng: random.Random | None = None):
-        self.rng = rng or random.Random()
+# Lances que não são gol por partida (em média)
+OTHER_EVENTS_PER_MATCH = 10.0
+MAX_SUBS = 5
+MAX_GOAL_MEAN = 5.0  # limite para times sem ninguém apto
+MIN_GOAL_MEAN = 0.4  # até o time mais fraco ameaça um pouco
 
-    def simulate(self, home: Club, away: Club) -> MatchResult:
-        # força esperada baseada no rating
-        hr = home.rating()
-        ar = away.rating()
-        base = (hr + ar) / 2.0
-        # média de gols ~ Poisson via aproximação
-        mean_home = max(0.4, (hr / (ar + 1e-6)) * 1.0)
-        mean_away = max(0.4, (ar / (hr + 1e-6)) * 1.0)
-
-        goals_home = self._poisson(mean_home)
-        goals_away = self._poisson(mean_away)
-
-        timeline: List[MatchEvent] = []
-        minutes = list(range(1, 91))
-        self.rng.shuffle(minutes)
-        minutes = minutes[: self.rng.randint(6, 16)]  # 6 a 16 eventos
-
-        def pick_player(club: Club) -> Player:
-            return self.rng.choice(club.squad)
-
-        # espalha eventos aleatórios e inclui os gols nos minutos
-        for m in sorted(minutes):
-            pick = self.rng.random()
-            if pick < 0.15 and goals_home > 0:
-                p = pick_player(home); goals_home -= 1
-                timeline.append(MatchEvent(m, home.name, p.name, "Gol"))
-            elif pick < 0.30 and goals_away > 0:
-                p = pick_player(away); goals_away -= 1
-                timeline.append(MatchEvent(m, away.name, p.name, "Gol"))
+def goal_means(home_strength: float, away_strength: float) -> Tuple[float, float]:
+    """Média de gols de cada lado: razão de forças, limitada."""
+    return (min(MAX_GOAL_MEAN, max(MIN_GOAL_MEAN, home_strength / (away_strength + 1e-6))),
+            min(MAX_GOAL_MEAN, max(MIN_GOAL_MEAN, away_strength / (home_strength + 1e-6))))
+
+@dataclass
+class SideState:
+    """Placar e ocorrências de um lado durante a partida."""
+    club: Club
+    goals: int = 0
+    yellow: int = 0
+    red: int = 0
+    injuries: int = 0
+    subs: int = 0
+
+class LiveMatch:
+    """Partida simulada minuto a minuto.
+
+    Iterar produz os `MatchEvent` conforme acontecem; entre um evento e
+    outro o chamador pode consultar `home_state`/`away_state`, fazer
+    substituições ou encerrar com `stop()`. `fast_forward()` joga o que
+    falta sem montar a linha do tempo. `finish()` registra o resultado
+    na classificação dos clubes (exceto com `register=False`, ex.: copas).
+    """
+    def __init__(self, engine: "MatchEngine", home: Club, away: Club, register: bool = True):
+        self.rng = engine.rng
+        self.stats = engine.stats
+        self.ratings = engine.ratings
+        self.calendar = engine.calendar
+        self.home_state = SideState(home)
+        self.away_state = SideState(away)
+        self.home_lineup = lineup_of(home)
+        self.away_lineup = lineup_of(away)
+        self.home_lineup.kickoff()
+        self.away_lineup.kickoff()
+        # com rating, a expectativa de gols vem da tabela de previsões
+        self._odds = self.ratings.odds(home, away) if self.ratings is not None else None
+        self._kickoff = (self.home_lineup.strength(), self.away_lineup.strength())
+        self.minute = 0
+        self.stopped = False
+        self.timeline: List[MatchEvent] = []
+        # quem participou do último lance (evita alocar por minuto)
+        self.last_side: SideState | None = None
+        self.last_player: Player | None = None
+        self.register = register
+        self._finished = False
+        self._update_rates()
+
+    def _update_rates(self):
+        """Probabilidades por minuto; refeitas quando alguém sai de campo."""
+        hs, as_ = self.home_lineup.strength(), self.away_lineup.strength()
+        if self._odds is None:
+            # média de gols ~ razão de forças, como no motor anterior
+            mean_home, mean_away = goal_means(hs, as_)
+        else:
+            # expulsões e lesões ajustam a previsão pela força em campo
+            h0, a0 = self._kickoff
+            rel_h = hs / h0 if h0 else 1.0
+            rel_a = as_ / a0 if a0 else 1.0
+            mean_home = min(MAX_GOAL_MEAN, self._odds.home_goals * rel_h / max(rel_a, 0.1))
+            mean_away = min(MAX_GOAL_MEAN, self._odds.away_goals * rel_a / max(rel_h, 0.1))
+        self._p_home = mean_home / 90.0
+        self._p_goal = self._p_home + mean_away / 90.0
+        self._p_event = self._p_goal + OTHER_EVENTS_PER_MATCH / 90.0
+
+    def step(self) -> str | None:
+        """Joga um minuto. Retorna o tipo de lance ou None."""
+        self.minute += 1
+        roll = self.rng.random()
+        if roll >= self._p_event:
+            return None
+        if roll < self._p_goal:
+            side, lineup = ((self.home_state, self.home_lineup) if roll < self._p_home
+                            else (self.away_state, self.away_lineup))
+            kind = "Gol"
+            side.goals += 1
+        else:
+            side, lineup = ((self.home_state, self.home_lineup) if self.rng.random() < 0.5
+                            else (self.away_state, self.away_lineup))
+            kind = OTHER_EVENTS.sample(self.rng)
+        player = lineup.pick(EVENT_ROLE[kind], self.rng)
+        if kind == "Cartão amarelo":
+            side.yellow += 1
+        elif kind == "Cartão vermelho":
+            side.red += 1
+            if self.calendar is not None:
+                self.calendar.suspend(side.club, player)
             else:
-                # outro evento
-                club = home if self.rng.random() < 0.5 else away
-                p = pick_player(club)
-                kind = self.rng.choice([e for e in EVENTS if e != "Gol"])
-                timeline.append(MatchEvent(m, club.name, p.name, kind))
-
-        # corrige se sobrou gol não registrado na timeline
-        # adiciona nos minutos finais
-        for _ in range(goals_home):
-            p = pick_player(home); timeline.append(MatchEvent(self.rng.randint(80,90), home.name, p.name, "Gol"))
-        for _ in range(goals_away):
-            p = pick_player(away); timeline.append(MatchEvent(self.rng.randint(80,90), away.name, p.name, "Gol"))
-
-        # contabiliza
-        h_g = sum(1 for ev in timeline if ev.club == home.name and ev.kind == "Gol")
-        a_g = sum(1 for ev in timeline if ev.club == away.name and ev.kind == "Gol")
-
-        home.register_result(h_g, a_g)
-        away.register_result(a_g, h_g)
-
-        return MatchResult(home.name, away.name, h_g, a_g, sorted(timeline, key=lambda x: x.minute))
-
-    def _poisson(self, lam: float) -> int:
-        # Knuth
-        L = pow(2.718281828, -lam)
-        k = 0
-        p = 1.0
-        while p > L:
-            k += 1
-            p *= self.rng.random()
-        return max(0, k - 1)
+                lineup.send_off(player)
+            self._update_rates()
+        elif kind == "Lesão grave":
+            side.injuries += 1
+            if self.calendar is not None:
+                self.calendar.injure(side.club, player, self.rng)
+            else:
+                lineup.injure(player)
+            self._update_rates()
+        self.last_side, self.last_player = side, player
+        if self.stats is not None:
+            self.stats.on_event(side.club, player, kind)
+        return kind
+
+    def __iter__(self) -> Iterator[MatchEvent]:
+        while self.minute < 90 and not self.stopped:
+            kind = self.step()
+            if kind is not None:
+                ev = MatchEvent(self.minute, self.last_side.club.id, self.last_player.id, kind)
+                self.timeline.append(ev)
+                yield ev
+
+    def fast_forward(self):
+        step = self.step
+        while self.minute < 90 and not self.stopped:
+            step()
+
+    def stop(self):
+        self.stopped = True
+
+    def substitute(self, club: Club, out: Player, on: Player) -> bool:
+        side, lineup = ((self.home_state, self.home_lineup) if club is self.home_state.club
+                        else (self.away_state, self.away_lineup))
+        if side.subs >= MAX_SUBS or not lineup.substitute(out, on):
+            return False
+        side.subs += 1
+        self._update_rates()
+        return True
+
+    def finish(self) -> MatchResult:
+        h, a = self.home_state, self.away_state
+        if not self._finished:
+            if self.register:
+                h.club.register_result(h.goals, a.goals)
+                a.club.register_result(a.goals, h.goals)
+            if self.stats is not None:
+                self.stats.on_result(h.club, a.club, h.goals, a.goals)
+            if self.ratings is not None:
+                self.ratings.update(h.club, a.club, h.goals, a.goals)
+            self._finished = True
+        return MatchResult(h.club.id, a.club.id, h.goals, a.goals, self.timeline)
+
+class MatchEngine:
+    def __init__(self, rng: random.Random | None = None, stats=None, ratings=None, calendar=None):
+        self.rng = rng or random.Random()
+        self.stats = stats  # StatsEngine opcional, alimentado lance a lance
+        self.ratings = ratings  # ratings.EloModel opcional: previsões e atualização do rating
+        # status.StatusCalendar opcional: agenda a volta de lesionados e
+        # expulsos (sem ele, ninguém volta sozinho)
+        self.calendar = calendar
+
+    def live(self, home: Club, away: Club, register: bool = True) -> LiveMatch:
+        """Partida ao vivo: itere para receber os eventos minuto a minuto."""
+        return LiveMatch(self, home, away, register)
+
+    def simulate(self, home: Club, away: Club, register: bool = True) -> MatchResult:
+        match = LiveMatch(self, home, away, register)
+        for _ in match:
+            pass
+        return match.finish()
+
+    def simulate_fast(self, home: Club, away: Club, register: bool = True) -> MatchResult:
+        """Jogos de fundo: mesmo motor, sem linha do tempo."""
+        match = LiveMatch(self, home, away, register)
+        match.fast_forward()
+        return match.finish()
+
+    def simulate_background(self, home: Club, away: Club, register: bool = True) -> MatchResult:
+        """Jogo sem torcedor olhando: pelo rating se houver, senão `simulate_fast`."""
+        if self.ratings is not None:
+            return self.simulate_rated(home, away, register)
+        return self.simulate_fast(home, away, register)
+
+    def simulate_rated(self, home: Club, away: Club, register: bool = True) -> MatchResult:
+        """Só o placar, sorteado da previsão do rating (exige `ratings`):
+        não gera lances. Com `calendar`, ainda sorteia lesões e expulsões."""
+        gh, ga = self.ratings.odds(home, away).sample(self.rng)
+        if self.calendar is not None:
+            self.calendar.background(home, away, self.rng)
+        if register:
+            home.register_result(gh, ga)
+            away.register_result(ga, gh)
+        if self.stats is not None:
+            self.stats.on_result(home, away, gh, ga)
+        self.ratings.update(home, away, gh, ga)
+        return MatchResult(home.id, away.id, gh, ga, [])
@@ -0,0 +1,132 @@
+"""
+Universos pré-gerados para abrir carreiras novas sem espera.
+
+Carreiras novas sorteiam uma seed em toda a faixa (`CAREER_SEEDS`), mas o
+universo vem de um de `BUCKETS` baldes (`bucket_of`); o de cada (balde,
+clubes por estado) é gerado uma única vez e guardado em `SNAPSHOT_DIR`
+num formato compacto: `marshal` de tuplas, com os nomes numa tabela
+internada (como nos saves) e cada jogador como uma linha na ordem dos
+campos de `Player`. Ler e remontar é bem mais rápido que gerar.
+
+    python -m football_world.snapshots warm --clubs 6      # pré-gera todos os baldes
+    python -m football_world.snapshots bench --clubs 50    # tempo até o menu
+"""
+from __future__ import annotations
+from dataclasses import fields
+from typing import List
+import argparse, marshal, os, subprocess, sys, tempfile, time
+
+from .models import Club, Player
+from .ids import NameTable, Universe
+
+BUCKETS = 64
+CAREER_SEEDS = 2**31 - 1
+SNAPSHOT_VERSION = 3
+SNAPSHOT_DIR = os.path.join("saves", "snapshots")
+FIELDS = tuple(f.name for f in fields(Player))
+NAME = FIELDS.index("name")
+
+def snapshot_path(seed: int, clubs_per_state: int, root: str = SNAPSHOT_DIR) -> str:
+    return os.path.join(root, f"universe-v{SNAPSHOT_VERSION}-{clubs_per_state}-{seed}.bin")
+
+def dump_universe(clubs: Universe) -> bytes:
+    names = NameTable()
+
+    def row(p: Player) -> tuple:
+        values = [getattr(p, f) for f in FIELDS]
+        values[NAME] = names.intern(p.name)
+        return tuple(values)
+    docs = [(names.intern(c.name), c.state_abbr, c.state_name, c.budget,
+             [row(p) for p in c.squad], [row(p) for p in c.youth]) for c in clubs]
+    return marshal.dumps((SNAPSHOT_VERSION, FIELDS, names.names, len(clubs.players), docs))
+
+def load_universe_bytes(data: bytes) -> Universe:
+    version, fields_, names, next_player_id, docs = marshal.loads(data)
+    if version != SNAPSHOT_VERSION or tuple(fields_) != FIELDS:
+        raise ValueError("snapshot de outra versão")
+
+    def player(r) -> Player:
+        p = Player(*r)
+        p.name = names[p.name]
+        return p
+    return Universe([Club(names[n], abbr, state, budget, [player(r) for r in squad], [player(r) for r in youth])
+                     for n, abbr, state, budget, squad, youth in docs], next_player_id)
+
+def bucket_of(seed: int) -> int:
+    """Balde do universo de uma carreira; a seed dela segue inteira para os
+    estaduais e sorteios."""
+    return (seed - 1) % BUCKETS + 1
+
+def load_universe(seed: int, clubs_per_state: int = 6, root: str = SNAPSHOT_DIR) -> Universe:
+    """Universo de `seed`. Seeds de 1 a `BUCKETS` vêm do cache em disco
+    (gerado e gravado na primeira vez); os demais são gerados na hora."""
+    from .data import generate_universe
+    if not 1 <= seed <= BUCKETS:
+        return generate_universe(seed, clubs_per_state)
+    path = snapshot_path(seed, clubs_per_state, root)
+    try:
+        with open(path, "rb") as f:
+            return load_universe_bytes(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        pass  # sem cache (ou de outra versão): gera e regrava
+    clubs = generate_universe(seed, clubs_per_state)
+    os.makedirs(root, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(dump_universe(clubs))
+    os.replace(tmp, path)  # vários processos podem gerar o mesmo balde
+    return clubs
+
+def warm(clubs_per_state: int = 6, root: str = SNAPSHOT_DIR) -> int:
+    for seed in range(1, BUCKETS + 1):
+        load_universe(seed, clubs_per_state, root)
+    return BUCKETS
+
+# --- benchmark de partida a frio ---
+
+_STARTUP = """
+import importlib, time; t0 = time.perf_counter()
+cli = importlib.import_module({pkg!r} + ".cli")
+data = importlib.import_module({pkg!r} + ".data")
+clubs = {load}
+mine = [c for c in clubs if c.state_abbr == "SP"]
+cli.start_career(clubs, "Bench", mine[0], {seed})
+{save}
+print(time.perf_counter() - t0)
+"""
+
+def _run(code: str) -> float:
+    # a pasta acima do pacote: o nome do pacote é o da pasta (`__package__`)
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, env=env, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+def bench(clubs_per_state: int = 6, seed: int = 1) -> List[tuple]:
+    """Do início do interpretador até o menu: gerar+gravar (antigo),
+    snapshot a frio (gera e guarda) e snapshot em cache."""
+    root = tempfile.mkdtemp(prefix="fw-snap-")
+    legacy = _STARTUP.format(load=f"data.generate_universe({seed}, {clubs_per_state})", seed=seed, pkg=__package__,
+                             save=f"cli.save_game({os.path.join(root, 'career.save')!r}, clubs, {{}}, None)")
+    snap = _STARTUP.format(load=f"importlib.import_module({__package__ + '.snapshots'!r})"
+                                f".load_universe({seed}, {clubs_per_state}, {root!r})", seed=seed,
+                           pkg=__package__, save="")
+    return [("gerar + gravar save", _run(legacy)), ("snapshot (1ª vez)", _run(snap)),
+            ("snapshot (cache)", _run(snap))]
+
+def main(argv: List[str] | None = None):
+    ap = argparse.ArgumentParser(description="Universos pré-gerados")
+    ap.add_argument("cmd", choices=["warm", "bench"])
+    ap.add_argument("--clubs", type=int, default=6, help="clubes por estado")
+    ap.add_argument("--root", default=SNAPSHOT_DIR)
+    args = ap.parse_args(argv)
+    if args.cmd == "warm":
+        t0 = time.perf_counter()
+        n = warm(args.clubs, args.root)
+        print(f"{n} universos em {args.root} ({time.perf_counter() - t0:.1f}s)")
+    else:
+        for label, dt in bench(args.clubs):
+            print(f"{label:22s} {dt * 1000:8.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Hashable, List, Set, Tuple
+
+FORM_LEN = 5
+
+def scope_of(club) -> str:
+    """Estado do clube (UF)."""
+    return club.state_abbr
+
+class Leaderboard:
+    """Ranking de contadores que só crescem de 1 em 1.
+
+    Cada valor guarda o conjunto de chaves que o atingiram; incrementar
+    move a chave para o balde seguinte em O(1) e `top(k)` desce do maior
+    balde até juntar `k` chaves, sem varrer quem está abaixo.
+    """
+    __slots__ = ("value", "buckets", "max")
+
+    def __init__(self):
+        self.value: Dict[Hashable, int] = {}
+        self.buckets: Dict[int, Dict[Hashable, None]] = {}
+        self.max = 0
+
+    def incr(self, key: Hashable):
+        v = self.value.get(key, 0)
+        if v:
+            del self.buckets[v][key]
+        v += 1
+        self.value[key] = v
+        # dict preserva a ordem: empates ficam com quem chegou antes
+        self.buckets.setdefault(v, {})[key] = None
+        if v > self.max:
+            self.max = v
+
+    def top(self, k: int) -> List[Tuple[Hashable, int]]:
+        out: List[Tuple[Hashable, int]] = []
+        v = self.max
+        while v > 0 and len(out) < k:
+            for key in self.buckets.get(v, ()):
+                out.append((key, v))
+                if len(out) == k:
+                    break
+            v -= 1
+        return out
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+@dataclass
+class PlayerStats:
+    player: Any = field(repr=False)
+    club: Any = field(repr=False)
+    goals: int = 0
+    yellow: int = 0
+    red: int = 0
+    injuries: int = 0
+
+@dataclass
+class ClubStats:
+    club: Any = field(repr=False)
+    played: int = 0
+    home: List[int] = field(default_factory=lambda: [0, 0, 0, 0, 0])  # V E D GP GC
+    away: List[int] = field(default_factory=lambda: [0, 0, 0, 0, 0])
+    yellow: int = 0
+    red: int = 0
+    injuries: int = 0
+    form: Deque[str] = field(default_factory=lambda: deque(maxlen=FORM_LEN))
+
+    def form_str(self) -> str:
+        return "".join(self.form)
+
+# tipo de lance -> estatística
+EVENT_STAT = {
+    "Gol": "goals",
+    "Cartão amarelo": "yellow",
+    "Cartão vermelho": "red",
+    "Lesão leve": "injuries",
+    "Lesão grave": "injuries",
+}
+PLAYER_STATS = ("goals", "yellow", "red", "injuries")
+NATIONAL = "BR"
+
+class StatsEngine:
+    """Agregados da temporada alimentados partida a partida.
+
+    O motor de partidas chama `on_event` a cada lance e `on_result` no
+    apito final. Cada lance atualiza o jogador, o clube e os rankings do
+    estado e nacional; consultar o top-k custa O(k).
+    """
+    def __init__(self):
+        self.players: Dict[int, PlayerStats] = {}
+        self.clubs: Dict[int, ClubStats] = {}
+        # (estatística, escopo) -> ranking de id(jogador)
+        self.boards: Dict[Tuple[str, str], Leaderboard] = {}
+        self.scopes: Set[str] = {NATIONAL}
+
+    def _board(self, stat: str, scope: str) -> Leaderboard:
+        board = self.boards.get((stat, scope))
+        if board is None:
+            board = self.boards[(stat, scope)] = Leaderboard()
+        return board
+
+    def club(self, club) -> ClubStats:
+        cs = self.clubs.get(id(club))
+        if cs is None:
+            cs = self.clubs[id(club)] = ClubStats(club)
+        return cs
+
+    def player(self, player) -> PlayerStats | None:
+        return self.players.get(id(player))
+
+    def on_event(self, club, player, kind: str):
+        stat = EVENT_STAT.get(kind)
+        if stat is None:
+            return
+        ps = self.players.get(id(player))
+        if ps is None:
+            ps = self.players[id(player)] = PlayerStats(player, club)
+        ps.club = club
+        setattr(ps, stat, getattr(ps, stat) + 1)
+        if stat != "goals":
+            cs = self.club(club)
+            setattr(cs, stat, getattr(cs, stat) + 1)
+        scope = scope_of(club)
+        self.scopes.add(scope)
+        self._board(stat, scope).incr(id(player))
+        self._board(stat, NATIONAL).incr(id(player))
+
+    def on_result(self, home, away, goals_home: int, goals_away: int):
+        for club, split, gf, ga in ((home, "home", goals_home, goals_away),
+                                    (away, "away", goals_away, goals_home)):
+            cs = self.club(club)
+            row = getattr(cs, split)
+            cs.played += 1
+            if gf > ga:
+                row[0] += 1; cs.form.append("V")
+            elif gf == ga:
+                row[1] += 1; cs.form.append("E")
+            else:
+                row[2] += 1; cs.form.append("D")
+            row[3] += gf
+            row[4] += ga
+
+    def top(self, stat: str = "goals", k: int = 10, scope: str = NATIONAL) -> List[Tuple[PlayerStats, int]]:
+        """Top-k de uma estatística de jogador (`PLAYER_STATS`) no estado ou no país."""
+        board = self.boards.get((stat, scope))
+        if board is None:
+            return []
+        return [(self.players[key], v) for key, v in board.top(k)]
+
+    def form(self, club) -> str:
+        cs = self.clubs.get(id(club))
+        return cs.form_str() if cs else ""
@@ -0,0 +1,130 @@
+"""
+Desfalques por calendário.
+
+Lesões e suspensões ganham a semana de volta no momento em que acontecem
+(a duração é sorteada uma única vez) e entram num heap por semana. A
+virada da semana só desempilha quem volta, então o custo é proporcional
+aos retornos e não ao número de jogadores: todos os clubes do universo
+podem ter desfalques, inclusive nos jogos de fundo (`background`).
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, Tuple
+import heapq, random
+
+from .lineup import CARD_PRONE, INJURY_PRONE, INVOLVEMENT, lineup_of
+from .sim import OTHER_EVENT_WEIGHTS, OTHER_EVENTS_PER_MATCH
+
+if TYPE_CHECKING:
+    from .ids import Universe
+    from .models import Club, Player
+
+# semanas fora por lesão: (probabilidade, mínimo, máximo)
+INJURY_WEEKS = ((0.6, 1, 2), (0.3, 3, 6), (0.1, 8, 20))
+
+def _per_side(kind: str) -> float:
+    """Chance por clube e por partida de um lance, igual à do jogo ao vivo."""
+    return OTHER_EVENTS_PER_MATCH * OTHER_EVENT_WEIGHTS[kind] / sum(OTHER_EVENT_WEIGHTS.values()) / 2
+
+INJURY_RATE = _per_side("Lesão grave")
+RED_CARD_RATE = _per_side("Cartão vermelho")
+
+# maior peso de envolvimento de cada papel (para o sorteio por rejeição)
+TOP_WEIGHT = {"injury": max(1.0, *INJURY_PRONE.values()), "card": max(1.0, *CARD_PRONE.values())}
+
+def _pick(club: Club, role: str, rng) -> Player:
+    """Titular sorteado pelo peso de `role`, sem montar tabela de alias
+    (nos jogos de fundo cada escalação sorteia um ou dois lances). Usa os
+    titulares como estão, sem refazer a escalação."""
+    xi = lineup_of(club).starters() or club.squad
+    weight, top = INVOLVEMENT[role], TOP_WEIGHT[role]
+    while True:
+        p = xi[int(rng.random() * len(xi))]
+        if rng.random() * top < weight(p):
+            return p
+
+def injury_weeks(rng) -> int:
+    roll = rng.random()
+    for chance, lo, hi in INJURY_WEEKS:
+        if roll < chance:
+            return rng.randint(lo, hi)
+        roll -= chance
+    return INJURY_WEEKS[-1][2]
+
+class StatusCalendar:
+    """Semana corrente de um universo e os retornos agendados.
+
+    `Player.back_week` guarda a semana em que o jogador volta (vai no save
+    com ele); o heap tem (semana, id do jogador, id do clube). Quem é
+    reagendado deixa a entrada antiga, descartada ao sair do heap.
+    """
+    def __init__(self, universe: Universe, week: int = 0):
+        self.universe = universe
+        self.week = week
+        self._heap: List[Tuple[int, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def rebuild(self):
+        """Remonta o heap a partir dos jogadores (ex.: ao carregar um save)."""
+        heap = self._heap = []
+        for c in self.universe:
+            for p in c.squad:
+                if p.injured or p.suspended:
+                    if p.back_week <= self.week:  # save antigo: sem semana de volta
+                        p.back_week = self.week + 1 + max(1, p.suspended)
+                    heap.append((p.back_week, p.id, c.id))
+        heapq.heapify(heap)
+
+    def _schedule(self, club: Club, p: Player, weeks: int):
+        """Fora das próximas `weeks` semanas (a atual não conta)."""
+        back = self.week + 1 + weeks
+        if back > p.back_week:
+            p.back_week = back
+            heapq.heappush(self._heap, (back, p.id, club.id))
+
+    def injure(self, club: Club, p: Player, rng=None, weeks: int | None = None) -> int:
+        """Lesiona e agenda a volta; sem `weeks`, sorteia a duração."""
+        lineup_of(club).injure(p)
+        weeks = injury_weeks(rng or random) if weeks is None else weeks
+        self._schedule(club, p, weeks)
+        return weeks
+
+    def suspend(self, club: Club, p: Player, games: int = 1):
+        """Expulsão (ou convocação): fora de campo e dos próximos `games` jogos."""
+        lineup_of(club).send_off(p, games)
+        self._schedule(club, p, games)
+
+    def background(self, home: Club, away: Club, rng):
+        """Lesões e expulsões de um jogo simulado só pelo placar."""
+        for club in (home, away):
+            if not club.squad:
+                continue
+            if rng.random() < INJURY_RATE:
+                self.injure(club, _pick(club, "injury", rng), rng)
+            if rng.random() < RED_CARD_RATE:
+                self.suspend(club, _pick(club, "card", rng))
+
+    def advance(self) -> List[Player]:
+        """Vira a semana e devolve os jogadores que voltaram."""
+        self.week += 1
+        heap, players, back = self._heap, self.universe.players, []
+        while heap and heap[0][0] <= self.week:
+            week, pid, cid = heapq.heappop(heap)
+            p = players[pid] if pid < len(players) else None
+            if p is None or p.back_week != week:
+                continue  # aposentado/dispensado ou reagendado
+            club = self._club_of(p, cid)
+            if club is not None:
+                lineup_of(club).recover(p)
+            else:
+                p.injured, p.suspended = False, 0
+            back.append(p)
+        return back
+
+    def _club_of(self, p: Player, cid: int) -> Club | None:
+        clubs = self.universe
+        if cid < len(clubs) and any(q is p for q in clubs[cid].squad):
+            return clubs[cid]
+        # transferido (ou promovido) desde que saiu
+        return next((c for c in clubs if any(q is p for q in c.squad)), None)
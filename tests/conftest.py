@@ -0,0 +1,14 @@
+"""Os testes importam o pacote como `football_world`, qualquer que seja o
+nome da pasta do checkout (no CI é o nome do repositório, com hífens)."""
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if "football_world" not in sys.modules:
+    spec = importlib.util.spec_from_file_location("football_world", os.path.join(ROOT, "__init__.py"),
+                                                  submodule_search_locations=[ROOT])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["football_world"] = module
+    spec.loader.exec_module(module)
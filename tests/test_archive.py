@@ -0,0 +1,66 @@
+"""Arquivo de resultados: ida e volta, registro final cortado e cabeçalho."""
+import random
+
+import pytest
+
+from football_world.archive import HEADER, MAGIC, RECORD_SIZE, VERSION, ArchiveReader, ArchiveWriter
+from football_world.data import generate_universe
+from football_world.sim import MatchEngine
+
+def _matches(n: int):
+    clubs = generate_universe(5, clubs_per_state=2)
+    engine = MatchEngine(random.Random(5))
+    out = []
+    for i in range(n):
+        match = engine.live(clubs[2 * i], clubs[2 * i + 1])
+        for _ in match:
+            pass
+        out.append(match.finish())
+    return out
+
+def _write(path, results, week: int = 1):
+    with ArchiveWriter(path) as w:
+        for r in results:
+            w.append(1, week, r.home, r.away, r)
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "results.bin")
+    results = _matches(4)
+    _write(path, results)
+    with ArchiveReader(path) as r:
+        got = list(r)
+    assert [(m.home, m.away, m.goals_home, m.goals_away) for m in got] == \
+           [(r.home, r.away, r.goals_home, r.goals_away) for r in results]
+    assert [[(e[0], e[2]) for e in m.events] for m in got] == \
+           [[(ev.minute, ev.kind) for ev in r.timeline[:len(m.events)]] for m, r in zip(got, results)]
+
+def test_partial_record_is_cut_on_open(tmp_path):
+    path = str(tmp_path / "results.bin")
+    results = _matches(3)
+    _write(path, results[:2], week=1)
+    with open(path, "ab") as f:
+        f.write(b"\x07" * (RECORD_SIZE // 2))  # queda no meio de um registro
+    _write(path, results[2:], week=9)
+    with ArchiveReader(path) as r:
+        assert [m.week for m in r] == [1, 1, 9]
+
+def test_interrupted_header_starts_over(tmp_path):
+    path = tmp_path / "results.bin"
+    path.write_bytes(HEADER.pack(MAGIC, VERSION, RECORD_SIZE)[:6])
+    _write(str(path), _matches(1))
+    with ArchiveReader(str(path)) as r:
+        assert len(r) == 1
+
+@pytest.mark.parametrize("head", [
+    b"XXXX" + HEADER.pack(MAGIC, VERSION, RECORD_SIZE)[4:],  # outro arquivo
+    HEADER.pack(MAGIC, VERSION + 1, RECORD_SIZE),             # outra versão
+    HEADER.pack(MAGIC, VERSION, RECORD_SIZE + 4),             # outro registro
+])
+def test_foreign_header_is_rejected(tmp_path, head):
+    path = tmp_path / "results.bin"
+    path.write_bytes(head + b"\0" * RECORD_SIZE)
+    with pytest.raises(ValueError):
+        ArchiveWriter(str(path))
+    with pytest.raises(ValueError):
+        ArchiveReader(str(path))
+    assert path.read_bytes() == head + b"\0" * RECORD_SIZE  # nada foi cortado
@@ -0,0 +1,32 @@
+"""Fotografias: ramos e desfazer refazem exatamente o mundo fotografado."""
+from football_world.branches import Branch, History, freeze, sign_best
+from football_world.cli import start_career
+from football_world.data import generate_universe
+from football_world.season import play_week
+
+def _career(weeks: int = 2):
+    clubs = generate_universe(2, clubs_per_state=2)
+    clubs, meta, league = start_career(clubs, "Teste", clubs[0], 2)
+    for _ in range(weeks):
+        play_week(clubs, meta, league)
+    return clubs, meta, league
+
+def test_undo_then_replay_matches_original():
+    clubs, meta, league = _career()
+    history = History()
+    history.checkpoint(clubs, meta, league)
+    play_week(clubs, meta, league)
+    after = history.checkpoint(clubs, meta, league)
+
+    c2, m2, l2 = history.undo()
+    play_week(c2, m2, l2)
+    assert freeze(c2, m2, l2) == after
+    assert [c2.ledger.statement(c) for c in c2] == [clubs.ledger.statement(c) for c in clubs]
+
+def test_branch_follows_the_original():
+    clubs, meta, league = _career()
+    branch = Branch(freeze(clubs, meta, league))
+    for world in ((clubs, meta, league), branch.world):
+        sign_best(*world)
+        play_week(*world)
+    assert branch.commit() == freeze(clubs, meta, league)
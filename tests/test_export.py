@@ -0,0 +1,60 @@
+"""Exportação em tabelas e o caminho de volta."""
+import csv
+
+import pytest
+
+from football_world.archive import ArchiveReader, ArchiveWriter
+from football_world.cli import start_career
+from football_world.data import generate_universe
+from football_world.export import export_tables, import_tables
+from football_world.persistence import load_game
+from football_world.season import play_week
+
+def _players(clubs):
+    return [(c.id, group, p.id, p.name, p.age, p.overall(), p.potential, p.injured, p.loan_weeks)
+            for c in clubs for group in ("squad", "youth") for p in getattr(c, group)]
+
+@pytest.fixture
+def career(tmp_path):
+    clubs = generate_universe(4, clubs_per_state=2)
+    clubs, meta, league = start_career(clubs, "Teste", clubs[0], 4)
+    archive = str(tmp_path / "results.bin")
+    with ArchiveWriter(archive) as w:
+        for _ in range(2):
+            play_week(clubs, meta, league, archive=w)
+    return clubs, meta, league, archive
+
+@pytest.mark.parametrize("fmt", ["csv", "tsv"])
+def test_round_trip(tmp_path, career, fmt):
+    clubs, meta, league, archive = career
+    root = str(tmp_path / "tables")
+    counts = export_tables(clubs, meta, root, league, archive, fmt)
+    assert counts["clubs"] == len(clubs)
+    save, archive2 = str(tmp_path / "back.save"), str(tmp_path / "back.bin")
+    assert import_tables(root, save, archive2)["results"] == counts["results"]
+
+    c2, m2, l2 = load_game(save)
+    assert m2 == meta
+    assert _players(c2) == _players(clubs)
+    assert [(c.name, c.points, c.goals_for, c.elo) for c in c2] == [(c.name, c.points, c.goals_for, c.elo) for c in clubs]
+    assert (l2.current_week, l2.fixtures) == (league.current_week, league.fixtures)
+    with ArchiveReader(archive) as a, ArchiveReader(archive2) as b:
+        assert list(a) == list(b)
+
+def test_columns_are_read_by_header(tmp_path, career):
+    clubs, meta, league, _ = career
+    root = tmp_path / "tables"
+    export_tables(clubs, meta, str(root), league)
+    # tabela de outra versão: colunas em outra ordem e sem `loan_weeks`
+    path = root / "players.csv"
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    drop = rows[0].index("loan_weeks")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows([(r[:drop] + r[drop + 1:])[::-1] for r in rows])
+
+    save = str(tmp_path / "back.save")
+    import_tables(str(root), save)
+    c2, _, _ = load_game(save)
+    assert [row[:-1] for row in _players(c2)] == [row[:-1] for row in _players(clubs)]
+    assert all(p.loan_weeks == 0 for c in c2 for p in c.squad + c.youth)
@@ -0,0 +1,8 @@
+"""Referências douradas: todas as etapas, impressão digital exata."""
+from football_world import golden
+
+def test_all_stages_match_golden():
+    # orçamentos de tempo folgados: a máquina de CI não é a que gravou as referências
+    verdicts = golden.check(list(golden.STAGES), budget_scale=10.0)
+    assert [v.stage for v in verdicts] == list(golden.STAGES)
+    assert {v.stage: v.failures for v in verdicts if not v.ok} == {}
@@ -0,0 +1,101 @@
+"""Saves em blocos: leitura que pula trechos danificados, `.bak` e seed."""
+import pytest
+
+from football_world import persistence
+from football_world.cli import start_career
+from football_world.data import generate_universe
+from football_world.persistence import CHUNK, MAGIC, MARK, CorruptSave, load_game, read_save, save_game
+from football_world.season import play_week
+
+SEED = 3
+
+def _career():
+    clubs = generate_universe(SEED, clubs_per_state=2)
+    return start_career(clubs, "Teste", clubs[0], SEED)
+
+def _chunk_at(buf: bytes, kind: bytes, index: int) -> int:
+    pos = len(MAGIC)
+    while True:
+        pos = buf.find(MARK, pos)
+        assert pos >= 0, f"bloco {kind!r} {index} não encontrado"
+        _, k, i, _, _ = CHUNK.unpack_from(buf, pos)
+        if k == kind and i == index:
+            return pos
+        pos += 1
+
+def _damage_club(path, index: int, offset: int = CHUNK.size + 5):
+    """Estraga um byte do bloco do clube `index` (por padrão, no conteúdo)."""
+    with open(path, "rb") as f:
+        buf = bytearray(f.read())
+    buf[_chunk_at(buf, b"C", index) + offset] ^= 0xFF
+    with open(path, "wb") as f:
+        f.write(buf)
+
+def _ids(clubs):
+    return [p.id for c in clubs for p in c.squad + c.youth]
+
+def _state(clubs):
+    return ([(c.points, c.goals_for, c.budget, clubs.ledger.statement(c)) for c in clubs],
+            [(p.id, p.name, p.overall(), p.potential) for c in clubs for p in c.squad + c.youth])
+
+def test_round_trip(tmp_path):
+    clubs, meta, league = _career()
+    for _ in range(3):
+        play_week(clubs, meta, league)
+    path = str(tmp_path / "career.save")
+    save_game(path, clubs, meta, league)
+    c2, m2, l2 = load_game(path)
+    assert m2 == meta
+    assert (l2.current_week, l2.fixtures) == (league.current_week, league.fixtures)
+    assert _state(c2) == _state(clubs)
+    # a carreira segue igual depois de carregar (finanças inclusive)
+    for _ in range(3):
+        play_week(clubs, meta, league)
+        play_week(c2, m2, l2)
+    assert _state(c2) == _state(clubs)
+
+def test_damaged_chunk_only_loses_that_club(tmp_path):
+    clubs, meta, league = _career()
+    path = str(tmp_path / "career.save")
+    save_game(path, clubs, meta, league)
+    # tamanho do bloco corrompido: a leitura tem de achar a próxima marca sozinha
+    _damage_club(path, 3, offset=CHUNK.size - 9)
+    with pytest.raises(CorruptSave) as err:
+        read_save(path)
+    assert err.value.lost == [3]
+    data = err.value.data
+    assert all(c is not None for i, c in enumerate(data["clubs"]) if i != 3)
+
+def test_backup_restores_club_without_duplicates(tmp_path):
+    clubs, meta, league = _career()
+    path = str(tmp_path / "career.save")
+    save_game(path, clubs, meta, league)
+    moved = clubs[0].squad[0]
+    clubs[0].squad.remove(moved)  # sai do clube 0 depois do backup
+    clubs[1].squad.append(moved)
+    expected = [p.name for p in clubs[0].squad]
+    save_game(path, clubs, meta, league)
+    _damage_club(path, 0)
+
+    data = read_save(path)
+    assert data["recovered"] == [0]
+    c2, _, _ = persistence.universe_from_save(data)
+    assert c2[0].name == clubs[0].name
+    assert [p.name for p in c2[0].squad] == expected  # nomes pela tabela certa
+    assert any(p.id == moved.id for p in c2[1].squad)
+    ids = _ids(c2)
+    assert len(ids) == len(set(ids))
+
+def test_lost_club_rebuilt_from_seed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # os universos de `snapshots` vão para saves/snapshots
+    clubs, meta, league = _career()
+    fresh = generate_universe(SEED, clubs_per_state=2)
+    path = str(tmp_path / "career.save")
+    save_game(path, clubs, meta, league)
+    _damage_club(path, 2)
+    with pytest.raises(CorruptSave):
+        load_game(path)
+    c2, _, _ = load_game(path, rebuild=True)
+    assert [p.name for p in c2[2].squad] == [p.name for p in fresh[2].squad]
+    ids = _ids(c2)
+    assert len(ids) == len(set(ids))
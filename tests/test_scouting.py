@@ -0,0 +1,61 @@
+"""Olheiro: nome por prefixo ou aproximado, filtros e índice em dia."""
+import random
+
+import pytest
+
+from football_world.data import generate_universe, random_player
+from football_world.models import make_player
+from football_world.scouting import PREFIX_SCORE, ScoutIndex, normalize
+from football_world.transfers import transfer
+
+@pytest.fixture
+def universe():
+    return generate_universe(6, clubs_per_state=2)
+
+def _found(hits, player) -> bool:
+    return any(h.player is player for h in hits)
+
+def test_prefix_of_each_word(universe):
+    index = ScoutIndex(universe)
+    target = universe[5].squad[3]
+    query = " ".join(w[:3] for w in target.name.split())
+    hits = index.search(query, limit=10_000)
+    assert _found(hits, target)
+    assert all(h.score >= PREFIX_SCORE for h in hits)
+    assert all(all(any(w.startswith(q) for w in normalize(h.player.name).split())
+                   for q in normalize(query).split()) for h in hits)
+
+def test_misspelled_name(universe):
+    index = ScoutIndex(universe)
+    target = universe[7].squad[0]
+    first, last = target.name.split()[:2]
+    typo = f"{first} {last[0]}{last[2:]}"  # uma letra a menos
+    assert _found(index.search(typo, limit=10_000), target)
+
+def test_filters(universe):
+    index = ScoutIndex(universe)
+    hits = index.search(min_overall=55, max_age=25, state="SP", limit=50)
+    assert hits
+    assert all(h.player.overall() >= 55 and h.player.age <= 25 and h.club.state_abbr == "SP" for h in hits)
+    assert not any(h.youth for h in hits)
+    assert [h.player.overall() for h in hits] == sorted((h.player.overall() for h in hits), reverse=True)
+    youth = universe[0].youth[0]
+    assert not _found(index.search(youth.name, limit=10_000), youth)
+    assert _found(index.search(youth.name, limit=10_000, youth=True), youth)
+
+def test_follows_the_universe(universe):
+    index = ScoutIndex(universe)
+    moved, seller, buyer = universe[0].squad[0], universe[0], universe[9]
+    buyer.budget = 10**9
+    transfer(moved, seller, buyer)
+    assert any(h.player is moved and h.club is buyer for h in index.search(moved.name, limit=10_000))
+
+    rookie = make_player(random_player(random.Random(1), 18, 19, 50, 60))
+    rookie.name = "Zeferino Quaresma"
+    universe.add(rookie)
+    universe[3].squad.append(rookie)
+    assert [h.player for h in index.search("zefe quar")] == [rookie]
+
+    universe[3].squad.remove(rookie)
+    universe.release(rookie)
+    assert index.search("zefe quar") == []
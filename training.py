@@ -0,0 +1,59 @@
+from __future__ import annotations
+from typing import Iterable, List, Sequence
+import random
+
+FOCUSES = ("strength", "technique", "speed", "morale")
+
+# Personalidades com efeito mecânico no treino
+LAZY = "Preguiçoso"          # perde moral em treinos físicos/técnicos
+CHARISMATIC = "Carismático"  # ganha moral extra em treinos de moral
+
+_GAIN = (1, 2, 3)
+_MORALE_GAIN = (1, 2)
+_LAZY_LOSS = (0, 1, 2)
+
+def train_squad(players: Iterable, focus: str, rng=None) -> int:
+    """Treina um grupo de jogadores numa única passada.
+
+    Os ganhos de todo o grupo são sorteados de uma vez (`rng.choices`),
+    lesionados são ignorados e os atributos ficam em 0–100. Funciona com
+    qualquer jogador que tenha strength/technique/speed/morale/personality.
+    Retorna quantos jogadores treinaram.
+    """
+    if focus not in FOCUSES:
+        return 0
+    rng = rng or random
+    active = [p for p in players if not getattr(p, "injured", False)]
+    if not active:
+        return 0
+
+    gains = rng.choices(_MORALE_GAIN if focus == "morale" else _GAIN, k=len(active))
+    for p, g in zip(active, gains):
+        v = getattr(p, focus) + g
+        setattr(p, focus, 100 if v > 100 else v)
+
+    if focus == "morale":
+        mod = [p for p in active if p.personality == CHARISMATIC]
+        deltas = rng.choices(_MORALE_GAIN, k=len(mod))
+    else:
+        mod = [p for p in active if p.personality == LAZY]
+        deltas = [-d for d in rng.choices(_LAZY_LOSS, k=len(mod))]
+    for p, d in zip(mod, deltas):
+        p.morale = max(0, min(100, p.morale + d))
+    return len(active)
+
+def train_rosters(rosters: Sequence[List], rng=None, share: float = 1 / 3) -> int:
+    """Treino semanal dos clubes controlados pela IA.
+
+    Cada elenco recebe um foco sorteado e `share` dos jogadores treina.
+    Os jogadores são agrupados por foco e cada grupo é treinado num único
+    `train_squad`: são só quatro chamadas por semana, mas o custo continua
+    linear no número de jogadores treinados.
+    """
+    rng = rng or random
+    by_focus = {f: [] for f in FOCUSES}
+    foci = rng.choices(FOCUSES, k=len(rosters))
+    for roster, focus in zip(rosters, foci):
+        n = max(1, int(len(roster) * share)) if roster else 0
+        by_focus[focus].extend(rng.sample(roster, n) if n < len(roster) else roster)
+    return sum(train_squad(group, focus, rng) for focus, group in by_focus.items() if group)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+from typing import List, Tuple
+
+from .models import Club, Player
+from .lineup import lineup_of
+
+VALUE_PER_OVERALL = 100_000  # R$ por ponto de overall
+LOYALTY_ON_MOVE = 60         # fidelidade de quem acaba de chegar
+
+def market_value(p: Player) -> int:
+    return p.overall() * VALUE_PER_OVERALL
+
+def asking_price(p: Player) -> int:
+    """Preço pedido pelo clube: jogador fiel custa até 50% a mais, quem
+    quer sair sai por até metade do valor."""
+    return round(market_value(p) * (0.5 + p.loyalty / 100))
+
+def listed(clubs: List[Club], buyer: Club) -> List[Tuple[Club, Player]]:
+    """Jogadores profissionais dos outros clubes, como (clube, jogador)."""
+    return [(c, p) for c in clubs if c is not buyer for p in c.squad]
+
+def transfer(player: Player, seller: Club, buyer: Club, price: int | None = None) -> int:
+    """Compra `player` de `seller` e o põe no elenco de `buyer`.
+
+    Sem `price`, paga `asking_price`. Levanta ValueError se o jogador não
+    está no elenco do vendedor ou se falta orçamento. Retorna o valor pago.
+    """
+    if not any(p is player for p in seller.squad):
+        raise ValueError(f"{player.name} não está no elenco de {seller.name}")
+    price = asking_price(player) if price is None else price
+    if buyer.budget < price:
+        raise ValueError(f"orçamento insuficiente (R$ {buyer.budget:,} < R$ {price:,})")
+    buyer.budget -= price
+    seller.budget += price
+    seller.squad = [p for p in seller.squad if p is not player]
+    buyer.squad.append(player)
+    player.loyalty = LOYALTY_ON_MOVE
+    lineup_of(buyer).invalidate()
+    return price